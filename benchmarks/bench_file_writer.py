@@ -0,0 +1,123 @@
+"""
+Benchmark de escritura de archivos de proceso.
+Compara `escribir_caracter` (abrir, escribir y cerrar por carácter) con
+`EscritorProceso` (archivo abierto y búfer con vaciado por tamaño/tiempo)
+y `EscritorMapeado` (archivo preasignado y proyectado en memoria) copiando
+la misma descripción carácter a carácter.
+
+Se cuentan las aperturas de archivo y las llamadas de escritura que llegan
+al sistema operativo, además del tiempo transcurrido.
+
+Uso:
+    python benchmarks/bench_file_writer.py [--caracteres N] [--procesos P]
+"""
+
+import argparse
+import builtins
+import os
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from desktop_app import file_writer
+from desktop_app.file_writer import EscritorMapeado, EscritorProceso, GestorEscritores, escribir_caracter
+
+
+def medir_escribir_caracter(directorio, descripcion, procesos):
+    """Copia con escribir_caracter contando cada apertura (una escritura por apertura)."""
+    aperturas = 0
+    abrir_original = builtins.open
+
+    def abrir_contando(*args, **kwargs):
+        nonlocal aperturas
+        aperturas += 1
+        return abrir_original(*args, **kwargs)
+
+    file_writer.open = abrir_contando
+    try:
+        inicio = time.perf_counter()
+        for p in range(procesos):
+            archivo = os.path.join(directorio, f"antiguo_{p}.txt")
+            for caracter in descripcion:
+                escribir_caracter(archivo, caracter)
+        transcurrido = time.perf_counter() - inicio
+    finally:
+        del file_writer.open
+    return aperturas, aperturas, transcurrido
+
+
+def medir_escritor(directorio, descripcion, procesos, tam_buffer):
+    """Copia con un EscritorProceso por proceso."""
+    aperturas = escrituras = 0
+    inicio = time.perf_counter()
+    for p in range(procesos):
+        with EscritorProceso(os.path.join(directorio, f"nuevo_{p}.txt"), tam_buffer) as escritor:
+            for caracter in descripcion:
+                escritor.escribir(caracter)
+        aperturas += escritor.aperturas
+        escrituras += escritor.escrituras
+    return aperturas, escrituras, time.perf_counter() - inicio
+
+
+def medir_mapeado(directorio, descripcion, procesos):
+    """Copia con un EscritorMapeado por proceso (una apertura, ninguna escritura)."""
+    inicio = time.perf_counter()
+    for p in range(procesos):
+        archivo = os.path.join(directorio, f"mapeado_{p}.txt")
+        with open(archivo, "wb") as f:
+            f.truncate(len(descripcion.encode("utf-8")))
+        with EscritorMapeado(archivo, descripcion) as escritor:
+            for indice in range(len(descripcion)):
+                escritor.copiar(indice)
+    return procesos, 0, time.perf_counter() - inicio
+
+
+def medir_gestor(directorio, descripcion, procesos, tam_buffer):
+    """Copia intercalando procesos (como el planificador) con un GestorEscritores."""
+    gestor = GestorEscritores(max_abiertos=64, tam_buffer=tam_buffer)
+    archivos = [os.path.join(directorio, f"gestor_{p}.txt") for p in range(procesos)]
+    inicio = time.perf_counter()
+    for caracter in descripcion:
+        for archivo in archivos:
+            gestor.escribir(archivo, caracter)
+    escritores = list(gestor._escritores.values())
+    gestor.cerrar_todos()
+    transcurrido = time.perf_counter() - inicio
+    return (sum(e.aperturas for e in escritores), sum(e.escrituras for e in escritores), transcurrido)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--caracteres", type=int, default=10000, help="longitud de la descripción")
+    parser.add_argument("--procesos", type=int, default=10, help="número de procesos")
+    parser.add_argument("--buffer", type=int, default=4096, help="tamaño de búfer en bytes")
+    args = parser.parse_args()
+
+    descripcion = "abcdefghij" * (args.caracteres // 10)
+    with tempfile.TemporaryDirectory() as directorio:
+        filas = [
+            ("escribir_caracter", medir_escribir_caracter(directorio, descripcion, args.procesos)),
+            ("EscritorProceso", medir_escritor(directorio, descripcion, args.procesos, args.buffer)),
+            ("GestorEscritores", medir_gestor(directorio, descripcion, args.procesos, args.buffer)),
+            ("EscritorMapeado", medir_mapeado(directorio, descripcion, args.procesos)),
+        ]
+        for p in range(args.procesos):
+            with open(os.path.join(directorio, f"antiguo_{p}.txt")) as a, \
+                 open(os.path.join(directorio, f"nuevo_{p}.txt")) as b, \
+                 open(os.path.join(directorio, f"gestor_{p}.txt")) as c, \
+                 open(os.path.join(directorio, f"mapeado_{p}.txt")) as d:
+                assert a.read() == b.read() == c.read() == d.read() == descripcion
+
+    print(f"{args.procesos} procesos × {len(descripcion)} caracteres, búfer de {args.buffer} bytes")
+    print(f"{'método':<20}{'aperturas':>12}{'escrituras':>12}{'tiempo (s)':>12}")
+    for nombre, (aperturas, escrituras, transcurrido) in filas:
+        print(f"{nombre:<20}{aperturas:>12}{escrituras:>12}{transcurrido:>12.3f}")
+    base = filas[0][1][2]
+    for nombre, (_, _, transcurrido) in filas[1:]:
+        print(f"{nombre}: {base / transcurrido:.1f}× más rápido que escribir_caracter")
+
+
+if __name__ == "__main__":
+    main()
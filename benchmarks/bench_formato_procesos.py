@@ -0,0 +1,88 @@
+"""
+Benchmark de las representaciones de /procesos.
+Compara XML, JSON y el formato binario de models.formato_procesos
+midiendo la serialización en la aplicación de escritorio
+(rest_server) y el parseo en el cliente web (desktop_client) hasta obtener
+los diccionarios que usa el simulador.
+
+Uso:
+    python benchmarks/bench_formato_procesos.py [--procesos N] [--eventos E] [--repeticiones R]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(RAIZ)
+sys.path.append(os.path.join(RAIZ, "web_app"))
+
+from desktop_app.rest_server import _construir_xml
+from desktop_client import _parsear_datos, _parsear_xml
+from models.formato_procesos import (codificar_binario, codificar_json, decodificar_binario,
+                                     decodificar_json)
+
+
+def crear_procesos(n, eventos):
+    """Genera n procesos como los que publica la aplicación de escritorio."""
+    return [{
+        "pid": 1000 + i,
+        "nombre": f"proceso_{i}",
+        "usuario": "usuario",
+        "descripcion": f"Proceso proceso_{i}",
+        "prioridad": i % 2,
+        "estado": "Listo",
+        "t_llegada": i,
+        "t_final": 0,
+        "rafaga_total": 18,
+        "rafaga_restante": 18,
+        "num_ejecuciones": 0,
+        "turnaround": 0,
+        "historial": [("Ejecución", 10)] * eventos,
+    } for i in range(n)]
+
+
+def medir(funcion, argumento, repeticiones):
+    """Devuelve el resultado y el tiempo medio por llamada."""
+    inicio = time.perf_counter()
+    for _ in range(repeticiones):
+        resultado = funcion(argumento)
+    return resultado, (time.perf_counter() - inicio) / repeticiones
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--procesos", type=int, default=10000, help="número de procesos")
+    parser.add_argument("--eventos", type=int, default=2, help="eventos de historial por proceso")
+    parser.add_argument("--repeticiones", type=int, default=5, help="repeticiones por medición")
+    args = parser.parse_args()
+
+    procesos = crear_procesos(args.procesos, args.eventos)
+    formatos = [
+        ("XML", _construir_xml, _parsear_xml),
+        ("JSON", codificar_json, lambda datos: _parsear_datos(decodificar_json(datos))),
+        ("binario", codificar_binario, lambda datos: _parsear_datos(decodificar_binario(datos))),
+    ]
+    filas = []
+    referencia = None
+    for nombre, codificar, parsear in formatos:
+        datos, t_codificar = medir(codificar, procesos, args.repeticiones)
+        resultado, t_parsear = medir(parsear, datos, args.repeticiones)
+        if referencia is None:
+            referencia = resultado
+        assert resultado == referencia
+        filas.append((nombre, len(datos), t_codificar, t_parsear))
+
+    print(f"{args.procesos} procesos, {args.eventos} eventos de historial por proceso")
+    print(f"{'formato':<10}{'bytes':>12}{'serializar (ms)':>18}{'parsear (ms)':>15}{'total (ms)':>13}")
+    for nombre, tam, t_codificar, t_parsear in filas:
+        print(f"{nombre:<10}{tam:>12}{t_codificar * 1000:>18.1f}{t_parsear * 1000:>15.1f}"
+              f"{(t_codificar + t_parsear) * 1000:>13.1f}")
+    base = filas[0][2] + filas[0][3]
+    for nombre, _, t_codificar, t_parsear in filas[1:]:
+        print(f"{nombre}: {base / (t_codificar + t_parsear):.1f}× más rápido que XML")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+"""
+Canal de cambios de procesos para los clientes en streaming.
+Este módulo reparte los cambios del catálogo publicado (procesos
+agregados, eliminados o actualizados y catálogos reemplazados) entre los
+clientes conectados a /procesos/stream.
+
+Características:
+- Una cola acotada por cliente: un cliente lento no frena a los demás ni
+  a los hilos que publican
+- Coalescencia por PID: varios cambios pendientes de un mismo proceso se
+  funden en uno, por lo que la cola crece con el número de procesos y no
+  con el número de cambios
+- Si un cliente acumula demasiados cambios, se descartan y recibe el
+  catálogo completo (resincronización)
+- Publicación desde cualquier hilo; el cliente se despierta en su bucle
+  de eventos con call_soon_threadsafe
+- rest_server agrupa las actualizaciones de los hilos de simulación antes
+  de publicarlas (un lote cada INTERVALO_AGRUPACION como mucho)
+"""
+
+import asyncio
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+# Tipos de evento
+EVENTO_CATALOGO = "catalogo"
+EVENTO_AGREGADO = "agregado"
+EVENTO_ELIMINADO = "eliminado"
+EVENTO_ACTUALIZADO = "actualizado"
+
+# Cambios pendientes por cliente antes de forzar una resincronización
+MAX_PENDIENTES = 1000
+
+
+class Suscriptor:
+    """
+    Cola de cambios pendientes de un cliente.
+
+    Attributes:
+        resincronizar (bool): El cliente debe recibir el catálogo completo
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, max_pendientes: int = MAX_PENDIENTES):
+        """
+        Crea la cola; el primer envío es siempre el catálogo completo.
+
+        Args:
+            loop (AbstractEventLoop): Bucle de eventos del cliente
+            max_pendientes (int): Cambios pendientes antes de resincronizar
+        """
+        self._loop = loop
+        self._max_pendientes = max_pendientes
+        self._lock = threading.Lock()
+        self._pendientes: Dict[int, Tuple[str, int, Dict[str, Any]]] = {}
+        self._hay_datos = asyncio.Event()
+        self.resincronizar = True
+        self._hay_datos.set()
+
+    def _avisar(self):
+        """Despierta al cliente desde cualquier hilo."""
+        self._loop.call_soon_threadsafe(self._hay_datos.set)
+
+    def reiniciar(self):
+        """Descarta los cambios pendientes y pide el catálogo completo."""
+        with self._lock:
+            self._pendientes.clear()
+            self.resincronizar = True
+        self._avisar()
+
+    def agregar(self, tipo: str, version: int, pid: int, datos: Dict[str, Any]):
+        """
+        Encola un cambio de un proceso, fundiéndolo con el pendiente del mismo PID.
+
+        Args:
+            tipo (str): EVENTO_AGREGADO, EVENTO_ELIMINADO o EVENTO_ACTUALIZADO
+            version (int): Versión del catálogo tras el cambio
+            pid (int): Proceso afectado
+            datos (Dict[str, Any]): Proceso completo (agregado) o campos cambiados
+        """
+        with self._lock:
+            if self.resincronizar:
+                return  # El catálogo completo que se enviará ya incluye el cambio
+            previo = self._pendientes.get(pid)
+            if tipo == EVENTO_ACTUALIZADO and previo is not None and previo[0] != EVENTO_ELIMINADO:
+                # Actualizar sobre agregado/actualizado: el tipo previo se conserva
+                tipo, datos = previo[0], dict(previo[2], **datos)
+            self._pendientes[pid] = (tipo, version, datos)
+            if len(self._pendientes) > self._max_pendientes:
+                self._pendientes.clear()
+                self.resincronizar = True
+        self._avisar()
+
+    def tomar(self) -> Tuple[bool, List[Tuple[str, int, int, Dict[str, Any]]]]:
+        """
+        Extrae todo lo pendiente.
+
+        Returns:
+            Tuple[bool, List]: (resincronizar, lista de (tipo, versión, pid, datos))
+        """
+        with self._lock:
+            resincronizar = self.resincronizar
+            cambios = [(tipo, version, pid, datos)
+                       for pid, (tipo, version, datos) in self._pendientes.items()]
+            self._pendientes.clear()
+            self.resincronizar = False
+            self._hay_datos.clear()
+        return resincronizar, cambios
+
+    async def esperar(self, tiempo_max: Optional[float] = None) -> bool:
+        """
+        Espera hasta que haya cambios pendientes.
+
+        Args:
+            tiempo_max (Optional[float]): Segundos máximos de espera
+
+        Returns:
+            bool: True si hay cambios, False si se agotó el tiempo
+        """
+        try:
+            await asyncio.wait_for(self._hay_datos.wait(), tiempo_max)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+
+class CanalCambios:
+    """
+    Reparte los cambios publicados entre todos los suscriptores.
+
+    Attributes:
+        max_pendientes (int): Cambios pendientes por cliente antes de resincronizar
+    """
+
+    def __init__(self, max_pendientes: int = MAX_PENDIENTES):
+        self.max_pendientes = max_pendientes
+        self._lock = threading.Lock()
+        self._suscriptores: List[Suscriptor] = []
+
+    def suscribir(self, loop: asyncio.AbstractEventLoop) -> Suscriptor:
+        """
+        Registra un cliente nuevo.
+
+        Args:
+            loop (AbstractEventLoop): Bucle de eventos del cliente
+
+        Returns:
+            Suscriptor: Cola del cliente
+        """
+        suscriptor = Suscriptor(loop, self.max_pendientes)
+        with self._lock:
+            self._suscriptores.append(suscriptor)
+        return suscriptor
+
+    def desuscribir(self, suscriptor: Suscriptor):
+        """Da de baja un cliente."""
+        with self._lock:
+            if suscriptor in self._suscriptores:
+                self._suscriptores.remove(suscriptor)
+
+    def __len__(self) -> int:
+        return len(self._suscriptores)
+
+    def catalogo_reemplazado(self):
+        """Notifica que el catálogo completo cambió."""
+        with self._lock:
+            suscriptores = list(self._suscriptores)
+        for suscriptor in suscriptores:
+            suscriptor.reiniciar()
+
+    def publicar(self, tipo: str, version: int, pid: int, datos: Dict[str, Any]):
+        """
+        Notifica un cambio de un proceso.
+
+        Args:
+            tipo (str): EVENTO_AGREGADO, EVENTO_ELIMINADO o EVENTO_ACTUALIZADO
+            version (int): Versión del catálogo tras el cambio
+            pid (int): Proceso afectado
+            datos (Dict[str, Any]): Proceso completo (agregado) o campos cambiados
+        """
+        with self._lock:
+            suscriptores = list(self._suscriptores)
+        for suscriptor in suscriptores:
+            suscriptor.agregar(tipo, version, pid, datos)
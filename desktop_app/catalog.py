@@ -1,4 +1,5 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
+from .consulta_procesos import Filtro
 from .proceso import Proceso
 from .process_manager import listar_procesos
 
@@ -7,15 +8,17 @@ class Catalogo:
         self.id = id
         self.nombre = nombre
         self.procesos: List[Proceso] = []
+        # Antigüedad en segundos de la muestra de la última selección
+        self.edad_muestra = 0.0
         
     def agregar_proceso(self, proceso: Proceso):
         """Agrega un proceso al catálogo"""
         self.procesos.append(proceso)
         
-    def seleccionar_procesos(self, n: int, criterio: str) -> List[Proceso]:
-        """Selecciona los n procesos más activos según el criterio"""
+    def seleccionar_procesos(self, n: int, criterio: str, filtro: Optional[Filtro] = None) -> List[Proceso]:
+        """Selecciona los n procesos más activos según el criterio (entre los que cumplen el filtro)"""
         # Obtener procesos del sistema
-        procesos_meta = listar_procesos(n, criterio)
+        procesos_meta, self.edad_muestra = listar_procesos(n, criterio, filtro=filtro)
         
         # Determinar cuántos procesos no expulsivos seleccionar
         num_no_expulsivos = 4 if n >= 10 else 2
@@ -37,7 +40,8 @@ class Catalogo:
                 nombre=proc_meta.nombre,
                 usuario=proc_meta.usuario,
                 descripcion=f"Proceso {proc_meta.nombre}",
-                prioridad=prioridad
+                prioridad=prioridad,
+                catalogo_id=self.id
             )
             self.agregar_proceso(proceso)
             
@@ -0,0 +1,305 @@
+"""
+Consultas con filtros sobre la tabla de procesos muestreada.
+Este módulo permite seleccionar procesos por usuario, nombre y estado
+además de por CPU o memoria, sin recorrer y ordenar todos los procesos para
+cada combinación de filtros.
+
+Características:
+- Índices secundarios por instantánea: usuario → PIDs, estado → PIDs y
+  nombres ordenados para buscar por prefijo con búsqueda binaria
+- Filtros componibles con &, | y ~:
+    Usuario("root") & NombreCoincide("python*") & ~Estado("zombie")
+- Los filtros que pueden usar un índice reducen primero el conjunto de
+  candidatos; el resto solo se comprueba sobre esos candidatos
+- Los índices se construyen una vez por instantánea y se reutilizan en
+  todas las consultas sobre ella
+"""
+
+import bisect
+import fnmatch
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional, Set, Tuple
+
+import psutil
+
+from .procfs import disponible as procfs_disponible
+
+if procfs_disponible():
+    from .procfs import EntradaProc
+else:
+    # Sin /proc (Windows, macOS) todas las muestras son procesos de psutil
+    EntradaProc = None
+
+_ERRORES_PROCESO = (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess)
+
+# Caracteres comodín de fnmatch
+_COMODINES = "*?["
+
+
+def atributos(proc) -> Optional[Tuple[str, str, str]]:
+    """
+    Obtiene nombre, usuario y estado de una muestra.
+
+    Args:
+        proc (Process | EntradaProc): Proceso de psutil o entrada de /proc
+
+    Returns:
+        Optional[Tuple[str, str, str]]: (nombre, usuario, estado), o None si
+            el proceso ya no es accesible. El usuario es None si el sistema
+            deniega el acceso (procesos de otros usuarios en Windows y macOS)
+    """
+    if EntradaProc is not None and isinstance(proc, EntradaProc):
+        return proc.nombre, proc.usuario, proc.estado
+    try:
+        with proc.oneshot():
+            try:
+                usuario = proc.username()
+            except psutil.AccessDenied:
+                usuario = None
+            return proc.name(), usuario, proc.status()
+    except _ERRORES_PROCESO:
+        return None
+
+
+class IndiceProcesos:
+    """
+    Índices secundarios de una instantánea de procesos.
+
+    Attributes:
+        todos (Set[int]): PIDs indexados
+        atributos (Dict[int, Tuple[str, str, str]]): PID → (nombre, usuario, estado)
+        por_usuario (Dict[str, Set[int]]): Usuario → PIDs
+        por_estado (Dict[str, Set[int]]): Estado → PIDs
+    """
+
+    def __init__(self, muestras: Dict[int, tuple]):
+        """
+        Construye los índices.
+
+        Args:
+            muestras (Dict[int, tuple]): PID → (cpu, memoria, pid, proceso)
+        """
+        self.atributos: Dict[int, Tuple[str, str, str]] = {}
+        self.por_usuario: Dict[str, Set[int]] = {}
+        self.por_estado: Dict[str, Set[int]] = {}
+        nombres = []
+        for pid, (_, _, _, proc) in muestras.items():
+            datos = atributos(proc)
+            if datos is None:
+                continue
+            nombre, usuario, estado = datos
+            self.atributos[pid] = datos
+            self.por_usuario.setdefault(usuario, set()).add(pid)
+            self.por_estado.setdefault(estado, set()).add(pid)
+            nombres.append((nombre.lower(), pid))
+        nombres.sort()
+        self._nombres = [nombre for nombre, _ in nombres]
+        self._pids_nombre = [pid for _, pid in nombres]
+        self.todos = set(self.atributos)
+
+    def por_prefijo(self, prefijo: str) -> Set[int]:
+        """
+        Devuelve los PIDs cuyo nombre empieza por un prefijo (sin distinguir mayúsculas).
+
+        Args:
+            prefijo (str): Prefijo del nombre
+
+        Returns:
+            Set[int]: PIDs encontrados
+        """
+        prefijo = prefijo.lower()
+        inicio = bisect.bisect_left(self._nombres, prefijo)
+        fin = bisect.bisect_left(self._nombres, prefijo + "\U0010ffff", inicio)
+        return set(self._pids_nombre[inicio:fin])
+
+
+class Filtro(ABC):
+    """
+    Predicado sobre los procesos de una instantánea.
+
+    Las subclases implementan cumple() y, si pueden aprovechar un índice,
+    candidatos(). Se combinan con & (y), | (o) y ~ (no).
+
+    Attributes:
+        exacto (bool): Si candidatos() devuelve exactamente los PIDs que
+            cumplen el filtro (y no solo un superconjunto)
+    """
+
+    exacto = False
+
+    def candidatos(self, indice: IndiceProcesos) -> Optional[Set[int]]:
+        """
+        Devuelve un superconjunto de los PIDs que cumplen el filtro.
+
+        Args:
+            indice (IndiceProcesos): Índices de la instantánea
+
+        Returns:
+            Optional[Set[int]]: PIDs candidatos, o None si el filtro no usa índices
+        """
+        return None
+
+    @abstractmethod
+    def cumple(self, nombre: str, usuario: str, estado: str) -> bool:
+        """
+        Comprueba el filtro sobre un proceso.
+
+        Args:
+            nombre (str): Nombre del proceso
+            usuario (str): Usuario del proceso
+            estado (str): Estado del proceso
+
+        Returns:
+            bool: True si el proceso cumple el filtro
+        """
+
+    def __and__(self, otro: 'Filtro') -> 'Filtro':
+        return Y(self, otro)
+
+    def __or__(self, otro: 'Filtro') -> 'Filtro':
+        return O(self, otro)
+
+    def __invert__(self) -> 'Filtro':
+        return No(self)
+
+
+class Usuario(Filtro):
+    """Procesos de un usuario."""
+
+    exacto = True
+
+    def __init__(self, usuario: str):
+        self.usuario = usuario
+
+    def candidatos(self, indice: IndiceProcesos) -> Optional[Set[int]]:
+        return indice.por_usuario.get(self.usuario, set())
+
+    def cumple(self, nombre: str, usuario: str, estado: str) -> bool:
+        return usuario == self.usuario
+
+
+class Estado(Filtro):
+    """Procesos en un estado de psutil ("running", "sleeping", "zombie"...)."""
+
+    exacto = True
+
+    def __init__(self, estado: str):
+        self.estado = estado
+
+    def candidatos(self, indice: IndiceProcesos) -> Optional[Set[int]]:
+        return indice.por_estado.get(self.estado, set())
+
+    def cumple(self, nombre: str, usuario: str, estado: str) -> bool:
+        return estado == self.estado
+
+
+class PrefijoNombre(Filtro):
+    """Procesos cuyo nombre empieza por un prefijo (sin distinguir mayúsculas)."""
+
+    exacto = True
+
+    def __init__(self, prefijo: str):
+        self.prefijo = prefijo.lower()
+
+    def candidatos(self, indice: IndiceProcesos) -> Optional[Set[int]]:
+        return indice.por_prefijo(self.prefijo)
+
+    def cumple(self, nombre: str, usuario: str, estado: str) -> bool:
+        return nombre.lower().startswith(self.prefijo)
+
+
+class NombreCoincide(Filtro):
+    """
+    Procesos cuyo nombre coincide con un patrón de tipo glob ("python*",
+    "*worker?"), sin distinguir mayúsculas.
+
+    La parte fija anterior al primer comodín se busca en el índice de nombres.
+    """
+
+    def __init__(self, patron: str):
+        self.patron = patron.lower()
+        corte = min((self.patron.find(c) for c in _COMODINES if c in self.patron),
+                    default=len(self.patron))
+        self._prefijo = self.patron[:corte]
+
+    def candidatos(self, indice: IndiceProcesos) -> Optional[Set[int]]:
+        return indice.por_prefijo(self._prefijo) if self._prefijo else None
+
+    def cumple(self, nombre: str, usuario: str, estado: str) -> bool:
+        return fnmatch.fnmatchcase(nombre.lower(), self.patron)
+
+
+class Y(Filtro):
+    """Procesos que cumplen todos los filtros."""
+
+    def __init__(self, *filtros: Filtro):
+        self.filtros = filtros
+        self.exacto = all(f.exacto for f in filtros)
+
+    def candidatos(self, indice: IndiceProcesos) -> Optional[Set[int]]:
+        conjuntos = [c for c in (f.candidatos(indice) for f in self.filtros) if c is not None]
+        if not conjuntos:
+            return None
+        conjuntos.sort(key=len)
+        return conjuntos[0].intersection(*conjuntos[1:])
+
+    def cumple(self, nombre: str, usuario: str, estado: str) -> bool:
+        return all(f.cumple(nombre, usuario, estado) for f in self.filtros)
+
+
+class O(Filtro):
+    """Procesos que cumplen alguno de los filtros."""
+
+    def __init__(self, *filtros: Filtro):
+        self.filtros = filtros
+        self.exacto = all(f.exacto for f in filtros)
+
+    def candidatos(self, indice: IndiceProcesos) -> Optional[Set[int]]:
+        conjuntos = [f.candidatos(indice) for f in self.filtros]
+        if any(c is None for c in conjuntos):
+            return None
+        return set().union(*conjuntos)
+
+    def cumple(self, nombre: str, usuario: str, estado: str) -> bool:
+        return any(f.cumple(nombre, usuario, estado) for f in self.filtros)
+
+
+class No(Filtro):
+    """Procesos que no cumplen un filtro."""
+
+    def __init__(self, filtro: Filtro):
+        self.filtro = filtro
+        self.exacto = filtro.exacto
+
+    def candidatos(self, indice: IndiceProcesos) -> Optional[Set[int]]:
+        # El complemento de un superconjunto dejaría fuera procesos válidos
+        if not self.filtro.exacto:
+            return None
+        return indice.todos - self.filtro.candidatos(indice)
+
+    def cumple(self, nombre: str, usuario: str, estado: str) -> bool:
+        return not self.filtro.cumple(nombre, usuario, estado)
+
+
+def filtrar(muestras: Dict[int, tuple], indice: IndiceProcesos, filtro: Filtro) -> List[tuple]:
+    """
+    Devuelve las muestras de los procesos que cumplen un filtro.
+
+    Args:
+        muestras (Dict[int, tuple]): PID → (cpu, memoria, pid, proceso)
+        indice (IndiceProcesos): Índices de la misma instantánea
+        filtro (Filtro): Filtro a aplicar
+
+    Returns:
+        List[tuple]: Muestras seleccionadas
+    """
+    candidatos = filtro.candidatos(indice)
+    if candidatos is None:
+        candidatos = indice.todos
+    if filtro.exacto:
+        return [muestras[pid] for pid in candidatos]
+    seleccion = []
+    for pid in candidatos:
+        if filtro.cumple(*indice.atributos[pid]):
+            seleccion.append(muestras[pid])
+    return seleccion
@@ -0,0 +1,303 @@
+"""
+Contenedor segmentado para la salida de los procesos.
+Este módulo guarda la salida de todos los procesos en un único archivo de
+datos de solo anexado, con un índice de desplazamientos, en lugar de un
+archivo catalogo/proceso_{pid}_{nombre}.txt por proceso.
+
+Formato:
+- <ruta>.dat: segmentos consecutivos; cada uno es la longitud del nombre
+  (uint16), el nombre en UTF-8 y la salida del proceso en UTF-8
+- <ruta>.idx: registros de tamaño fijo (catálogo, pid, ejecución,
+  desplazamiento, longitud), en el mismo orden que los segmentos
+
+Características:
+- Escrituras secuenciales: los segmentos y los registros solo se anexan
+- Lectura de la salida de un proceso en O(1): búsqueda en el índice en
+  memoria, un posicionamiento y una única lectura (bajo el mismo lock que
+  las escrituras, por lo que funciona igual en Windows)
+- Tolerante a cortes: un registro incompleto o que apunta más allá del
+  archivo de datos se ignora al abrir
+- Herramienta de exportación a archivos .txt individuales:
+    python -m desktop_app.contenedor exportar <ruta> <directorio> [--catalogo C] [--pid P]
+"""
+
+import argparse
+import os
+import struct
+import threading
+from typing import Dict, Iterator, List, Optional, Tuple
+
+# Ruta por defecto del contenedor (sin extensión)
+RUTA_CONTENEDOR = os.path.join("catalogo", "salidas")
+
+_REGISTRO = struct.Struct("<qqqQQ")
+_NOMBRE = struct.Struct("<H")
+
+Clave = Tuple[int, int, int]
+
+
+class ContenedorSalidas:
+    """
+    Archivo de datos de solo anexado más índice (catálogo, pid, ejecución).
+
+    Attributes:
+        ruta (str): Ruta base; se usan ruta + ".dat" y ruta + ".idx"
+    """
+
+    def __init__(self, ruta: str = RUTA_CONTENEDOR):
+        """
+        Abre (o crea) el contenedor y carga su índice en memoria.
+
+        Args:
+            ruta (str): Ruta base del contenedor, sin extensión
+        """
+        self.ruta = ruta
+        directorio = os.path.dirname(ruta)
+        if directorio:
+            os.makedirs(directorio, exist_ok=True)
+        self._lock = threading.Lock()
+        self._indice: Dict[Clave, Tuple[int, int]] = {}
+        self._ultima_ejecucion: Dict[Tuple[int, int], int] = {}
+        self._datos = open(ruta + ".dat", "a+b")
+        self._idx = open(ruta + ".idx", "a+b")
+        self._cargar_indice()
+
+    def _cargar_indice(self):
+        """Lee el índice completo, descartando registros incompletos o huérfanos."""
+        tam_datos = os.fstat(self._datos.fileno()).st_size
+        self._idx.seek(0)
+        contenido = self._idx.read()
+        validos = 0
+        for catalogo, pid, ejecucion, desplazamiento, longitud in _REGISTRO.iter_unpack(
+                contenido[:len(contenido) - len(contenido) % _REGISTRO.size]):
+            if desplazamiento + longitud > tam_datos:
+                break  # Corte entre la escritura del segmento y la del registro
+            self._registrar((catalogo, pid, ejecucion), desplazamiento, longitud)
+            validos += 1
+        if validos * _REGISTRO.size != len(contenido):
+            # Quitar la cola dañada para que los registros nuevos queden alineados
+            self._idx.truncate(validos * _REGISTRO.size)
+
+    def _registrar(self, clave: Clave, desplazamiento: int, longitud: int):
+        """Añade una entrada al índice en memoria."""
+        self._indice[clave] = (desplazamiento, longitud)
+        catalogo, pid, ejecucion = clave
+        if ejecucion > self._ultima_ejecucion.get((catalogo, pid), 0):
+            self._ultima_ejecucion[(catalogo, pid)] = ejecucion
+
+    def anexar(self, catalogo: int, pid: int, nombre: str, salida: str) -> int:
+        """
+        Anexa la salida completa de una ejecución de un proceso.
+
+        Args:
+            catalogo (int): ID del catálogo
+            pid (int): PID del proceso
+            nombre (str): Nombre del proceso (para exportar)
+            salida (str): Texto copiado por el proceso
+
+        Returns:
+            int: Número de ejecución asignado (1 para la primera del proceso)
+        """
+        nombre_bytes = nombre.encode("utf-8")[:0xFFFF]
+        segmento = _NOMBRE.pack(len(nombre_bytes)) + nombre_bytes + salida.encode("utf-8")
+        with self._lock:
+            ejecucion = self._ultima_ejecucion.get((catalogo, pid), 0) + 1
+            self._datos.seek(0, os.SEEK_END)
+            desplazamiento = self._datos.tell()
+            # Primero los datos y después el registro que los hace visibles
+            self._datos.write(segmento)
+            self._datos.flush()
+            self._idx.write(_REGISTRO.pack(catalogo, pid, ejecucion, desplazamiento, len(segmento)))
+            self._idx.flush()
+            self._registrar((catalogo, pid, ejecucion), desplazamiento, len(segmento))
+        return ejecucion
+
+    def _leer_segmento(self, clave: Clave) -> Tuple[str, str]:
+        """Lee el nombre y la salida de un segmento con un posicionamiento y una lectura."""
+        with self._lock:
+            desplazamiento, longitud = self._indice[clave]
+            self._datos.seek(desplazamiento)
+            segmento = self._datos.read(longitud)
+        (tam_nombre,) = _NOMBRE.unpack_from(segmento, 0)
+        inicio = _NOMBRE.size + tam_nombre
+        return segmento[_NOMBRE.size:inicio].decode("utf-8"), segmento[inicio:].decode("utf-8")
+
+    def leer(self, catalogo: int, pid: int, ejecucion: Optional[int] = None) -> str:
+        """
+        Devuelve la salida de una ejecución de un proceso.
+
+        Args:
+            catalogo (int): ID del catálogo
+            pid (int): PID del proceso
+            ejecucion (Optional[int]): Número de ejecución (la última si no se indica)
+
+        Returns:
+            str: Texto copiado por el proceso
+
+        Raises:
+            KeyError: Si no existe esa salida
+        """
+        if ejecucion is None:
+            ejecucion = self._ultima_ejecucion[(catalogo, pid)]
+        return self._leer_segmento((catalogo, pid, ejecucion))[1]
+
+    def claves(self) -> List[Clave]:
+        """
+        Lista las salidas guardadas.
+
+        Returns:
+            List[Tuple[int, int, int]]: Claves (catálogo, pid, ejecución) en orden de escritura
+        """
+        return list(self._indice)
+
+    def __len__(self) -> int:
+        return len(self._indice)
+
+    def __contains__(self, clave: Clave) -> bool:
+        return clave in self._indice
+
+    def exportar(self, directorio: str, catalogo: Optional[int] = None,
+                 pid: Optional[int] = None) -> Iterator[str]:
+        """
+        Materializa salidas como archivos .txt individuales.
+
+        Los archivos se llaman proceso_{pid}_{nombre}.txt, como los de
+        crear_archivo_proceso; si un proceso tiene varias ejecuciones se
+        añade el sufijo _{ejecución} a partir de la segunda.
+
+        Args:
+            directorio (str): Directorio de destino
+            catalogo (Optional[int]): Exportar solo este catálogo
+            pid (Optional[int]): Exportar solo este PID
+
+        Yields:
+            str: Ruta de cada archivo escrito
+        """
+        os.makedirs(directorio, exist_ok=True)
+        for clave in self.claves():
+            cat, p, ejecucion = clave
+            if (catalogo is not None and cat != catalogo) or (pid is not None and p != pid):
+                continue
+            nombre, salida = self._leer_segmento(clave)
+            sufijo = "" if ejecucion == 1 else f"_{ejecucion}"
+            ruta = os.path.join(directorio, f"proceso_{p}_{nombre}{sufijo}.txt")
+            with open(ruta, "w", encoding="utf-8") as f:
+                f.write(salida)
+            yield ruta
+
+    def cerrar(self):
+        """Cierra los archivos del contenedor."""
+        self._datos.close()
+        self._idx.close()
+
+    def __enter__(self) -> 'ContenedorSalidas':
+        return self
+
+    def __exit__(self, *exc):
+        self.cerrar()
+
+
+_contenedores: Dict[str, ContenedorSalidas] = {}
+_contenedores_lock = threading.Lock()
+
+
+def obtener_contenedor(ruta: str = RUTA_CONTENEDOR) -> ContenedorSalidas:
+    """
+    Devuelve el contenedor compartido de una ruta, abriéndolo la primera vez.
+
+    Args:
+        ruta (str): Ruta base del contenedor (relativa al directorio actual)
+
+    Returns:
+        ContenedorSalidas: Contenedor abierto
+    """
+    ruta = os.path.abspath(ruta)
+    with _contenedores_lock:
+        if ruta not in _contenedores:
+            _contenedores[ruta] = ContenedorSalidas(ruta)
+        return _contenedores[ruta]
+
+
+class EscritorContenedor:
+    """
+    Escritor de la salida de un proceso hacia el contenedor.
+
+    Acumula lo copiado en memoria y lo anexa como un único segmento al
+    cerrarse, de modo que los procesos que se ejecutan a la vez no
+    intercalan sus datos.
+
+    Attributes:
+        ejecucion (Optional[int]): Número de ejecución asignado al cerrar
+    """
+
+    def __init__(self, contenedor: ContenedorSalidas, catalogo: int, pid: int, nombre: str):
+        """
+        Prepara el escritor.
+
+        Args:
+            contenedor (ContenedorSalidas): Contenedor de destino
+            catalogo (int): ID del catálogo
+            pid (int): PID del proceso
+            nombre (str): Nombre del proceso
+        """
+        self._contenedor = contenedor
+        self._catalogo = catalogo
+        self._pid = pid
+        self._nombre = nombre
+        self._partes: List[str] = []
+        self.ejecucion: Optional[int] = None
+
+    def escribir(self, texto: str):
+        """Añade texto a la salida del proceso."""
+        self._partes.append(texto)
+
+    @property
+    def abierto(self) -> bool:
+        """Siempre False: el escritor no tiene archivo propio (ver GestorEscritores)."""
+        return False
+
+    def vaciar(self):
+        """No hace nada: la salida se anexa completa al cerrar."""
+
+    def liberar(self):
+        """No hace nada: no hay descriptor que liberar."""
+
+    def cerrar(self):
+        """Anexa la salida al contenedor (una sola vez)."""
+        if self.ejecucion is None:
+            self.ejecucion = self._contenedor.anexar(self._catalogo, self._pid, self._nombre,
+                                                     "".join(self._partes))
+
+    def __enter__(self) -> 'EscritorContenedor':
+        return self
+
+    def __exit__(self, *exc):
+        self.cerrar()
+
+
+def main(argv: Optional[List[str]] = None):
+    """Herramienta de línea de comandos: listar y exportar salidas del contenedor."""
+    parser = argparse.ArgumentParser(description="Contenedor de salidas de procesos")
+    subcomandos = parser.add_subparsers(dest="comando", required=True)
+
+    listar = subcomandos.add_parser("listar", help="lista las salidas guardadas")
+    listar.add_argument("ruta", help="ruta base del contenedor (sin extensión)")
+
+    exportar = subcomandos.add_parser("exportar", help="escribe las salidas como archivos .txt")
+    exportar.add_argument("ruta", help="ruta base del contenedor (sin extensión)")
+    exportar.add_argument("directorio", help="directorio de destino")
+    exportar.add_argument("--catalogo", type=int, help="exportar solo este catálogo")
+    exportar.add_argument("--pid", type=int, help="exportar solo este PID")
+
+    args = parser.parse_args(argv)
+    with ContenedorSalidas(args.ruta) as contenedor:
+        if args.comando == "listar":
+            for catalogo, pid, ejecucion in contenedor.claves():
+                print(f"catálogo={catalogo} pid={pid} ejecución={ejecucion}")
+        else:
+            rutas = list(contenedor.exportar(args.directorio, args.catalogo, args.pid))
+            print(f"{len(rutas)} archivos exportados en {args.directorio}")
+
+
+if __name__ == "__main__":
+    main()
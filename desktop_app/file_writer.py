@@ -1,13 +1,49 @@
+"""
+Escritura de los archivos de proceso.
+Este módulo crea los archivos de cada proceso y escribe en ellos la
+descripción copiada carácter a carácter durante la simulación.
+
+Características:
+- escribir_caracter: abre, escribe un carácter y cierra (una apertura por carácter)
+- EscritorProceso: mantiene el archivo abierto con un búfer propio y lo
+  vacía por tamaño (bytes pendientes) o por tiempo (segundos desde el último
+  vaciado); se cierra al terminar el proceso
+- GestorEscritores: un escritor por archivo con un límite de descriptores
+  abiertos, para simulaciones con miles de procesos; se puede compartir
+  entre hilos
+- EscritorMapeado (modo "mmap"): archivo preasignado a su tamaño final y
+  proyectado en memoria; copiar un carácter es un almacenamiento en la
+  proyección, sin llamadas al sistema, y el progreso se lee sin copias
+- Todos los escritores comparten la interfaz escribir/vaciar/liberar/cerrar
+  y, al terminar la copia, los modos "buffer" y "mmap" dejan el mismo
+  archivo: la descripción copiada, una sola vez
+- Modo "contenedor": sin archivo por proceso; la salida se anexa a un único
+  contenedor segmentado (ver desktop_app.contenedor)
+"""
+
+import mmap
 import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Hashable, Optional, Union
 
-def crear_archivo_proceso(pid: int, nombre: str, descripcion: str) -> str:
+# Modos de escritura de los archivos de proceso
+MODO_BUFFER = "buffer"
+MODO_MMAP = "mmap"
+MODO_CONTENEDOR = "contenedor"
+
+def crear_archivo_proceso(pid: int, nombre: str, descripcion: str, preasignar: bool = False) -> str:
     """
-    Crea o trunca un archivo para el proceso y escribe su descripción.
+    Crea o trunca el archivo del proceso, donde se copiará su descripción.
     
     Args:
         pid: ID del proceso
         nombre: Nombre del proceso
-        descripcion: Descripción a escribir
+        descripcion: Descripción que se copiará
+        preasignar: Si es True (modo mmap), el archivo se crea con el tamaño
+            final de la descripción copiada, relleno de ceros; si no, vacío
+            (el escritor con búfer anexa cada carácter)
         
     Returns:
         str: Ruta del archivo creado
@@ -17,12 +53,342 @@ def crear_archivo_proceso(pid: int, nombre: str, descripcion: str) -> str:
     
     # Crear archivo
     archivo = f"catalogo/proceso_{pid}_{nombre}.txt"
-    with open(archivo, "w") as f:
-        f.write(descripcion)
+    if preasignar:
+        with open(archivo, "wb") as f:
+            f.truncate(len(descripcion.encode('utf-8')))
+        return archivo
+    open(archivo, "w").close()
         
     return archivo
         
 def escribir_caracter(archivo: str, caracter: str):
     """Escribe un carácter en el archivo del proceso"""
     with open(archivo, 'a', encoding='utf-8') as f:
-        f.write(caracter) 
\ No newline at end of file
+        f.write(caracter) 
+
+class EscritorProceso:
+    """
+    Escritor con búfer que conserva abierto el archivo de un proceso.
+    
+    Los datos se acumulan en memoria y se escriben con una sola llamada al
+    sistema cuando el búfer alcanza `tam_buffer` bytes o cuando pasaron
+    `intervalo_vaciado` segundos desde el último vaciado.
+    
+    Attributes:
+        archivo (str): Ruta del archivo
+        tam_buffer (int): Bytes pendientes que fuerzan un vaciado
+        intervalo_vaciado (float): Segundos máximos que un dato espera en el búfer
+        aperturas (int): Veces que se abrió el archivo
+        escrituras (int): Llamadas de escritura realizadas
+    """
+    
+    def __init__(self, archivo: str, tam_buffer: int = 4096, intervalo_vaciado: float = 0.5):
+        """
+        Prepara el escritor; el archivo se abre en el primer vaciado.
+        
+        Args:
+            archivo (str): Ruta del archivo (se escribe al final)
+            tam_buffer (int): Bytes pendientes que fuerzan un vaciado
+            intervalo_vaciado (float): Segundos máximos entre vaciados
+        """
+        self.archivo = archivo
+        self.tam_buffer = tam_buffer
+        self.intervalo_vaciado = intervalo_vaciado
+        self.aperturas = 0
+        self.escrituras = 0
+        self._f = None
+        self._pendiente = bytearray()
+        self._ultimo_vaciado = time.monotonic()
+        
+    @property
+    def abierto(self) -> bool:
+        """Indica si el escritor tiene el archivo abierto."""
+        return self._f is not None
+        
+    def escribir(self, texto: str):
+        """
+        Añade texto al búfer y lo vacía si se cumple la política.
+        
+        Args:
+            texto (str): Texto a escribir
+        """
+        self._pendiente += texto.encode('utf-8')
+        if (len(self._pendiente) >= self.tam_buffer or
+                time.monotonic() - self._ultimo_vaciado >= self.intervalo_vaciado):
+            self.vaciar()
+            
+    def vaciar(self):
+        """Escribe en el archivo todo lo pendiente."""
+        self._ultimo_vaciado = time.monotonic()
+        if not self._pendiente:
+            return
+        if self._f is None:
+            # Sin búfer de Python: cada vaciado es una única escritura
+            self._f = open(self.archivo, 'ab', buffering=0)
+            self.aperturas += 1
+        self._f.write(self._pendiente)
+        self.escrituras += 1
+        self._pendiente.clear()
+        
+    def liberar(self):
+        """Vacía y cierra el descriptor; el escritor sigue siendo utilizable."""
+        self.vaciar()
+        if self._f is not None:
+            self._f.close()
+            self._f = None
+            
+    def cerrar(self):
+        """Vacía y cierra el archivo (al terminar el proceso)."""
+        self.liberar()
+        
+    def __enter__(self) -> 'EscritorProceso':
+        return self
+        
+    def __exit__(self, *exc):
+        self.cerrar()
+
+class GestorEscritores:
+    """
+    Registro de escritores por archivo con un límite de archivos abiertos.
+    
+    Cuando se supera `max_abiertos`, se libera el descriptor del escritor
+    usado hace más tiempo; su búfer se vacía antes y el archivo se reabre
+    si vuelve a escribir. Todas las operaciones toman un lock, de modo que
+    varios hilos (uno por proceso) pueden compartir el gestor.
+    
+    Por defecto la clave es la ruta del archivo y se crea un
+    EscritorProceso; con `registrar` se puede usar cualquier escritor con
+    la misma interfaz (p. ej. el de Proceso.crear_escritor) bajo cualquier
+    clave.
+    
+    Attributes:
+        max_abiertos (int): Número máximo de archivos abiertos a la vez
+        tam_buffer (int): Tamaño de búfer de cada escritor
+        intervalo_vaciado (float): Intervalo de vaciado de cada escritor
+    """
+    
+    def __init__(self, max_abiertos: int = 256, tam_buffer: int = 4096, intervalo_vaciado: float = 0.5):
+        """
+        Inicializa el gestor.
+        
+        Args:
+            max_abiertos (int): Número máximo de archivos abiertos a la vez
+            tam_buffer (int): Tamaño de búfer de cada escritor
+            intervalo_vaciado (float): Intervalo de vaciado de cada escritor
+        """
+        self.max_abiertos = max_abiertos
+        self.tam_buffer = tam_buffer
+        self.intervalo_vaciado = intervalo_vaciado
+        self._escritores: Dict[Hashable, Escritor] = {}
+        # Escritores con el archivo abierto, del menos al más reciente
+        self._abiertos: "OrderedDict[Hashable, Escritor]" = OrderedDict()
+        self._lock = threading.Lock()
+        
+    @property
+    def abiertos(self) -> int:
+        """Número de archivos abiertos en este momento."""
+        return len(self._abiertos)
+        
+    def registrar(self, clave: Hashable, escritor: 'Escritor'):
+        """
+        Asocia un escritor ya creado a una clave.
+        
+        Args:
+            clave (Hashable): Clave con la que se escribirá (p. ej. el PID)
+            escritor (Escritor): Escritor con la interfaz de EscritorProceso
+        """
+        with self._lock:
+            self._escritores[clave] = escritor
+            self._usado(clave, escritor)
+            
+    def _usado(self, clave: Hashable, escritor: 'Escritor'):
+        """Marca el escritor como el más reciente y respeta el límite de abiertos."""
+        if not escritor.abierto:
+            return
+        self._abiertos[clave] = escritor
+        self._abiertos.move_to_end(clave)
+        if len(self._abiertos) > self.max_abiertos:
+            _, antiguo = self._abiertos.popitem(last=False)
+            antiguo.liberar()
+        
+    def escribir(self, clave: Hashable, texto: str):
+        """
+        Escribe texto a través del escritor de una clave.
+        
+        Args:
+            clave (Hashable): Ruta del archivo o clave de un escritor registrado
+            texto (str): Texto a escribir
+        """
+        with self._lock:
+            escritor = self._escritores.get(clave)
+            if escritor is None:
+                escritor = EscritorProceso(clave, self.tam_buffer, self.intervalo_vaciado)
+                self._escritores[clave] = escritor
+            escritor.escribir(texto)
+            self._usado(clave, escritor)
+                    
+    def vaciar(self, clave: Hashable):
+        """
+        Escribe lo pendiente del escritor de una clave (p. ej. al pausar).
+        
+        Args:
+            clave (Hashable): Ruta del archivo o clave de un escritor registrado
+        """
+        with self._lock:
+            escritor = self._escritores.get(clave)
+            if escritor is not None:
+                self._vaciar(clave, escritor)
+                
+    def _vaciar(self, clave: Hashable, escritor: 'Escritor'):
+        """Vacía un escritor sin superar el límite de archivos abiertos."""
+        escritor.vaciar()
+        if clave not in self._abiertos:
+            escritor.liberar()
+                
+    def cerrar(self, clave: Hashable):
+        """
+        Vacía y cierra el escritor de una clave.
+        
+        Args:
+            clave (Hashable): Ruta del archivo o clave de un escritor registrado
+        """
+        with self._lock:
+            escritor = self._escritores.pop(clave, None)
+            self._abiertos.pop(clave, None)
+        if escritor is not None:
+            escritor.cerrar()
+            
+    def vaciar_todos(self):
+        """Escribe lo pendiente de todos los escritores."""
+        with self._lock:
+            for clave, escritor in self._escritores.items():
+                self._vaciar(clave, escritor)
+            
+    def cerrar_todos(self):
+        """Vacía y cierra todos los escritores."""
+        for clave in list(self._escritores):
+            self.cerrar(clave)
+
+class EscritorMapeado:
+    """
+    Escritor sobre un archivo preasignado y proyectado en memoria.
+    
+    El archivo debe tener ya el tamaño final de la descripción codificada
+    (ver crear_archivo_proceso con preasignar=True). Copiar el carácter i
+    escribe sus bytes en su posición de la proyección; el sistema operativo
+    los lleva al disco sin una llamada por carácter. La proyección se abre
+    en la primera copia y se puede liberar y reabrir (GestorEscritores).
+    
+    Attributes:
+        archivo (str): Ruta del archivo
+        descripcion (str): Texto que se copia al archivo
+        copiados (int): Caracteres copiados (el prefijo escrito del archivo)
+    """
+    
+    def __init__(self, archivo: str, descripcion: str):
+        """
+        Prepara el escritor; el archivo se proyecta en la primera copia.
+        
+        Args:
+            archivo (str): Ruta del archivo preasignado
+            descripcion (str): Texto que se copia al archivo
+        """
+        self.archivo = archivo
+        self.descripcion = descripcion
+        self.copiados = 0
+        self._datos = descripcion.encode('utf-8')
+        # Desplazamiento en bytes de cada carácter; solo hace falta si hay
+        # caracteres de más de un byte
+        self._desplazamientos: Optional[list] = None
+        if len(self._datos) != len(descripcion):
+            self._desplazamientos = [0]
+            for caracter in descripcion:
+                self._desplazamientos.append(self._desplazamientos[-1] + len(caracter.encode('utf-8')))
+        self._mapa: Optional[mmap.mmap] = None
+        
+    @property
+    def abierto(self) -> bool:
+        """Indica si el archivo está proyectado."""
+        return self._mapa is not None
+        
+    def _proyectar(self):
+        """
+        Abre y proyecta el archivo.
+        
+        Raises:
+            ValueError: Si el tamaño del archivo no coincide con la descripción
+        """
+        with open(self.archivo, "r+b") as f:
+            if os.fstat(f.fileno()).st_size != len(self._datos):
+                raise ValueError(f"El archivo {self.archivo} no está preasignado al tamaño de la descripción")
+            self._mapa = mmap.mmap(f.fileno(), len(self._datos))
+            
+    def _desplazamiento(self, indice: int) -> int:
+        """Posición en bytes del carácter `indice`."""
+        return indice if self._desplazamientos is None else self._desplazamientos[indice]
+        
+    def copiar(self, indice: int):
+        """
+        Copia el carácter `indice` de la descripción a su posición del archivo.
+        
+        Args:
+            indice (int): Posición del carácter (rafaga_total - rafaga_restante)
+        """
+        if self._mapa is None:
+            self._proyectar()
+        if self._desplazamientos is None:
+            self._mapa[indice] = self._datos[indice]  # Un byte por carácter
+        else:
+            inicio, fin = self._desplazamientos[indice], self._desplazamientos[indice + 1]
+            self._mapa[inicio:fin] = self._datos[inicio:fin]
+        self.copiados = max(self.copiados, indice + 1)
+        
+    def escribir(self, texto: str):
+        """
+        Copia los siguientes caracteres de la descripción (misma interfaz que EscritorProceso).
+        
+        Args:
+            texto (str): Caracteres copiados, que siguen a los ya escritos
+        """
+        for indice in range(self.copiados, self.copiados + len(texto)):
+            self.copiar(indice)
+        
+    def vaciar(self):
+        """No hace nada: lo copiado ya está en la proyección (misma interfaz que EscritorProceso)."""
+        
+    def progreso(self) -> memoryview:
+        """
+        Vista sin copia de los bytes ya copiados.
+        
+        La vista debe liberarse (release) antes de cerrar el escritor.
+        
+        Returns:
+            memoryview: Prefijo escrito del archivo
+        """
+        if self._mapa is None:
+            if not self.copiados:
+                return memoryview(b"")
+            self._proyectar()
+        return memoryview(self._mapa)[:self._desplazamiento(self.copiados)]
+        
+    def liberar(self):
+        """Sincroniza y cierra la proyección; se reabre en la siguiente copia."""
+        if self._mapa is not None:
+            self._mapa.flush()
+            self._mapa.close()
+            self._mapa = None
+            
+    def cerrar(self):
+        """Sincroniza la proyección con el disco y la cierra."""
+        self.liberar()
+            
+    def __enter__(self) -> 'EscritorMapeado':
+        return self
+        
+    def __exit__(self, *exc):
+        self.cerrar()
+
+
+# Escritores con la interfaz escribir/vaciar/liberar/cerrar y la propiedad
+# abierto (también contenedor.EscritorContenedor)
+Escritor = Union[EscritorProceso, EscritorMapeado]
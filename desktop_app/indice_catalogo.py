@@ -0,0 +1,96 @@
+"""
+Índice en memoria del catálogo publicado por la API REST.
+Este módulo permite responder a /procesos con filtros y paginación sin
+recorrer ni ordenar la lista completa de procesos en cada petición.
+
+Características:
+- PIDs ordenados para la paginación por clave (cursor = último PID
+  devuelto), estable aunque se agreguen o eliminen procesos entre páginas
+- Índices secundarios prioridad/usuario/estado → PIDs ordenados
+- Las consultas con varios filtros recorren solo la lista más corta y
+  comprueban el resto con búsqueda binaria
+- Los cambios de un proceso se aplican al índice sin reconstruirlo
+"""
+
+import bisect
+from typing import Any, Dict, List, Optional, Tuple
+
+# Campos por los que se puede filtrar
+CAMPOS_INDEXADOS = ('prioridad', 'usuario', 'estado')
+
+
+def _contiene(pids: List[int], pid: int) -> bool:
+    """Comprueba si un PID está en una lista ordenada."""
+    i = bisect.bisect_left(pids, pid)
+    return i < len(pids) and pids[i] == pid
+
+
+class IndiceCatalogo:
+    """
+    Índices de una lista de procesos.
+
+    Attributes:
+        pids (List[int]): Todos los PIDs, ordenados
+        por_campo (Dict[str, Dict[Any, List[int]]]): Campo indexado → valor → PIDs ordenados
+    """
+
+    def __init__(self, procesos: List[Dict[str, Any]]):
+        """
+        Construye los índices.
+
+        Args:
+            procesos (List[Dict[str, Any]]): Procesos (como Proceso.to_dict())
+        """
+        self.pids = sorted(proc['pid'] for proc in procesos)
+        self.por_campo: Dict[str, Dict[Any, List[int]]] = {campo: {} for campo in CAMPOS_INDEXADOS}
+        for proc in sorted(procesos, key=lambda proc: proc['pid']):
+            for campo in CAMPOS_INDEXADOS:
+                self.por_campo[campo].setdefault(proc.get(campo), []).append(proc['pid'])
+
+    def actualizar(self, pid: int, anterior: Dict[str, Any], cambios: Dict[str, Any]):
+        """
+        Refleja en los índices los cambios de un proceso.
+
+        Args:
+            pid (int): PID del proceso
+            anterior (Dict[str, Any]): Proceso antes del cambio
+            cambios (Dict[str, Any]): Campos modificados
+        """
+        for campo in CAMPOS_INDEXADOS:
+            if campo not in cambios:
+                continue
+            valores = self.por_campo[campo]
+            pids = valores.get(anterior.get(campo))
+            if pids is not None and _contiene(pids, pid):
+                del pids[bisect.bisect_left(pids, pid)]
+                if not pids:
+                    del valores[anterior.get(campo)]
+            bisect.insort(valores.setdefault(cambios[campo], []), pid)
+
+    def pagina(self, filtros: Dict[str, Any], cursor: Optional[int] = None,
+               limite: Optional[int] = None) -> Tuple[List[int], Optional[int]]:
+        """
+        Selecciona los PIDs que cumplen los filtros, en orden de PID.
+
+        Args:
+            filtros (Dict[str, Any]): Campo indexado → valor exigido
+            cursor (Optional[int]): Devolver solo PIDs mayores que este
+            limite (Optional[int]): Número máximo de PIDs (None = todos)
+
+        Returns:
+            Tuple[List[int], Optional[int]]: (PIDs, cursor de la página
+                siguiente o None si no hay más)
+        """
+        listas = [self.por_campo[campo].get(valor, []) for campo, valor in filtros.items()]
+        if not listas:
+            listas = [self.pids]
+        listas.sort(key=len)
+        base, resto = listas[0], listas[1:]
+        inicio = 0 if cursor is None else bisect.bisect_right(base, cursor)
+        seleccion = []
+        for pid in base[inicio:]:
+            if all(_contiene(pids, pid) for pids in resto):
+                if limite is not None and len(seleccion) == limite:
+                    return seleccion, seleccion[-1]
+                seleccion.append(pid)
+        return seleccion, None
@@ -12,8 +12,23 @@ import xml.etree.ElementTree as ET
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from desktop_app.catalog import Catalogo
+from desktop_app.file_writer import GestorEscritores, MODO_BUFFER, MODO_CONTENEDOR, MODO_MMAP
 from desktop_app.simulador import Simulador
-from desktop_app.rest_server import iniciar_servidor, actualizar_procesos
+from desktop_app.planificador_temporizado import PlanificadorTemporizado
+from desktop_app.process_manager import obtener_muestreador, AGREGADOS
+from desktop_app.rest_server import iniciar_servidor, actualizar_procesos, actualizar_proceso
+from models.politicas import POLITICAS
+
+# Modo de ejecución original: un hilo por proceso, sin planificador
+MODO_MULTIHILO = "multihilo"
+# Misma ejecución carácter a carácter, pero desde un único hilo planificador
+MODO_UN_HILO = "un_hilo"
+# Simulador con la política de planificación elegida (ver Simulador)
+MODO_POLITICA = "politica"
+# Filtrar por la muestra más reciente en lugar de un agregado del historial
+AGREGADO_ACTUAL = "actual"
+# Punto de control de las simulaciones con política (ver Simulador.guardar_punto_control)
+RUTA_PUNTO_CONTROL = "desktop_app/punto_control.bin"
 
 class CatalogUI:
     def __init__(self, root):
@@ -24,6 +39,8 @@ class CatalogUI:
         # Inicializar variables
         self.catalogo = None
         self.simulador = None
+        self.planificador = None
+        self.publicacion_pendiente = False  # Falta publicar el estado final del simulador
         
         # Colas para comunicación entre hilos
         self.log_queue = queue.Queue()
@@ -48,6 +65,10 @@ class CatalogUI:
         self.root.after(100, self.procesa_mensajes)  # Polling de la cola
         self.actualizar_tabla_periodicamente()
         
+        # Muestrear los procesos del sistema en segundo plano
+        self.muestreador = obtener_muestreador()
+        self.muestreador.iniciar()
+        
         # Cargar procesos del sistema al inicio
         self.actualizar_procesos_sistema()
         
@@ -81,6 +102,56 @@ class CatalogUI:
         ttk.Radiobutton(config_frame, text="CPU", variable=self.filtro_var, value="CPU").grid(row=0, column=7)
         ttk.Radiobutton(config_frame, text="Memoria", variable=self.filtro_var, value="Memoria").grid(row=0, column=8)
         
+        # Agregado del historial de métricas usado para filtrar
+        ttk.Label(config_frame, text="Valor:").grid(row=1, column=6, padx=5, pady=(5, 0))
+        self.agregado_var = tk.StringVar(value=AGREGADO_ACTUAL)
+        ttk.Combobox(
+            config_frame,
+            textvariable=self.agregado_var,
+            values=[AGREGADO_ACTUAL] + list(AGREGADOS),
+            state="readonly",
+            width=8
+        ).grid(row=1, column=7, columnspan=2, pady=(5, 0))
+        
+        # Selector del modo de ejecución
+        ttk.Label(config_frame, text="Ejecución:").grid(row=1, column=0, padx=5, pady=(5, 0))
+        self.ejecucion_var = tk.StringVar(value=MODO_MULTIHILO)
+        ttk.Combobox(
+            config_frame,
+            textvariable=self.ejecucion_var,
+            values=[MODO_MULTIHILO, MODO_UN_HILO, MODO_POLITICA],
+            state="readonly",
+            width=12
+        ).grid(row=1, column=1, padx=5, pady=(5, 0))
+        
+        ttk.Label(config_frame, text="CPUs:").grid(row=1, column=2, padx=5, pady=(5, 0))
+        self.n_cpus_var = tk.StringVar(value="1")
+        ttk.Entry(config_frame, textvariable=self.n_cpus_var, width=10).grid(row=1, column=3, padx=5, pady=(5, 0))
+        self.robo_trabajo_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(config_frame, text="Robo de trabajo", variable=self.robo_trabajo_var).grid(row=1, column=4, columnspan=2, pady=(5, 0))
+        
+        # Modo de escritura de los archivos de proceso (ver file_writer)
+        ttk.Label(config_frame, text="Escritura:").grid(row=2, column=0, padx=5, pady=(5, 0))
+        self.modo_escritura_var = tk.StringVar(value=MODO_BUFFER)
+        ttk.Combobox(
+            config_frame,
+            textvariable=self.modo_escritura_var,
+            values=[MODO_BUFFER, MODO_MMAP, MODO_CONTENEDOR],
+            state="readonly",
+            width=12
+        ).grid(row=2, column=1, padx=5, pady=(5, 0))
+        
+        # Selector de política de planificación (solo en el modo con política)
+        ttk.Label(config_frame, text="Política:").grid(row=2, column=2, padx=5, pady=(5, 0))
+        self.politica_var = tk.StringVar(value="round_robin")
+        ttk.Combobox(
+            config_frame,
+            textvariable=self.politica_var,
+            values=sorted(POLITICAS),
+            state="readonly",
+            width=12
+        ).grid(row=2, column=3, padx=5, pady=(5, 0))
+        
         # Frame para tabla y detalles
         content_frame = ttk.Frame(main_frame)
         content_frame.pack(fill="both", expand=True, pady=5)
@@ -179,7 +250,7 @@ class CatalogUI:
             
             # Crear catálogo temporal
             catalogo_temp = Catalogo(0, "Sistema")
-            procesos = catalogo_temp.seleccionar_procesos(num_procesos, self.filtro_var.get())
+            procesos = catalogo_temp.seleccionar_procesos(num_procesos, self.criterio())
             
             # Limpiar tabla
             for item in self.tree.get_children():
@@ -202,12 +273,20 @@ class CatalogUI:
                 ), tags=(proc.estado,))
                 
             self.log(f"Se cargaron {len(procesos)} procesos del sistema", "SUCCESS")
-            self.log(f"Filtro aplicado: {self.filtro_var.get()}", "INFO")
+            self.log(f"Filtro aplicado: {self.criterio()}", "INFO")
+            self.log(f"Antigüedad de la muestra: {catalogo_temp.edad_muestra:.1f} s", "INFO")
             
         except ValueError as e:
             self.log(f"Error al cargar procesos: {str(e)}", "ERROR")
             messagebox.showerror("Error", str(e))
             
+    def criterio(self) -> str:
+        """Criterio de selección: métrica y, si se eligió, agregado ("CPU_media")"""
+        agregado = self.agregado_var.get()
+        if agregado == AGREGADO_ACTUAL:
+            return self.filtro_var.get()
+        return f"{self.filtro_var.get()}_{agregado}"
+        
     def seleccionar_procesos(self):
         """Selecciona los procesos para la simulación"""
         try:
@@ -220,7 +299,7 @@ class CatalogUI:
                 return
             # Crear catálogo
             self.catalogo = Catalogo(num_catalogo, nombre_catalogo)
-            procesos = self.catalogo.seleccionar_procesos(num_procesos, self.filtro_var.get())
+            procesos = self.catalogo.seleccionar_procesos(num_procesos, self.criterio())
             # Limpiar tabla y mapeo
             for item in self.tree.get_children():
                 self.tree.delete(item)
@@ -258,7 +337,7 @@ class CatalogUI:
             messagebox.showerror("Error", str(e))
             
     def iniciar_simulacion(self):
-        """Inicia la simulación de procesos (multihilo, carácter a carácter)"""
+        """Inicia la simulación de procesos con el modo de ejecución y la política elegidos"""
         if not self.catalogo:
             self.log("Primero seleccione los procesos", "WARNING")
             messagebox.showerror("Error", "Primero seleccione los procesos")
@@ -266,40 +345,126 @@ class CatalogUI:
         try:
             th = int(self.th_var.get())
             self.th = th
-            self.pausa_event = threading.Event()
-            self.pausa_event.set()
-            self.hilos = []
-            self.simulacion_activa = True
             for proc in self.catalogo.procesos:
-                t = threading.Thread(target=self.run_proceso, args=(proc, th), daemon=True)
-                t.start()
-                self.hilos.append(t)
-            self.log("Simulación multihilo iniciada", "SUCCESS")
+                proc.modo_escritura = self.modo_escritura_var.get()
+            self.lanzar_simulacion(self.ejecucion_var.get(), self.politica_var.get(), th)
         except ValueError as e:
             self.log(f"Error al iniciar simulación: {str(e)}", "ERROR")
             messagebox.showerror("Error", str(e))
 
+    def lanzar_simulacion(self, modo: str, politica: str, th: int):
+        """
+        Arranca la simulación del catálogo en el modo de ejecución indicado.
+        
+        Args:
+            modo (str): MODO_MULTIHILO, MODO_UN_HILO o MODO_POLITICA
+            politica (str): Política de planificación (solo con MODO_POLITICA)
+            th (int): Tiempo de espera entre ejecuciones (ms)
+            
+        Raises:
+            ValueError: Si el modo o la configuración no son válidos
+        """
+        if modo not in (MODO_MULTIHILO, MODO_UN_HILO, MODO_POLITICA):
+            raise ValueError(f"Modo de ejecución desconocido: {modo}")
+        if modo == MODO_UN_HILO:
+            self.simulador = None
+            self.simulacion_activa = False
+            self.planificador = PlanificadorTemporizado(
+                th,
+                al_copiar=lambda proc, idx, char: self.notificar_caracter(proc, idx, char, th),
+                al_terminar=lambda proc: self.notificar_terminado(proc, th)
+            )
+            for proc in self.catalogo.procesos:
+                self.msg_queue.put(('state_change', (proc.pid, 'Ejecución')))
+                actualizar_proceso(proc.pid, estado='Ejecución')
+            self.planificador.iniciar(self.catalogo.procesos)
+            self.log(f"Simulación iniciada en un solo hilo ({len(self.catalogo.procesos)} procesos)", "SUCCESS")
+            return
+        self.planificador = None
+        if modo == MODO_POLITICA:
+            # Un solo hilo planificador con la política elegida
+            self.simulacion_activa = False
+            if self.restaurar_punto_control():
+                return
+            self.simulador = Simulador(
+                th, int(self.quantum_var.get()), politica,
+                n_cpus=int(self.n_cpus_var.get()),
+                robo_trabajo=self.robo_trabajo_var.get(),
+                ruta_punto_control=RUTA_PUNTO_CONTROL
+            )
+            self.simulador.iniciar(self.catalogo.procesos, callback=self.log)
+            self.log(f"Simulación iniciada con política {politica}", "SUCCESS")
+            return
+        self.simulador = None
+        self.pausa_event = threading.Event()
+        self.pausa_event.set()
+        # Un escritor con búfer por proceso y un número acotado de archivos abiertos
+        self.escritores = GestorEscritores()
+        self.hilos = []
+        self.simulacion_activa = True
+        for proc in self.catalogo.procesos:
+            t = threading.Thread(target=self.run_proceso, args=(proc, th), daemon=True)
+            t.start()
+            self.hilos.append(t)
+        self.log("Simulación multihilo iniciada", "SUCCESS")
+
+    def restaurar_punto_control(self) -> bool:
+        """Ofrece continuar la simulación interrumpida guardada en el punto de control"""
+        if not os.path.exists(RUTA_PUNTO_CONTROL):
+            return False
+        if not messagebox.askyesno("Punto de control",
+                                   "Hay una simulación interrumpida. ¿Desea continuarla?"):
+            return False
+        try:
+            with open(RUTA_PUNTO_CONTROL, "rb") as f:
+                self.simulador = Simulador.restaurar(f.read(), ruta_punto_control=RUTA_PUNTO_CONTROL)
+        except (OSError, ValueError) as e:
+            self.log(f"No se pudo restaurar el punto de control: {str(e)}", "ERROR")
+            return False
+        self.th = self.simulador.th
+        self.simulador.continuar(callback=self.log)
+        self.log(f"Simulación restaurada con política {self.simulador.politica}", "SUCCESS")
+        return True
+
     def run_proceso(self, proc, th):
         """Simula la ejecución carácter a carácter de un proceso en un hilo"""
         self.msg_queue.put(('log', (f"[{self.now()}] [PID={proc.pid}] Hilo iniciado. Ráfaga total={proc.rafaga_total * th}ms", "INFO")))
         self.msg_queue.put(('state_change', (proc.pid, 'Ejecución')))
-        archivo = f"proceso_{proc.pid}.txt"
-        with open(archivo, "w", encoding="utf-8") as f:
-            for idx, char in enumerate(proc.descripcion, start=1):
+        actualizar_proceso(proc.pid, estado='Ejecución')
+        self.escritores.registrar(proc.pid, proc.crear_escritor())
+        for idx, char in enumerate(proc.descripcion, start=1):
+            if not self.pausa_event.is_set():
+                # Dejar lo copiado en el archivo mientras dure la pausa
+                self.escritores.vaciar(proc.pid)
                 self.pausa_event.wait()
-                f.write(char)
-                proc.rafaga_restante -= 1
-                self.msg_queue.put(('update_table', (proc.pid, 'R (ms)', str(proc.rafaga_restante * th))))
-                self.msg_queue.put(('log', (f"[{self.now()}] [PID={proc.pid}] Copiado carácter {idx}/{len(proc.descripcion)} '{char}'. Ráfaga remanente={proc.rafaga_restante * th}ms", "INFO")))
-                time.sleep(th / 1000)
-        proc.t_final = (idx) * th
+            self.escritores.escribir(proc.pid, char)
+            proc.rafaga_restante -= 1
+            self.notificar_caracter(proc, idx, char, th)
+            time.sleep(th / 1000)
+        self.escritores.cerrar(proc.pid)
+        self.notificar_terminado(proc, th)
+        if all(p.estado == 'Terminado' for p in self.catalogo.procesos):
+            self.simulacion_activa = False
+            self.msg_queue.put(('log', (f"[{self.now()}] Simulación finalizada. Todos los procesos han terminado.", "SUCCESS")))
+
+    def notificar_caracter(self, proc, idx, char, th):
+        """Envía a la GUI y al servidor REST el avance de un proceso tras copiar un carácter"""
+        actualizar_proceso(proc.pid, rafaga_restante=proc.rafaga_restante)
+        self.msg_queue.put(('update_table', (proc.pid, 'R (ms)', str(proc.rafaga_restante * th))))
+        self.msg_queue.put(('log', (f"[{self.now()}] [PID={proc.pid}] Copiado carácter {idx}/{len(proc.descripcion)} '{char}'. Ráfaga remanente={proc.rafaga_restante * th}ms", "INFO")))
+
+    def notificar_terminado(self, proc, th):
+        """Registra la terminación de un proceso y la envía a la GUI y al servidor REST"""
+        proc.t_final = len(proc.descripcion) * th
         proc.turnaround = proc.t_final - proc.t_llegada * th
+        proc.estado = 'Terminado'
+        actualizar_proceso(proc.pid, estado=proc.estado, rafaga_restante=proc.rafaga_restante,
+                           t_final=proc.t_final, turnaround=proc.turnaround)
         self.msg_queue.put(('state_change', (proc.pid, 'Terminado')))
         self.msg_queue.put(('update_table', (proc.pid, 'T.F (ms)', str(proc.t_final))))
         self.msg_queue.put(('update_table', (proc.pid, 'T.R (ms)', str(proc.turnaround))))
         self.msg_queue.put(('log', (f"[{self.now()}] [PID={proc.pid}] Terminado. T.F={proc.t_final}ms, T.R={proc.turnaround}ms", "SUCCESS")))
-        if all(p.estado == 'Terminado' for p in self.catalogo.procesos):
-            self.simulacion_activa = False
+        if self.planificador and all(p.estado == 'Terminado' for p in self.catalogo.procesos):
             self.msg_queue.put(('log', (f"[{self.now()}] Simulación finalizada. Todos los procesos han terminado.", "SUCCESS")))
 
     def actualizar_tabla_proceso(self, proc):
@@ -322,6 +487,20 @@ class CatalogUI:
 
     def toggle_pausa(self):
         """Pausa o reanuda la simulación"""
+        if self.simulador and self.simulador.simulacion_activa:
+            if self.simulador.pausa_event.is_set():
+                self.simulador.pausar()
+            else:
+                self.simulador.reanudar()
+            return
+        if self.planificador and self.planificador.simulacion_activa:
+            if self.planificador.pausa_event.is_set():
+                self.planificador.pausar()
+                self.log(f"[{self.now()}] Simulación en pausa.", "WARNING")
+            else:
+                self.planificador.reanudar()
+                self.log(f"[{self.now()}] Simulación reanudada.", "SUCCESS")
+            return
         if not hasattr(self, 'pausa_event') or not self.simulacion_activa:
             return
         if self.pausa_event.is_set():
@@ -333,6 +512,13 @@ class CatalogUI:
 
     def detener_simulacion(self):
         """Detiene la simulación"""
+        if self.simulador and self.simulador.simulacion_activa:
+            self.simulador.detener()
+            return
+        if self.planificador and self.planificador.simulacion_activa:
+            self.planificador.detener()
+            self.log(f"[{self.now()}] Simulación detenida.", "INFO")
+            return
         if not hasattr(self, 'pausa_event') or not self.simulacion_activa:
             return
         self.simulacion_activa = False
@@ -345,10 +531,24 @@ class CatalogUI:
                 self.actualizar_tabla_proceso(proc)
         self.log(f"[{self.now()}] Simulación detenida. Todos los procesos marcados como terminados.", "INFO")
 
+    def publicar_estado_simulador(self, estado):
+        """Publica el avance de la simulación en el servidor REST (solo se notifican cambios)"""
+        for cola in ('cola_ejecucion', 'cola_terminados', 'cola_listos'):
+            for proc in estado[cola]:
+                actualizar_proceso(proc['pid'], estado=proc['estado'],
+                                   rafaga_restante=proc['rafaga_restante'],
+                                   t_final=proc['t_final'], turnaround=proc['turnaround'])
+
     def actualizar_tabla_periodicamente(self):
         """Actualiza la tabla cada 100ms si la simulación está activa"""
+        if self.simulador and not self.simulador.simulacion_activa and self.publicacion_pendiente:
+            # Publicar el estado final de la simulación que acaba de terminar
+            self.publicar_estado_simulador(self.simulador.obtener_estado())
+            self.publicacion_pendiente = False
         if self.simulador and self.simulador.simulacion_activa:
             estado = self.simulador.obtener_estado()
+            self.publicar_estado_simulador(estado)
+            self.publicacion_pendiente = True
             
             # Limpiar tabla
             for item in self.tree.get_children():
@@ -0,0 +1,170 @@
+"""
+Planificador de un solo hilo con montículo de temporizadores.
+Este módulo reemplaza el modo "un hilo por proceso" de la interfaz: todos
+los procesos avanzan carácter a carácter desde un único hilo planificador
+que duerme hasta el siguiente vencimiento de un montículo ordenado por
+fecha límite.
+
+Características:
+- Número de hilos constante, independiente del número de procesos
+- Ritmo predecible: cada vencimiento se calcula desde el anterior
+  (fecha + TH), por lo que los retrasos no se acumulan
+- Soporte para pausar/reanudar/detener; la pausa desplaza los vencimientos
+  y al detener los procesos pendientes se dan por terminados
+- Notificación de eventos por callbacks (carácter copiado y terminación)
+- Escritura en el modo de cada proceso (Proceso.crear_escritor) con un
+  número acotado de archivos abiertos (GestorEscritores)
+"""
+
+import heapq
+import threading
+import time
+from typing import Callable, List, Optional, Tuple
+
+from .file_writer import GestorEscritores
+from .proceso import Proceso
+
+class PlanificadorTemporizado:
+    """
+    Ejecuta la copia carácter a carácter de muchos procesos desde un hilo.
+
+    Attributes:
+        th (int): Tiempo entre caracteres de un mismo proceso (ms)
+        pausa_event (Event): Evento para controlar pausas
+        simulacion_activa (bool): Estado de la simulación
+        al_copiar (Optional[Callable]): Se llama con (proceso, índice, carácter)
+        al_terminar (Optional[Callable]): Se llama con el proceso terminado
+    """
+
+    def __init__(self, th: int,
+                 al_copiar: Optional[Callable[[Proceso, int, str], None]] = None,
+                 al_terminar: Optional[Callable[[Proceso], None]] = None):
+        """
+        Inicializa el planificador.
+
+        Args:
+            th (int): Tiempo entre caracteres de un mismo proceso (ms)
+            al_copiar (Optional[Callable]): Callback tras copiar cada carácter
+            al_terminar (Optional[Callable]): Callback al terminar un proceso
+        """
+        self.th = th
+        self.al_copiar = al_copiar
+        self.al_terminar = al_terminar
+        self.pausa_event = threading.Event()
+        self.pausa_event.set()
+        self.simulacion_activa = False
+        self._despertar = threading.Event()
+        self._temporizadores: List[Tuple[float, int, Proceso]] = []
+        self._escritores = GestorEscritores()
+
+    def iniciar(self, procesos: List[Proceso]):
+        """
+        Programa todos los procesos y arranca el hilo planificador.
+
+        El primer carácter de cada proceso vence al inicio y los siguientes
+        cada TH ms, igual que en el modo de un hilo por proceso. No toca el
+        disco: el archivo de cada proceso (Proceso.crear_escritor) se crea
+        en el hilo planificador cuando vence su primer carácter.
+
+        Args:
+            procesos (List[Proceso]): Procesos a ejecutar
+        """
+        inicio = time.monotonic()
+        self._temporizadores = []
+        for secuencia, proc in enumerate(procesos):
+            self._temporizadores.append((inicio, secuencia, proc))
+        heapq.heapify(self._temporizadores)
+        self.simulacion_activa = True
+        threading.Thread(target=self._ejecutar, daemon=True).start()
+
+    def _esperar_pausa(self):
+        """Bloquea mientras dure la pausa y desplaza los vencimientos."""
+        inicio_pausa = time.monotonic()
+        self.pausa_event.wait()
+        desplazamiento = time.monotonic() - inicio_pausa
+        # Sumar una constante a todas las claves conserva el orden del montículo
+        self._temporizadores = [(fecha + desplazamiento, secuencia, proc)
+                                for fecha, secuencia, proc in self._temporizadores]
+
+    def _ejecutar(self):
+        """
+        Bucle del hilo planificador.
+
+        En cada iteración:
+        1. Espera si la simulación está pausada
+        2. Duerme hasta el vencimiento más próximo del montículo
+        3. Copia el carácter siguiente del proceso vencido (creando su
+           archivo si es el primero)
+        4. Reprograma el proceso o lo da por terminado
+
+        Si se detiene la simulación, los procesos pendientes se dan por
+        terminados al salir del bucle.
+        """
+        while self.simulacion_activa and self._temporizadores:
+            if not self.pausa_event.is_set():
+                self._escritores.vaciar_todos()
+                self._esperar_pausa()
+                continue
+
+            fecha, secuencia, proc = self._temporizadores[0]
+            restante = fecha - time.monotonic()
+            if restante > 0:
+                # Se despierta antes si se pausa o se detiene la simulación
+                self._despertar.wait(restante)
+                self._despertar.clear()
+                continue
+
+            indice = proc.rafaga_total - proc.rafaga_restante
+            if indice == 0:
+                self._escritores.registrar(proc.pid, proc.crear_escritor())
+            if proc.rafaga_restante > 0:
+                caracter = proc.descripcion[indice]
+                self._escritores.escribir(proc.pid, caracter)
+                proc.rafaga_restante -= 1
+                if self.al_copiar:
+                    self.al_copiar(proc, indice + 1, caracter)
+
+            if proc.rafaga_restante > 0:
+                heapq.heapreplace(self._temporizadores, (fecha + self.th / 1000, secuencia, proc))
+            else:
+                heapq.heappop(self._temporizadores)
+                self._terminar(proc)
+
+        # Detenida: los procesos pendientes se dan por terminados
+        for _, _, proc in sorted(self._temporizadores, key=lambda t: t[1]):
+            self._terminar(proc)
+        self._temporizadores = []
+        self._escritores.cerrar_todos()
+        self.simulacion_activa = False
+
+    def _terminar(self, proc: Proceso):
+        """
+        Cierra el archivo de un proceso, lo marca como terminado y lo notifica.
+
+        Args:
+            proc (Proceso): Proceso terminado o pendiente al detener
+        """
+        self._escritores.cerrar(proc.pid)
+        proc.cambiar_estado("Terminado")
+        if self.al_terminar:
+            self.al_terminar(proc)
+
+    def pausar(self):
+        """Pausa la simulación actual."""
+        self.pausa_event.clear()
+        self._despertar.set()
+
+    def reanudar(self):
+        """Reanuda la simulación pausada."""
+        self.pausa_event.set()
+
+    def detener(self):
+        """
+        Detiene la simulación actual.
+
+        El hilo planificador marca como terminados los procesos pendientes
+        (y llama a al_terminar por cada uno) antes de salir.
+        """
+        self.simulacion_activa = False
+        self.pausa_event.set()
+        self._despertar.set()
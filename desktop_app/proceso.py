@@ -16,7 +16,8 @@ from typing import List, Tuple, Optional, Callable
 import threading
 import time
 from datetime import datetime
-from .file_writer import escribir_caracter, crear_archivo_proceso
+from .contenedor import EscritorContenedor, obtener_contenedor
+from .file_writer import EscritorMapeado, EscritorProceso, MODO_BUFFER, MODO_CONTENEDOR, MODO_MMAP, crear_archivo_proceso
 
 @dataclass
 class Proceso:
@@ -38,7 +39,11 @@ class Proceso:
         turnaround (int): Tiempo total desde llegada hasta finalización
         historial (List[Tuple[str, int]]): Historial de estados y duraciones
         callback (Optional[Callable]): Función para logging
-        archivo (Optional[str]): Ruta al archivo de proceso
+        archivo (Optional[str]): Ruta al archivo de proceso (None hasta la primera ejecución)
+        modo_escritura (str): "buffer" (escritor con búfer), "mmap" (archivo
+            preasignado y proyectado en memoria) o "contenedor" (salida anexada
+            al contenedor segmentado, sin archivo propio)
+        catalogo_id (int): Catálogo al que pertenece (clave en el contenedor)
     """
     
     pid: int
@@ -56,6 +61,8 @@ class Proceso:
     historial: List[Tuple[str, int]] = field(default_factory=list)
     callback: Optional[Callable] = None
     archivo: Optional[str] = None
+    modo_escritura: str = MODO_BUFFER
+    catalogo_id: int = 0
     
     def __post_init__(self):
         """
@@ -63,11 +70,46 @@ class Proceso:
         
         - Calcula la ráfaga total basada en la longitud de la descripción
         - Inicializa la ráfaga restante
-        - Crea el archivo del proceso
+        
+        No toca el disco: el archivo del proceso se crea en la primera
+        ejecución (ver preparar_archivo), de modo que listar procesos no
+        tiene coste de E/S.
         """
         self.rafaga_total = len(self.descripcion)
         self.rafaga_restante = self.rafaga_total
-        self.archivo = crear_archivo_proceso(self.pid, self.nombre, self.descripcion)
+        
+    def preparar_archivo(self) -> Optional[str]:
+        """
+        Crea el archivo del proceso si aún no existe.
+        
+        Se crea preasignado en modo mmap; en modo contenedor no hay archivo
+        propio.
+        
+        Returns:
+            Optional[str]: Ruta del archivo, o None en modo contenedor
+        """
+        if self.archivo is None and self.modo_escritura != MODO_CONTENEDOR:
+            self.archivo = crear_archivo_proceso(self.pid, self.nombre, self.descripcion,
+                                                 preasignar=self.modo_escritura == MODO_MMAP)
+        return self.archivo
+        
+    def crear_escritor(self):
+        """
+        Prepara el archivo del proceso y crea el escritor de su modo.
+        
+        Todos los escritores tienen la interfaz escribir/vaciar/cerrar; el
+        texto escrito son los caracteres copiados de la descripción, en orden.
+        
+        Returns:
+            EscritorProceso | EscritorMapeado | EscritorContenedor: Escritor
+                del modo de escritura del proceso
+        """
+        self.preparar_archivo()
+        if self.modo_escritura == MODO_MMAP:
+            return EscritorMapeado(self.archivo, self.descripcion)
+        if self.modo_escritura == MODO_CONTENEDOR:
+            return EscritorContenedor(obtener_contenedor(), self.catalogo_id, self.pid, self.nombre)
+        return EscritorProceso(self.archivo)
         
     def log(self, mensaje: str):
         """
@@ -100,7 +142,7 @@ class Proceso:
             pausa_event (threading.Event): Evento para controlar pausas
             
         El proceso:
-        1. Cambia su estado a "Ejecución"
+        1. Cambia su estado a "Ejecución" y crea su archivo si no existe
         2. Copia cada carácter de la descripción al archivo
         3. Espera TH ms entre cada carácter
         4. Actualiza métricas (ráfaga restante, ejecuciones)
@@ -111,19 +153,22 @@ class Proceso:
         
         self.log(f"Hilo iniciado. Descripción tiene {len(self.descripcion)} caracteres → ráfaga total= TH×{len(self.descripcion)} = {th * len(self.descripcion)}ms")
         
-        for i, char in enumerate(self.descripcion):
-            # Esperar si está pausado
-            pausa_event.wait()
-            
-            # Copiar carácter
-            escribir_caracter(self.archivo, char)
-            self.rafaga_restante -= 1
-            self.num_ejecuciones += 1
-            
-            self.log(f"Copiado carácter {i+1}/{len(self.descripcion)} ('{char}'). Ráfaga restante={self.rafaga_restante * th}ms")
-            
-            # Dormir TH ms
-            time.sleep(th / 1000)
+        with self.crear_escritor() as escritor:
+            for i, char in enumerate(self.descripcion):
+                # Esperar si está pausado (con lo copiado ya escrito en el archivo)
+                if not pausa_event.is_set():
+                    escritor.vaciar()
+                    pausa_event.wait()
+                
+                # Copiar carácter (en modo mmap, en su posición del archivo)
+                escritor.escribir(char)
+                self.rafaga_restante -= 1
+                self.num_ejecuciones += 1
+                
+                self.log(f"Copiado carácter {i+1}/{len(self.descripcion)} ('{char}'). Ráfaga restante={self.rafaga_restante * th}ms")
+                
+                # Dormir TH ms
+                time.sleep(th / 1000)
             
         self.cambiar_estado("Terminado")
         self.t_final = self.num_ejecuciones * th
@@ -6,15 +6,63 @@ operativo, incluyendo su monitoreo y obtención de métricas.
 Características:
 - Monitoreo de procesos del sistema en tiempo real
 - Obtención de métricas (CPU, memoria, estado)
-- Clasificación de procesos por criterios
+- Clasificación de procesos por criterios (selección de los n mayores
+  con un montículo, sin ordenar todos los procesos)
+- Medición de CPU en dos pasadas para no devolver 0.0 en la primera llamada
+- Muestreador en segundo plano con una tabla PID→métricas que se actualiza
+  de forma incremental; las consultas se resuelven sobre su instantánea
+- Lectura directa de /proc en Linux, con psutil como alternativa
+- Series temporales de CPU y memoria por proceso en búferes circulares,
+  para clasificar por media en una ventana, media exponencial o pico
+- Filtros por usuario, nombre y estado sobre índices de la instantánea
+  (ver consulta_procesos)
 - Manejo de errores de acceso y procesos zombis
 """
 
 from dataclasses import dataclass, field
-from typing import List, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
+from operator import itemgetter
+from array import array
+import bisect
+import heapq
+import threading
+import time
 import psutil
 from datetime import datetime
 
+from .consulta_procesos import Filtro, IndiceProcesos, filtrar
+from .procfs import disponible as procfs_disponible
+
+if procfs_disponible():
+    from .procfs import EntradaProc, LectorProc
+else:
+    # Sin /proc (Windows, macOS) todas las muestras son procesos de psutil
+    EntradaProc = LectorProc = None
+
+# Segundos entre las dos pasadas de medición de CPU
+INTERVALO_MUESTREO = 0.1
+# Segundos entre actualizaciones del muestreador en segundo plano
+INTERVALO_TICK = 1.0
+
+# Leer /proc directamente en Linux (psutil queda como alternativa)
+USAR_PROCFS = True
+# Guardar series temporales en el muestreador (sin ellas los criterios con
+# agregado clasifican por la muestra actual)
+GUARDAR_SERIES = True
+# Muestras por proceso en las series temporales (10 min a un tick por segundo)
+CAPACIDAD_SERIE = 600
+# Procesos con serie como máximo; los que llegan con el almacén lleno no se
+# registran hasta que terminen otros
+MAX_PIDS_SERIE = 2000
+# Peso de la muestra nueva en la media móvil exponencial
+ALFA_EWMA = 0.3
+# Segundos considerados por los agregados "media" y "pico"
+VENTANA_SERIE = 60.0
+# Agregados que admiten los criterios de selección ("cpu_media", "memoria_pico"...)
+AGREGADOS = ("media", "ewma", "pico")
+
+_ERRORES_PROCESO = (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess)
+
 @dataclass(frozen=True)
 class ProcesoMeta:
     """
@@ -23,19 +71,21 @@ class ProcesoMeta:
     Attributes:
         pid (int): Identificador del proceso
         nombre (str): Nombre del proceso
-        usuario (str): Usuario que ejecuta el proceso
+        usuario (Optional[str]): Usuario que ejecuta el proceso (None si
+            el sistema deniega el acceso)
         cpu (float): Porcentaje de uso de CPU
         memoria (float): Porcentaje de uso de memoria
         estado (str): Estado actual del proceso
-        tiempo_creacion (str): Fecha y hora de creación del proceso
+        tiempo_creacion (Optional[str]): Fecha y hora de creación del proceso
+            (None si el sistema deniega el acceso)
     """
     pid: int
     nombre: str
-    usuario: str
+    usuario: Optional[str]
     cpu: float
     memoria: float
     estado: str
-    tiempo_creacion: str
+    tiempo_creacion: Optional[str]
 
 @dataclass
 class Proceso:
@@ -105,51 +155,610 @@ class Proceso:
             'historial': self.historial
         }
 
-def listar_procesos(n: int, criterio: str) -> List[ProcesoMeta]:
+class SerieMetricas:
     """
-    Lista los n procesos más activos según el criterio especificado.
+    Búfer circular de muestras de un proceso.
+    
+    Las tres columnas crecen hasta `capacidad` y después se sobrescriben
+    empezando por la muestra más antigua. Los instantes son float64 (a los
+    30 días de funcionamiento un float32 solo distingue cuartos de segundo y
+    a los 200 días, pasos de 2 s: los ticks se confunden y las ventanas
+    dejan de ser exactas);
+    CPU y memoria son float32 (16 bytes por muestra en total).
+    
+    Attributes:
+        capacidad (int): Número máximo de muestras
+        instante (array): Instante de cada muestra
+        cpu (array): Uso de CPU de cada muestra
+        memoria (array): Uso de memoria de cada muestra
+        ewma_cpu (float): Media móvil exponencial de la CPU
+        ewma_memoria (float): Media móvil exponencial de la memoria
+    """
+    
+    __slots__ = ("capacidad", "instante", "cpu", "memoria", "ewma_cpu", "ewma_memoria", "_siguiente")
+    
+    def __init__(self, capacidad: int):
+        """
+        Crea una serie vacía.
+        
+        Args:
+            capacidad (int): Número máximo de muestras
+        """
+        self.capacidad = capacidad
+        self.instante = array('d')
+        self.cpu = array('f')
+        self.memoria = array('f')
+        self.ewma_cpu = 0.0
+        self.ewma_memoria = 0.0
+        self._siguiente = 0  # Posición de la muestra más antigua cuando está llena
+        
+    def __len__(self) -> int:
+        return len(self.instante)
+        
+    def agregar(self, instante: float, cpu: float, memoria: float, alfa: float):
+        """
+        Añade una muestra, descartando la más antigua si la serie está llena.
+        
+        Args:
+            instante (float): Segundos desde el origen del almacén
+            cpu (float): Uso de CPU
+            memoria (float): Uso de memoria
+            alfa (float): Peso de la muestra en la media exponencial
+        """
+        if not self.instante:
+            self.ewma_cpu, self.ewma_memoria = cpu, memoria
+        else:
+            self.ewma_cpu += alfa * (cpu - self.ewma_cpu)
+            self.ewma_memoria += alfa * (memoria - self.ewma_memoria)
+        if len(self.instante) < self.capacidad:
+            self.instante.append(instante)
+            self.cpu.append(cpu)
+            self.memoria.append(memoria)
+        else:
+            i = self._siguiente
+            self.instante[i], self.cpu[i], self.memoria[i] = instante, cpu, memoria
+            self._siguiente = (i + 1) % self.capacidad
+            
+    def ventana(self, columna: array, desde: float) -> List[array]:
+        """
+        Devuelve los tramos de una columna con instante >= desde.
+        
+        El búfer se ve como dos tramos ordenados en el tiempo (del más
+        antiguo al final del arreglo y del principio hasta el más antiguo),
+        así que basta una búsqueda binaria en cada uno.
+        
+        Args:
+            columna (array): self.cpu o self.memoria
+            desde (float): Instante inicial de la ventana
+            
+        Returns:
+            List[array]: Uno o dos tramos de la columna
+        """
+        tramos = []
+        corte = self._siguiente
+        for inicio, fin in ((corte, len(columna)), (0, corte)):
+            if inicio < fin:
+                primero = bisect.bisect_left(self.instante, desde, inicio, fin)
+                if primero < fin:
+                    tramos.append(columna[primero:fin])
+        return tramos
+        
+    def agregado(self, metrica: str, agregado: str, desde: float) -> Optional[float]:
+        """
+        Calcula un agregado de una métrica.
+        
+        Args:
+            metrica (str): "cpu" o "memoria"
+            agregado (str): "media", "ewma" o "pico"
+            desde (float): Instante inicial de la ventana (media y pico)
+            
+        Returns:
+            Optional[float]: Valor, o None si no hay muestras en la ventana
+        """
+        if agregado == "ewma":
+            return (self.ewma_cpu if metrica == "cpu" else self.ewma_memoria) if self.instante else None
+        tramos = self.ventana(self.cpu if metrica == "cpu" else self.memoria, desde)
+        if not tramos:
+            return None
+        if agregado == "pico":
+            return max(max(tramo) for tramo in tramos)
+        return sum(sum(tramo) for tramo in tramos) / sum(len(tramo) for tramo in tramos)
+
+
+class AlmacenSeries:
+    """
+    Series temporales de métricas de todos los procesos muestreados.
+    
+    La memoria está acotada: como mucho `max_pids` series de `capacidad`
+    muestras de 16 bytes (con los valores por defecto, unos 19 MB). Las
+    series de los procesos que terminan se descartan en cada tick y, con el
+    almacén lleno, los procesos nuevos no se registran hasta que haya sitio
+    (se clasifican por su muestra actual).
+    
+    Attributes:
+        capacidad (int): Muestras máximas por proceso
+        max_pids (int): Procesos con serie como máximo
+        alfa (float): Peso de la muestra nueva en la media exponencial
+    """
+    
+    def __init__(self, capacidad: int = CAPACIDAD_SERIE, alfa: float = ALFA_EWMA,
+                 max_pids: int = MAX_PIDS_SERIE):
+        """
+        Crea un almacén vacío.
+        
+        Args:
+            capacidad (int): Muestras máximas por proceso
+            alfa (float): Peso de la muestra nueva en la media exponencial
+            max_pids (int): Procesos con serie como máximo
+            
+        Raises:
+            ValueError: Si la capacidad o max_pids no son positivos o alfa no
+                está en (0, 1]
+        """
+        if capacidad <= 0:
+            raise ValueError("La capacidad de las series debe ser mayor que cero")
+        if max_pids <= 0:
+            raise ValueError("max_pids debe ser mayor que cero")
+        if not 0 < alfa <= 1:
+            raise ValueError("alfa debe estar en el intervalo (0, 1]")
+        self.capacidad = capacidad
+        self.max_pids = max_pids
+        self.alfa = alfa
+        self._origen = time.monotonic()
+        self._series: Dict[int, SerieMetricas] = {}
+        self._lock = threading.Lock()
+        
+    def __len__(self) -> int:
+        return len(self._series)
+        
+    def serie(self, pid: int) -> Optional[SerieMetricas]:
+        """Devuelve la serie de un proceso, si existe."""
+        return self._series.get(pid)
+        
+    def registrar(self, instante: float, muestras: Dict[int, tuple]):
+        """
+        Añade una muestra por proceso y descarta las series de los que terminaron.
+        
+        Args:
+            instante (float): Instante del tick (time.monotonic())
+            muestras (Dict[int, tuple]): PID → (cpu, memoria, pid, proceso)
+        """
+        relativo = instante - self._origen
+        with self._lock:
+            for pid in self._series.keys() - muestras.keys():
+                del self._series[pid]
+            for pid, (cpu, memoria, _, _) in muestras.items():
+                serie = self._series.get(pid)
+                if serie is None:
+                    if len(self._series) >= self.max_pids:
+                        continue
+                    serie = self._series[pid] = SerieMetricas(self.capacidad)
+                serie.agregar(relativo, cpu, memoria, self.alfa)
+                
+    def agregados(self, metrica: str, agregado: str,
+                  ventana: float = VENTANA_SERIE) -> Dict[int, float]:
+        """
+        Calcula un agregado de una métrica para todos los procesos.
+        
+        Args:
+            metrica (str): "cpu" o "memoria"
+            agregado (str): "media", "ewma" o "pico"
+            ventana (float): Segundos hacia atrás considerados (media y pico)
+            
+        Returns:
+            Dict[int, float]: PID → valor (sin los procesos sin muestras en la ventana)
+        """
+        desde = time.monotonic() - self._origen - ventana
+        with self._lock:
+            valores = {pid: serie.agregado(metrica, agregado, desde)
+                       for pid, serie in self._series.items()}
+        return {pid: valor for pid, valor in valores.items() if valor is not None}
+
+
+def _interpretar_criterio(criterio: str) -> Tuple[str, Optional[str]]:
+    """
+    Separa un criterio en métrica y agregado ("cpu_media" → ("cpu", "media")).
+    
+    Raises:
+        ValueError: Si el agregado no es válido
+    """
+    metrica, _, agregado = criterio.lower().partition("_")
+    metrica = "cpu" if metrica == "cpu" else "memoria"
+    if not agregado:
+        return metrica, None
+    if agregado not in AGREGADOS:
+        raise ValueError(f"Agregado no válido: {agregado} (válidos: {', '.join(AGREGADOS)})")
+    return metrica, agregado
+
+
+def _crear_lector() -> Optional["LectorProc"]:
+    """
+    Crea un lector de /proc si está habilitado y disponible.
+    
+    Returns:
+        Optional[LectorProc]: Lector, o None para usar psutil
+    """
+    if not USAR_PROCFS or LectorProc is None:
+        return None
+    try:
+        return LectorProc()
+    except (OSError, ValueError):
+        return None
+
+
+def _muestrear(intervalo: float) -> Iterator[tuple]:
+    """
+    Recorre los procesos del sistema con una medición de CPU en dos pasadas.
+    
+    La primera pasada ceba los contadores de CPU de cada proceso (la primera
+    llamada a cpu_percent siempre devuelve 0.0); tras esperar `intervalo`
+    segundos, la segunda pasada lee el uso de CPU del periodo y la memoria.
+    Solo se generan tuplas ligeras; los metadatos completos se piden después
+    únicamente para los procesos seleccionados.
+    
+    Args:
+        intervalo (float): Segundos entre las dos pasadas (0 = una sola pasada)
+        
+    Yields:
+        Tuple[float, float, int, Process | EntradaProc]: (cpu, memoria, pid, proceso)
+    """
+    lector = _crear_lector()
+    if lector is not None:
+        lector.muestrear()
+        time.sleep(intervalo)
+        yield from lector.muestrear().values()
+        return
+        
+    if intervalo > 0:
+        for proc in psutil.process_iter():
+            try:
+                proc.cpu_percent(None)
+            except _ERRORES_PROCESO:
+                continue
+        time.sleep(intervalo)
+    # process_iter reutiliza los objetos Process de la primera pasada, que
+    # conservan los contadores cebados
+    for proc in psutil.process_iter():
+        try:
+            with proc.oneshot():
+                yield proc.cpu_percent(None), proc.memory_percent(), proc.pid, proc
+        except _ERRORES_PROCESO:
+            continue
+
+
+def _leer_atributo(metodo):
+    """
+    Lee un atributo de un proceso de psutil que puede estar protegido.
     
     Args:
+        metodo (Callable): Método del proceso (p. ej. proc.username)
+        
+    Returns:
+        Valor del atributo, o None si el sistema deniega el acceso
+        
+    Raises:
+        psutil.NoSuchProcess: Si el proceso ya terminó
+    """
+    try:
+        return metodo()
+    except psutil.AccessDenied:
+        return None
+
+
+def _crear_meta(proc, cpu: float, memoria: float) -> Optional[ProcesoMeta]:
+    """
+    Construye los metadatos completos de un proceso ya medido.
+    
+    Los atributos protegidos (usuario y fecha de creación en procesos de
+    otros usuarios en Windows y macOS) quedan en None en lugar de descartar
+    un proceso que sí se pudo medir.
+    
+    Args:
+        proc (Process | EntradaProc): Proceso de psutil o entrada de /proc
+        cpu (float): Uso de CPU medido
+        memoria (float): Uso de memoria medido
+        
+    Returns:
+        Optional[ProcesoMeta]: Metadatos, o None si el proceso ya terminó
+    """
+    if EntradaProc is not None and isinstance(proc, EntradaProc):
+        return ProcesoMeta(
+            pid=proc.pid,
+            nombre=proc.nombre,
+            usuario=proc.usuario,
+            cpu=cpu,
+            memoria=memoria,
+            estado=proc.estado,
+            tiempo_creacion=proc.tiempo_creacion
+        )
+    try:
+        with proc.oneshot():
+            creacion = _leer_atributo(proc.create_time)
+            return ProcesoMeta(
+                pid=proc.pid,
+                nombre=_leer_atributo(proc.name) or str(proc.pid),
+                usuario=_leer_atributo(proc.username),
+                cpu=cpu,
+                memoria=memoria,
+                estado=_leer_atributo(proc.status) or "desconocido",
+                tiempo_creacion=(datetime.fromtimestamp(creacion).strftime('%Y-%m-%d %H:%M:%S')
+                                 if creacion is not None else None)
+            )
+    except psutil.NoSuchProcess:  # Incluye ZombieProcess
+        return None
+
+
+def _seleccionar(muestras, n: int, criterio: str,
+                 agregados: Optional[Dict[int, float]] = None) -> List[ProcesoMeta]:
+    """
+    Selecciona los n procesos mayores de un flujo de muestras.
+    
+    Args:
+        muestras (Iterable): Tuplas (cpu, memoria, pid, proceso)
         n (int): Número de procesos a recuperar
-        criterio (str): Criterio de ordenamiento ("cpu" o "memoria")
+        criterio (str): Criterio de ordenamiento ("cpu", "memoria" o con
+            agregado, p. ej. "cpu_media")
+        agregados (Optional[Dict[int, float]]): Valor agregado por PID; los
+            procesos sin valor usan la muestra actual
         
     Returns:
-        List[ProcesoMeta]: Lista de objetos ProcesoMeta ordenados por el criterio
+        List[ProcesoMeta]: Procesos seleccionados, de mayor a menor
         
     Raises:
         ValueError: Si n es mayor que el total de procesos disponibles
-        
-    El proceso:
-    1. Obtiene información de todos los procesos del sistema
-    2. Filtra procesos inaccesibles o zombis
-    3. Ordena por el criterio especificado
-    4. Retorna los n primeros procesos
     """
-    procesos = []
-    for proc in psutil.process_iter(['pid', 'name', 'username', 'cpu_percent', 'memory_percent', 'status', 'create_time']):
-        try:
-            info = proc.info
-            create_time = datetime.fromtimestamp(info['create_time']).strftime('%Y-%m-%d %H:%M:%S')
-            
-            procesos.append(ProcesoMeta(
-                pid=info['pid'],
-                nombre=info['name'],
-                usuario=info['username'],
-                cpu=info['cpu_percent'],
-                memoria=info['memory_percent'],
-                estado=info['status'],
-                tiempo_creacion=create_time
-            ))
-        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
-            continue
-            
-    # Ordenar por criterio
-    key = 'cpu' if criterio.lower() == "cpu" else 'memoria'
-    procesos.sort(key=lambda x: getattr(x, key), reverse=True)
+    total_procesos = 0
+    
+    def contar(muestras):
+        nonlocal total_procesos
+        for muestra in muestras:
+            total_procesos += 1
+            yield muestra
+    
+    metrica, _ = _interpretar_criterio(criterio)
+    actual = itemgetter(0 if metrica == "cpu" else 1)
+    if agregados:
+        clave = lambda muestra: agregados.get(muestra[2], actual(muestra))
+    else:
+        clave = actual
+    ganadores = heapq.nlargest(n, contar(muestras), key=clave)
     
     # Verificar n
-    total_procesos = len(procesos)
     if n > total_procesos:
         raise ValueError(f"Se solicitaron {n} procesos pero solo hay {total_procesos} disponibles")
         
-    return procesos[:n] 
\ No newline at end of file
+    procesos = (_crear_meta(proc, cpu, memoria) for cpu, memoria, _, proc in ganadores)
+    return [meta for meta in procesos if meta is not None]
+
+
+class MuestreadorProcesos:
+    """
+    Servicio en segundo plano que mantiene las métricas de todos los procesos.
+    
+    En cada tick compara los PID del sistema con su tabla: ceba los
+    contadores de los procesos nuevos, descarta los que terminaron y
+    refresca CPU y memoria del resto. Las consultas trabajan sobre la última
+    instantánea publicada, sin recorrer los procesos del sistema.
+    
+    Attributes:
+        intervalo (float): Segundos entre ticks
+        series (Optional[AlmacenSeries]): Historial de métricas de cada
+            proceso (None si está desactivado)
+    """
+    
+    def __init__(self, intervalo: float = INTERVALO_TICK, series: Optional[AlmacenSeries] = None,
+                 guardar_series: bool = GUARDAR_SERIES):
+        """
+        Inicializa el muestreador (sin arrancarlo).
+        
+        Args:
+            intervalo (float): Segundos entre ticks
+            series (Optional[AlmacenSeries]): Almacén de series (uno nuevo si no se indica)
+            guardar_series (bool): Si es False no se guarda historial y los
+                criterios con agregado usan la muestra actual
+            
+        Raises:
+            ValueError: Si el intervalo no es positivo
+        """
+        if intervalo <= 0:
+            raise ValueError("El intervalo de muestreo debe ser mayor que cero")
+        self.intervalo = intervalo
+        if series is None and guardar_series:
+            series = AlmacenSeries()
+        self.series = series
+        self._procesos: Dict[int, psutil.Process] = {}
+        self._lector = _crear_lector()
+        # (instante, muestras): se reemplaza entera en cada tick
+        self._instantanea: Optional[Tuple[float, Dict[int, tuple]]] = None
+        # Índices de la instantánea actual, creados con la primera consulta filtrada
+        self._indice: Optional[Tuple[Dict[int, tuple], IndiceProcesos]] = None
+        self._indice_lock = threading.Lock()
+        self._lista = threading.Event()
+        self._detener = threading.Event()
+        self._hilo: Optional[threading.Thread] = None
+        
+    @property
+    def activo(self) -> bool:
+        """Indica si el hilo de muestreo está en marcha."""
+        return self._hilo is not None and self._hilo.is_alive()
+        
+    def actualizar(self):
+        """
+        Ejecuta un tick: sincroniza la tabla de PID y publica una instantánea.
+        
+        Los procesos nuevos tienen CPU 0.0 hasta el tick siguiente, salvo en
+        el primero, que espera INTERVALO_MUESTREO tras cebar los contadores.
+        """
+        if self._lector is not None:
+            muestras = self._lector.muestrear()
+            if self._instantanea is None:
+                time.sleep(INTERVALO_MUESTREO)
+                muestras = self._lector.muestrear()
+        else:
+            muestras = self._muestrear_psutil()
+        instante = time.monotonic()
+        if self.series is not None:
+            self.series.registrar(instante, muestras)
+        self._instantanea = (instante, muestras)
+        self._lista.set()
+        
+    def _muestrear_psutil(self) -> Dict[int, tuple]:
+        """Tick con psutil: sincroniza la tabla de objetos Process y los mide."""
+        pids = set(psutil.pids())
+        for pid in self._procesos.keys() - pids:
+            del self._procesos[pid]
+        for pid in pids - self._procesos.keys():
+            try:
+                proc = psutil.Process(pid)
+                proc.cpu_percent(None)
+            except _ERRORES_PROCESO:
+                continue
+            self._procesos[pid] = proc
+        if self._instantanea is None:
+            time.sleep(INTERVALO_MUESTREO)
+            
+        muestras = {}
+        for pid, proc in list(self._procesos.items()):
+            try:
+                with proc.oneshot():
+                    muestras[pid] = (proc.cpu_percent(None), proc.memory_percent(), pid, proc)
+            except _ERRORES_PROCESO:
+                del self._procesos[pid]
+        return muestras
+        
+    def _ejecutar(self):
+        """Bucle del hilo de muestreo."""
+        self.actualizar()
+        while not self._detener.wait(self.intervalo):
+            self.actualizar()
+            
+    def iniciar(self):
+        """Arranca el hilo de muestreo si no está en marcha."""
+        if self.activo:
+            return
+        self._detener.clear()
+        self._hilo = threading.Thread(target=self._ejecutar, daemon=True)
+        self._hilo.start()
+        
+    def detener(self):
+        """Detiene el hilo de muestreo (la última instantánea se conserva)."""
+        self._detener.set()
+        if self._hilo is not None:
+            self._hilo.join()
+            self._hilo = None
+            
+    def edad(self) -> float:
+        """
+        Devuelve la antigüedad de la última instantánea.
+        
+        Returns:
+            float: Segundos desde el último tick (infinito si aún no hay)
+        """
+        if self._instantanea is None:
+            return float("inf")
+        return time.monotonic() - self._instantanea[0]
+        
+    def _indice_de(self, muestras: Dict[int, tuple]) -> IndiceProcesos:
+        """Devuelve los índices de una instantánea, construyéndolos una sola vez."""
+        with self._indice_lock:
+            if self._indice is None or self._indice[0] is not muestras:
+                self._indice = (muestras, IndiceProcesos(muestras))
+            return self._indice[1]
+            
+    def listar(self, n: int, criterio: str, ventana: float = VENTANA_SERIE,
+               filtro: Optional[Filtro] = None) -> Tuple[List[ProcesoMeta], float]:
+        """
+        Lista los n procesos más activos de la última instantánea.
+        
+        Si todavía no hay instantánea, espera a que termine el primer tick.
+        Los criterios con agregado ("cpu_media", "memoria_ewma",
+        "cpu_pico"...) clasifican con las series temporales, o con la
+        muestra actual si el historial está desactivado.
+        
+        Args:
+            n (int): Número de procesos a recuperar
+            criterio (str): Criterio de ordenamiento ("cpu", "memoria" o con agregado)
+            ventana (float): Segundos considerados por "media" y "pico"
+            filtro (Optional[Filtro]): Restringe la selección (usuario, nombre, estado...)
+            
+        Returns:
+            Tuple[List[ProcesoMeta], float]: Procesos y antigüedad de la
+                instantánea en segundos
+            
+        Raises:
+            ValueError: Si n es mayor que el total de procesos disponibles
+        """
+        metrica, agregado = _interpretar_criterio(criterio)
+        self._lista.wait()
+        instante, muestras = self._instantanea
+        agregados = None
+        if agregado and self.series is not None:
+            agregados = self.series.agregados(metrica, agregado, ventana)
+        seleccion = muestras.values()
+        if filtro is not None:
+            seleccion = filtrar(muestras, self._indice_de(muestras), filtro)
+        return _seleccionar(seleccion, n, criterio, agregados), time.monotonic() - instante
+
+
+_muestreador: Optional[MuestreadorProcesos] = None
+_muestreador_lock = threading.Lock()
+
+
+def obtener_muestreador(intervalo: float = INTERVALO_TICK) -> MuestreadorProcesos:
+    """
+    Devuelve el muestreador compartido, creándolo la primera vez.
+    
+    Args:
+        intervalo (float): Segundos entre ticks (solo al crearlo)
+        
+    Returns:
+        MuestreadorProcesos: Muestreador compartido (puede no estar iniciado)
+    """
+    global _muestreador
+    with _muestreador_lock:
+        if _muestreador is None:
+            _muestreador = MuestreadorProcesos(intervalo)
+        return _muestreador
+
+
+def listar_procesos(n: int, criterio: str, intervalo: float = INTERVALO_MUESTREO,
+                    filtro: Optional[Filtro] = None) -> Tuple[List[ProcesoMeta], float]:
+    """
+    Lista los n procesos más activos según el criterio especificado.
+    
+    Si el muestreador compartido está en marcha, la consulta se resuelve
+    sobre su instantánea; si no, se miden los procesos en el momento y los
+    criterios con agregado usan esa única muestra.
+    
+    Args:
+        n (int): Número de procesos a recuperar
+        criterio (str): Criterio de ordenamiento ("cpu", "memoria" o con
+            agregado: "cpu_media", "memoria_ewma", "cpu_pico"...)
+        intervalo (float): Segundos entre las dos pasadas de medición de CPU
+            (sin muestreador)
+        filtro (Optional[Filtro]): Restringe la selección, p. ej.
+            Usuario("root") & NombreCoincide("python*") & ~Estado("zombie")
+        
+    Returns:
+        Tuple[List[ProcesoMeta], float]: Lista de objetos ProcesoMeta ordenados
+            por el criterio y antigüedad de la muestra en segundos (0.0 si se
+            midió en el momento)
+        
+    Raises:
+        ValueError: Si n es mayor que el total de procesos disponibles
+        
+    El proceso:
+    1. Mide CPU (en dos pasadas) y memoria de todos los procesos del sistema,
+       o toma la instantánea del muestreador
+    2. Filtra procesos inaccesibles o zombis
+    3. Selecciona los n mayores con un montículo, sin ordenar la lista completa
+    4. Crea ProcesoMeta solo para los seleccionados
+    """
+    muestreador = _muestreador
+    if muestreador is not None and muestreador.activo:
+        return muestreador.listar(n, criterio, filtro=filtro)
+    muestras = _muestrear(intervalo)
+    if filtro is not None:
+        muestras = {muestra[2]: muestra for muestra in muestras}
+        muestras = filtrar(muestras, IndiceProcesos(muestras), filtro)
+    return _seleccionar(muestras, n, criterio), 0.0
@@ -0,0 +1,226 @@
+"""
+Lectura directa de /proc para enumerar procesos en Linux.
+Este módulo obtiene las mismas métricas que psutil (CPU, memoria, estado,
+usuario y fecha de creación) leyendo /proc/[pid]/stat y /proc/stat en
+bloque, sin crear un objeto psutil.Process por proceso.
+
+Características:
+- Una lectura de /proc/[pid]/stat por proceso y tick
+- /proc/[pid]/status (UID real) y, si el nombre está truncado,
+  /proc/[pid]/cmdline solo se leen la primera vez que aparece un PID
+- Caché uid → nombre de usuario
+- CPU% calculado con la diferencia de jiffies entre dos lecturas, con la
+  misma escala que psutil (100% = un núcleo completo)
+- La fecha de creación se formatea solo cuando se pide
+- process_manager vuelve a psutil si /proc no está disponible (el módulo
+  se puede importar en Windows, pero disponible() devuelve False)
+"""
+
+import os
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+
+try:
+    import pwd
+except ImportError:  # Windows
+    pwd = None
+
+# Estados de /proc/[pid]/stat con los nombres que usa psutil
+ESTADOS = {
+    "R": "running",
+    "S": "sleeping",
+    "D": "disk-sleep",
+    "Z": "zombie",
+    "T": "stopped",
+    "t": "tracing-stop",
+    "X": "dead",
+    "x": "dead",
+    "I": "idle",
+    "P": "parked",
+    "W": "waking",
+    "K": "wake-kill",
+}
+
+
+def disponible(raiz: str = "/proc") -> bool:
+    """
+    Indica si se puede usar el lector de /proc en este sistema.
+
+    Args:
+        raiz (str): Punto de montaje de procfs
+
+    Returns:
+        bool: True en Linux con /proc montado
+    """
+    if pwd is None:
+        return False
+    return os.path.exists(os.path.join(raiz, "stat")) and os.path.exists(os.path.join(raiz, "meminfo"))
+
+
+class EntradaProc:
+    """
+    Datos de un proceso leídos de /proc.
+
+    Attributes:
+        pid (int): Identificador del proceso
+        nombre (str): Nombre del ejecutable (campo comm)
+        usuario (str): Usuario real del proceso
+        estado (str): Estado en el último tick
+        inicio (float): Fecha de creación (segundos desde la época)
+    """
+
+    __slots__ = ("pid", "nombre", "usuario", "estado", "inicio", "_arranque", "_jiffies",
+                 "_tiempo_creacion")
+
+    def __init__(self, pid: int, nombre: str, usuario: str, arranque: int, inicio: float):
+        self.pid = pid
+        self.nombre = nombre
+        self.usuario = usuario
+        self.estado = ""
+        self.inicio = inicio
+        self._arranque = arranque  # starttime en jiffies: distingue PID reutilizados
+        self._jiffies: Optional[int] = None
+        self._tiempo_creacion: Optional[str] = None
+
+    @property
+    def tiempo_creacion(self) -> str:
+        """Fecha de creación formateada (se calcula la primera vez que se pide)."""
+        if self._tiempo_creacion is None:
+            self._tiempo_creacion = datetime.fromtimestamp(self.inicio).strftime('%Y-%m-%d %H:%M:%S')
+        return self._tiempo_creacion
+
+
+class LectorProc:
+    """
+    Enumera procesos y calcula sus métricas leyendo /proc.
+
+    Conserva entre lecturas los jiffies de cada proceso y los totales de
+    /proc/stat, de modo que cada llamada a muestrear() devuelve el uso de
+    CPU desde la llamada anterior (0.0 para los procesos nuevos).
+
+    Attributes:
+        raiz (str): Punto de montaje de procfs
+    """
+
+    def __init__(self, raiz: str = "/proc"):
+        """
+        Lee los datos fijos del sistema (arranque, memoria total, núcleos).
+
+        Args:
+            raiz (str): Punto de montaje de procfs
+
+        Raises:
+            OSError: Si /proc no se puede leer
+        """
+        self.raiz = raiz
+        self._hz = os.sysconf("SC_CLK_TCK")
+        self._tam_pagina = os.sysconf("SC_PAGE_SIZE")
+        self._num_cpus = os.cpu_count() or 1
+        self._memoria_total = self._leer_memoria_total()
+        self._arranque_sistema = self._leer_stat_sistema()[1]
+        self._total_anterior: Optional[int] = None
+        self._entradas: Dict[int, EntradaProc] = {}
+        self._usuarios: Dict[int, str] = {}
+
+    def _leer_memoria_total(self) -> int:
+        """Devuelve MemTotal de /proc/meminfo en bytes."""
+        with open(os.path.join(self.raiz, "meminfo"), "rb") as f:
+            for linea in f:
+                if linea.startswith(b"MemTotal:"):
+                    return int(linea.split()[1]) * 1024
+        raise OSError("MemTotal no encontrado en /proc/meminfo")
+
+    def _leer_stat_sistema(self) -> Tuple[int, int]:
+        """Devuelve (jiffies totales de todas las CPU, fecha de arranque)."""
+        total = arranque = 0
+        with open(os.path.join(self.raiz, "stat"), "rb") as f:
+            for linea in f:
+                if linea.startswith(b"cpu "):
+                    # guest y guest_nice ya están incluidos en user y nice
+                    total = sum(int(x) for x in linea.split()[1:9])
+                elif linea.startswith(b"btime "):
+                    arranque = int(linea.split()[1])
+        return total, arranque
+
+    def _usuario(self, uid: int) -> str:
+        """Resuelve un UID a nombre de usuario, con caché."""
+        nombre = self._usuarios.get(uid)
+        if nombre is None:
+            try:
+                nombre = pwd.getpwuid(uid).pw_name
+            except KeyError:
+                nombre = str(uid)
+            self._usuarios[uid] = nombre
+        return nombre
+
+    def _uid_real(self, pid: int) -> int:
+        """Lee el UID real de /proc/[pid]/status."""
+        with open(os.path.join(self.raiz, str(pid), "status"), "rb") as f:
+            for linea in f:
+                if linea.startswith(b"Uid:"):
+                    return int(linea.split()[1])
+        raise OSError(f"Uid no encontrado para el proceso {pid}")
+
+    def _nombre_completo(self, pid: int, comm: str) -> str:
+        """
+        Recupera el nombre completo de un proceso cuyo comm está truncado.
+
+        El kernel corta comm a 15 caracteres; como psutil, se toma el nombre
+        del ejecutable de la línea de comandos si empieza igual.
+        """
+        try:
+            with open(os.path.join(self.raiz, str(pid), "cmdline"), "rb") as f:
+                argv0 = f.read().split(b"\0", 1)[0].decode("utf-8", "replace")
+        except OSError:
+            return comm
+        nombre = os.path.basename(argv0)
+        return nombre if nombre.startswith(comm) else comm
+
+    def muestrear(self) -> Dict[int, Tuple[float, float, int, EntradaProc]]:
+        """
+        Lee todos los procesos y calcula su uso de CPU y memoria.
+
+        Returns:
+            Dict[int, tuple]: PID → (cpu, memoria, pid, entrada), el mismo
+                formato que las muestras de psutil en process_manager
+        """
+        total, _ = self._leer_stat_sistema()
+        # Jiffies transcurridos por núcleo: la escala de cpu_percent de psutil
+        transcurrido = None
+        if self._total_anterior is not None and total > self._total_anterior:
+            transcurrido = (total - self._total_anterior) / self._num_cpus
+        self._total_anterior = total
+
+        muestras = {}
+        entradas = {}
+        for nombre in os.listdir(self.raiz):
+            if not nombre.isdigit():
+                continue
+            pid = int(nombre)
+            try:
+                with open(os.path.join(self.raiz, nombre, "stat"), "rb") as f:
+                    stat = f.read()
+                # comm puede contener espacios y paréntesis: cortar en el último ')'
+                cierre = stat.rindex(b")")
+                campos = stat[cierre + 2:].split()
+                arranque = int(campos[19])
+                entrada = self._entradas.get(pid)
+                if entrada is None or entrada._arranque != arranque:
+                    comm = stat[stat.index(b"(") + 1:cierre].decode("utf-8", "replace")
+                    if len(comm) >= 15:
+                        comm = self._nombre_completo(pid, comm)
+                    entrada = EntradaProc(pid, comm, self._usuario(self._uid_real(pid)), arranque,
+                                          self._arranque_sistema + arranque / self._hz)
+            except (OSError, ValueError, IndexError):
+                continue  # El proceso terminó mientras se leía
+            jiffies = int(campos[11]) + int(campos[12])
+            cpu = 0.0
+            if transcurrido and entrada._jiffies is not None:
+                cpu = round((jiffies - entrada._jiffies) / transcurrido * 100, 1)
+            entrada._jiffies = jiffies
+            entrada.estado = ESTADOS.get(campos[0].decode(), campos[0].decode())
+            memoria = int(campos[21]) * self._tam_pagina / self._memoria_total * 100
+            entradas[pid] = entrada
+            muestras[pid] = (cpu, memoria, pid, entrada)
+        self._entradas = entradas
+        return muestras
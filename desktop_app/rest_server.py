@@ -8,18 +8,40 @@ Características:
 - Manejo automático de puertos disponibles
 - Actualización en tiempo real del estado de procesos
 - Integración con el catálogo de procesos
+- Respuesta en caché por versión, con ETag y respuestas 304 Not Modified
+- Negociación de contenido (Accept): XML, JSON o binario compacto
+- XML en streaming (respuesta fragmentada) para catálogos grandes, con
+  memoria constante independientemente del número de procesos
+- Canal de cambios en /procesos/stream (Server-Sent Events) alimentado por
+  actualizar_procesos y por los hilos de simulación (actualizar_proceso)
+- Los cambios de actualizar_proceso se agrupan: se aplican (una copia de
+  la lista y una versión nueva por lote) cada INTERVALO_AGRUPACION segundos
+  o antes de responder una petición, no con cada carácter copiado
+- Sincronización incremental: /procesos?since=N devuelve solo los cambios
+  posteriores a la versión N, a partir de un registro de cambios acotado
+- Consultas sobre /procesos: proyección de campos (fields=), paginación por
+  PID (limit/cursor) y filtros por prioridad, usuario y estado, resueltos
+  con un índice en memoria del catálogo publicado
 """
 
-from fastapi import FastAPI, HTTPException
-from fastapi.responses import Response
-import xml.etree.ElementTree as ET
-from typing import List, Dict, Any
+from fastapi import FastAPI, HTTPException, Header, Query, Request
+from fastapi.responses import Response, StreamingResponse
+from xml.sax.saxutils import escape
+from typing import List, Dict, Any, AsyncIterator, Iterator, Optional, Tuple
+import asyncio
+import bisect
+import hashlib
+import json
 import uvicorn
 import threading
 import socket
 import time
 import psutil
+from .canal_cambios import (CanalCambios, EVENTO_ACTUALIZADO, EVENTO_AGREGADO, EVENTO_CATALOGO,
+                            EVENTO_ELIMINADO)
 from .catalog import Catalogo
+from .indice_catalogo import IndiceCatalogo
+from models.formato_procesos import CODIFICADORES, TIPO_JSON, TIPO_XML, elegir_tipo
 
 app = FastAPI()
 
@@ -30,6 +52,54 @@ catalogo_actual: Dict = {
     'nombre': 'Catálogo Principal'
 }
 
+# Versión de procesos_actuales: aumenta en cada llamada a actualizar_procesos
+# y en cada lote de cambios de actualizar_proceso. El prefijo distingue
+# ejecuciones del servidor, que empiezan en la versión 0.
+_prefijo_etag = format(time.time_ns(), 'x')
+_version = 0
+# Tipo de contenido → (versión, ETag, cuerpo) de la última respuesta construida
+_cache_respuestas: Dict[str, Tuple[int, str, bytes]] = {}
+_lock_procesos = threading.Lock()
+# PID → posición en procesos_actuales['procesos']
+_indice_pid: Dict[int, int] = {}
+# Índices por PID, prioridad, usuario y estado de procesos_actuales['procesos']
+_indice_catalogo = IndiceCatalogo([])
+# Clientes de /procesos/stream
+_canal = CanalCambios()
+# Cambios que se conservan para /procesos?since=N
+LIMITE_REGISTRO_CAMBIOS = 10000
+# Cambios que se descartan de una vez cuando el registro se llena
+DESCARTE_REGISTRO_CAMBIOS = LIMITE_REGISTRO_CAMBIOS // 10
+# (versión, tipo, pid, datos) de los últimos cambios, en orden de versión
+_registro_cambios: List[Tuple[int, str, int, Dict[str, Any]]] = []
+# Versión de cada cambio de _registro_cambios, para buscarla con bisect
+_versiones_registro: List[int] = []
+# Versión desde la que el registro está completo: since=N se puede
+# responder con cambios si N >= _version_base_registro
+_version_base_registro = 0
+# Segundos sin cambios tras los que se envía un comentario para mantener viva la conexión
+INTERVALO_KEEPALIVE = 15.0
+# Segundos máximos que un cambio de actualizar_proceso espera a aplicarse
+INTERVALO_AGRUPACION = 0.05
+# PID → campos cambiados por actualizar_proceso pendientes de aplicar
+_cambios_pendientes: Dict[int, Dict[str, Any]] = {}
+# Temporizador que aplicará los cambios pendientes
+_temporizador_pendientes: Optional[threading.Timer] = None
+
+# A partir de este número de procesos el XML se envía en streaming en lugar
+# de guardarse completo en caché
+UMBRAL_STREAMING_XML = 1000
+# Caracteres acumulados antes de enviar cada fragmento del XML en streaming
+TAM_FRAGMENTO_XML = 64 * 1024
+
+# Campos de cada <proceso>, en orden, antes del historial
+_CAMPOS_XML = ('pid', 'nombre', 'usuario', 'descripcion', 'prioridad', 'estado', 't_llegada',
+               't_final', 'rafaga_total', 'rafaga_restante', 'num_ejecuciones', 'turnaround')
+# Campos que se pueden pedir con ?fields=
+CAMPOS_PROCESO = _CAMPOS_XML + ('historial',)
+# Máximo de procesos por página con ?limit=
+LIMITE_PAGINA_MAX = 1000
+
 def encontrar_puerto_disponible(puerto_inicial: int = 8000, max_intentos: int = 20) -> int:
     """
     Busca un puerto disponible en el sistema.
@@ -84,17 +154,438 @@ def actualizar_procesos(procesos: Dict[str, Any], catalogo_id: int, catalogo_nom
         catalogo_id (int): ID del catálogo actual
         catalogo_nombre (str): Nombre del catálogo actual
     """
+    global _version, _version_base_registro, _indice_catalogo
+    # Copiar el historial: las respuestas en caché deben corresponder a esta versión
+    procesos = [dict(proc, historial=list(proc['historial'])) for proc in procesos]
+    with _lock_procesos:
+        # Los cambios pendientes quedan en el registro antes que la lista nueva
+        _aplicar_pendientes()
+        anteriores = procesos_actuales.get('procesos')
+        mismo_catalogo = anteriores is not None and procesos_actuales.get('catalogo_id') == catalogo_id
+        procesos_actuales['procesos'] = procesos
+        procesos_actuales['catalogo_id'] = catalogo_id
+        procesos_actuales['catalogo_nombre'] = catalogo_nombre
+        _indice_pid.clear()
+        _indice_pid.update((proc['pid'], i) for i, proc in enumerate(procesos))
+        _indice_catalogo = IndiceCatalogo(procesos)
+        _version += 1
+        if not mismo_catalogo:
+            # Los cambios anteriores no sirven para reconstruir otro catálogo
+            _registro_cambios.clear()
+            _versiones_registro.clear()
+            _version_base_registro = _version
+            _canal.catalogo_reemplazado()
+            return
+        # Mismo catálogo: publicar solo las diferencias por PID
+        previos = {proc['pid']: proc for proc in anteriores}
+        for proc in procesos:
+            previo = previos.pop(proc['pid'], None)
+            if previo is None:
+                _registrar_cambio(EVENTO_AGREGADO, proc['pid'], proc)
+            else:
+                campos = {k: v for k, v in proc.items() if previo.get(k) != v}
+                if campos:
+                    _registrar_cambio(EVENTO_ACTUALIZADO, proc['pid'], campos)
+        for pid in previos:
+            _registrar_cambio(EVENTO_ELIMINADO, pid, {})
+
+def _registrar_cambio(tipo: str, pid: int, datos: Dict[str, Any]):
+    """
+    Anota un cambio en el registro y lo publica en el canal de cambios.
+    
+    Debe llamarse con _lock_procesos tomado y después de aumentar _version.
+    
+    Args:
+        tipo (str): EVENTO_AGREGADO, EVENTO_ACTUALIZADO o EVENTO_ELIMINADO
+        pid (int): Proceso afectado
+        datos (Dict[str, Any]): Proceso completo (agregado) o campos cambiados
+    """
+    global _version_base_registro
+    if len(_registro_cambios) >= LIMITE_REGISTRO_CAMBIOS:
+        # Se descartan los más antiguos en bloque (borrar el primero de una
+        # lista es O(n)); ya no se puede responder desde antes del último descartado
+        corte = max(1, DESCARTE_REGISTRO_CAMBIOS)
+        _version_base_registro = _versiones_registro[corte - 1]
+        del _registro_cambios[:corte]
+        del _versiones_registro[:corte]
+    _registro_cambios.append((_version, tipo, pid, datos))
+    _versiones_registro.append(_version)
+    _canal.publicar(tipo, _version, pid, datos)
+
+def actualizar_proceso(pid: int, **campos):
+    """
+    Anota cambios de un proceso del catálogo publicado.
+    
+    Pensado para los hilos de simulación (estado, rafaga_restante, t_final...),
+    que llaman con cada carácter copiado. Los cambios se funden por PID y se
+    aplican en lote (ver _aplicar_pendientes) como mucho INTERVALO_AGRUPACION
+    segundos después, o antes si llega una petición. Si el proceso no está
+    publicado, no hace nada.
+    
+    Args:
+        pid (int): PID del proceso
+        **campos: Campos a modificar
+    """
+    global _temporizador_pendientes
+    with _lock_procesos:
+        if pid not in _indice_pid:
+            return
+        _cambios_pendientes.setdefault(pid, {}).update(campos)
+        if _temporizador_pendientes is None:
+            _temporizador_pendientes = threading.Timer(INTERVALO_AGRUPACION, _vaciar_pendientes)
+            _temporizador_pendientes.daemon = True
+            _temporizador_pendientes.start()
+
+def _vaciar_pendientes():
+    """Aplica los cambios pendientes (temporizador de actualizar_proceso)."""
+    global _temporizador_pendientes
+    with _lock_procesos:
+        _temporizador_pendientes = None
+        _aplicar_pendientes()
+
+def _aplicar_pendientes():
+    """
+    Aplica los cambios pendientes de actualizar_proceso como una sola versión.
+    
+    Debe llamarse con _lock_procesos tomado. La lista de procesos se
+    reemplaza por una copia, nunca se modifica, de modo que las respuestas
+    en curso no ven cambios a medias; la copia se hace una vez por lote. Los
+    valores que no cambian se descartan y, si no queda ninguno, la versión
+    no aumenta.
+    """
+    global _version
+    if not _cambios_pendientes:
+        return
+    procesos = procesos_actuales['procesos']
+    aplicados = []
+    for pid, campos in _cambios_pendientes.items():
+        posicion = _indice_pid.get(pid)
+        if posicion is None:
+            continue  # Eliminado por actualizar_procesos
+        cambios = {k: v for k, v in campos.items() if procesos[posicion].get(k) != v}
+        if cambios:
+            aplicados.append((pid, posicion, cambios))
+    _cambios_pendientes.clear()
+    if not aplicados:
+        return
+    procesos = list(procesos)
+    for pid, posicion, cambios in aplicados:
+        _indice_catalogo.actualizar(pid, procesos[posicion], cambios)
+        procesos[posicion] = dict(procesos[posicion], **cambios)
     procesos_actuales['procesos'] = procesos
-    procesos_actuales['catalogo_id'] = catalogo_id
-    procesos_actuales['catalogo_nombre'] = catalogo_nombre
+    _version += 1
+    for pid, _, cambios in aplicados:
+        _registrar_cambio(EVENTO_ACTUALIZADO, pid, cambios)
+
+def _elemento_xml(etiqueta: str, valor: Any) -> str:
+    """Serializa un valor como elemento de texto (vacío si es None o "")."""
+    texto = '' if valor is None else escape(str(valor))
+    return f'<{etiqueta}>{texto}</{etiqueta}>' if texto else f'<{etiqueta} />'
+
+def _proceso_xml(proc: Dict[str, Any]) -> str:
+    """
+    Serializa un proceso como elemento <proceso>, escapando sus textos.
+    
+    Los campos None o vacíos (t_final, turnaround, usuario sin acceso) y el
+    historial sin eventos se escriben como elementos vacíos, igual que con
+    ElementTree.
+    
+    Args:
+        proc (Dict[str, Any]): Proceso a serializar
+        
+    Returns:
+        str: Elemento XML del proceso
+    """
+    partes = ['<proceso>']
+    for campo in _CAMPOS_XML:
+        partes.append(_elemento_xml(campo, proc[campo]))
+    if not proc['historial']:
+        partes.append('<historial /></proceso>')
+        return ''.join(partes)
+    partes.append('<historial>')
+    for estado, duracion in proc['historial']:
+        partes.append(f'<evento>{_elemento_xml("estado", estado)}<duracion>{duracion}</duracion></evento>')
+    partes.append('</historial></proceso>')
+    return ''.join(partes)
+
+def _fragmentos_xml(procesos: List[Dict[str, Any]]) -> Iterator[bytes]:
+    """
+    Genera el documento <procesos> por fragmentos.
+    
+    Cada proceso se serializa al llegar a él y se envía cuando el
+    fragmento acumulado supera TAM_FRAGMENTO_XML, por lo que la memoria
+    usada no depende del número de procesos.
+    
+    Args:
+        procesos (List[Dict[str, Any]]): Procesos a serializar
+        
+    Yields:
+        bytes: Fragmentos consecutivos del XML en UTF-8
+    """
+    partes = ['<procesos>']
+    tam = 0
+    for proc in procesos:
+        texto = _proceso_xml(proc)
+        partes.append(texto)
+        tam += len(texto)
+        if tam >= TAM_FRAGMENTO_XML:
+            yield ''.join(partes).encode('utf-8')
+            partes = []
+            tam = 0
+    partes.append('</procesos>')
+    yield ''.join(partes).encode('utf-8')
+
+def _construir_xml(procesos: List[Dict[str, Any]]) -> bytes:
+    """
+    Serializa la lista de procesos a XML.
+    
+    Args:
+        procesos (List[Dict[str, Any]]): Procesos a serializar
+        
+    Returns:
+        bytes: XML en UTF-8
+    """
+    return b''.join(_fragmentos_xml(procesos))
+
+# Serializadores de cada representación de /procesos
+_SERIALIZADORES = dict(CODIFICADORES, **{TIPO_XML: _construir_xml})
+# Sufijo del ETag de cada representación (los ETag deben diferir entre ellas)
+_SUFIJOS_ETAG = {tipo: tipo.rsplit('/', 1)[1] for tipo in _SERIALIZADORES}
+
+def _etag(version: int, tipo: str, consulta: Optional[str] = None) -> str:
+    """
+    Devuelve el ETag de una versión de los procesos en una representación.
+    
+    Args:
+        version (int): Versión de los procesos
+        tipo (str): Tipo de contenido
+        consulta (Optional[str]): Consulta normalizada (ver _normalizar_consulta);
+            cada consulta tiene su propio ETag
+        
+    Returns:
+        str: ETag entre comillas
+    """
+    if consulta is None:
+        return f'"{_prefijo_etag}-{version}-{_SUFIJOS_ETAG[tipo]}"'
+    resumen = hashlib.sha1(consulta.encode('utf-8')).hexdigest()[:16]
+    return f'"{_prefijo_etag}-{version}-{_SUFIJOS_ETAG[tipo]}-{resumen}"'
+
+def _normalizar_consulta(campos: Optional[Tuple[str, ...]], filtros: Dict[str, Any],
+                         cursor: Optional[int], limite: Optional[int]) -> str:
+    """
+    Representa una consulta de forma canónica para su ETag.
+    
+    Los filtros se ordenan por nombre (el orden de los parámetros de la URL
+    no cambia la respuesta); los campos conservan el orden pedido, que sí
+    cambia el JSON.
+    
+    Returns:
+        str: Consulta normalizada
+    """
+    return json.dumps([campos, sorted(filtros.items()), cursor, limite], ensure_ascii=False)
+
+def _respuesta_actual(tipo: str) -> Tuple[str, bytes]:
+    """
+    Devuelve el ETag y el cuerpo de la versión actual en una representación,
+    serializándolo solo si la versión cambió.
+    
+    Args:
+        tipo (str): Tipo de contenido (XML, JSON o binario)
+        
+    Returns:
+        Tuple[str, bytes]: (ETag, cuerpo)
+    """
+    with _lock_procesos:
+        _aplicar_pendientes()
+        cache = _cache_respuestas.get(tipo)
+        if cache is None or cache[0] != _version:
+            etag = _etag(_version, tipo)
+            cuerpo = _SERIALIZADORES[tipo](procesos_actuales.get('procesos', []))
+            cache = _cache_respuestas[tipo] = (_version, etag, cuerpo)
+        return cache[1], cache[2]
+
+def _campos_solicitados(fields: Optional[str]) -> Optional[Tuple[str, ...]]:
+    """
+    Interpreta el parámetro fields= (campos separados por comas).
+    
+    Returns:
+        Optional[Tuple[str, ...]]: Campos en el orden pedido, o None si no se pidió proyección
+        
+    Raises:
+        HTTPException: 400 si algún campo no existe
+    """
+    if fields is None:
+        return None
+    campos = tuple(dict.fromkeys(c.strip() for c in fields.split(',') if c.strip()))
+    desconocidos = [c for c in campos if c not in CAMPOS_PROCESO]
+    if not campos or desconocidos:
+        raise HTTPException(status_code=400,
+                            detail=f"Campos no válidos: {', '.join(desconocidos) or fields!r}")
+    return campos
+
+def _proyectar(proc: Dict[str, Any], campos: Optional[Tuple[str, ...]]) -> Dict[str, Any]:
+    """Devuelve solo los campos pedidos de un proceso (todos si campos es None)."""
+    if campos is None:
+        return proc
+    return {campo: proc[campo] for campo in campos if campo in proc}
+
+def _consultar(campos: Optional[Tuple[str, ...]], filtros: Dict[str, Any],
+               cursor: Optional[int], limite: Optional[int]) -> Tuple[int, Dict[str, Any]]:
+    """
+    Selecciona una página de procesos con el índice del catálogo.
+    
+    Args:
+        campos (Optional[Tuple[str, ...]]): Campos a devolver (None = todos)
+        filtros (Dict[str, Any]): Campo de CAMPOS_INDEXADOS → valor exigido
+        cursor (Optional[int]): Último PID de la página anterior
+        limite (Optional[int]): Procesos por página (None = todos)
+        
+    Returns:
+        Tuple[int, Dict[str, Any]]: (versión, {"version", "catalogo_id",
+            "procesos", "siguiente"}); "siguiente" es el cursor de la página
+            siguiente, o None en la última
+    """
+    with _lock_procesos:
+        _aplicar_pendientes()
+        procesos = procesos_actuales.get('procesos', [])
+        pids, siguiente = _indice_catalogo.pagina(filtros, cursor, limite)
+        pagina = [_proyectar(procesos[_indice_pid[pid]], campos) for pid in pids]
+        return _version, {
+            'version': _version,
+            'catalogo_id': procesos_actuales.get('catalogo_id'),
+            'procesos': pagina,
+            'siguiente': siguiente,
+        }
+
+def _cambios_desde(since: int, instancia: Optional[str],
+                   campos: Optional[Tuple[str, ...]] = None) -> Dict[str, Any]:
+    """
+    Calcula los cambios posteriores a una versión.
+    
+    Los cambios de un mismo PID se funden: un proceso agregado y luego
+    actualizado aparece como insertado con sus valores finales. Si la
+    versión ya no está en el registro (o es de otra ejecución del
+    servidor) se devuelve el catálogo completo.
+    
+    Args:
+        since (int): Última versión que tiene el cliente
+        instancia (Optional[str]): Instancia del servidor de esa versión
+        campos (Optional[Tuple[str, ...]]): Campos a devolver (None = todos);
+            las actualizaciones que no tocan ninguno se omiten
+        
+    Returns:
+        Dict[str, Any]: {"instancia", "version", "catalogo_id",
+            "catalogo_nombre", "completo"} más "procesos" (completo) o
+            "insertados", "actualizados" y "eliminados" (incremental)
+    """
+    with _lock_procesos:
+        _aplicar_pendientes()
+        respuesta = {
+            'instancia': _prefijo_etag,
+            'version': _version,
+            'catalogo_id': procesos_actuales.get('catalogo_id'),
+            'catalogo_nombre': procesos_actuales.get('catalogo_nombre'),
+        }
+        if (instancia is not None and instancia != _prefijo_etag) or not _version_base_registro <= since <= _version:
+            respuesta['completo'] = True
+            respuesta['procesos'] = [_proyectar(proc, campos)
+                                     for proc in procesos_actuales.get('procesos', [])]
+            return respuesta
+        # Una actualización del catálogo anota varios cambios con la misma
+        # versión; solo se copian los posteriores a since
+        inicio = bisect.bisect_right(_versiones_registro, since)
+        cambios = _registro_cambios[inicio:]
+    # PID → ['insertado' | 'actualizado' | 'eliminado', datos]
+    netos: Dict[int, list] = {}
+    for _, tipo, pid, datos in cambios:
+        neto = netos.get(pid)
+        if tipo == EVENTO_ACTUALIZADO and neto is not None and neto[0] != 'eliminado':
+            neto[1] = dict(neto[1], **datos)
+        elif tipo == EVENTO_AGREGADO:
+            netos[pid] = ['insertado', datos]
+        elif tipo == EVENTO_ACTUALIZADO:
+            netos[pid] = ['actualizado', datos]
+        else:
+            netos[pid] = ['eliminado', None]
+    respuesta['completo'] = False
+    respuesta['insertados'] = [_proyectar(datos, campos)
+                               for tipo, datos in netos.values() if tipo == 'insertado']
+    respuesta['actualizados'] = [{'pid': pid, 'campos': _proyectar(datos, campos)}
+                                 for pid, (tipo, datos) in netos.items()
+                                 if tipo == 'actualizado' and _proyectar(datos, campos)]
+    respuesta['eliminados'] = [pid for pid, (tipo, _) in netos.items() if tipo == 'eliminado']
+    return respuesta
+
+def _coincide_etag(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Comprueba si la cabecera If-None-Match incluye el ETag actual.
+    
+    Args:
+        if_none_match (Optional[str]): Valor de la cabecera (lista separada por comas o "*")
+        etag (str): ETag actual
+        
+    Returns:
+        bool: True si el cliente ya tiene esta versión
+    """
+    if not if_none_match:
+        return False
+    etiquetas = [e.strip() for e in if_none_match.split(',')]
+    # La comparación débil ignora el prefijo W/
+    return '*' in etiquetas or etag in (e[2:] if e.startswith('W/') else e for e in etiquetas)
 
 @app.get("/procesos")
-def obtener_procesos():
+def obtener_procesos(if_none_match: Optional[str] = Header(None),
+                     accept: Optional[str] = Header(None),
+                     stream: bool = False,
+                     since: Optional[int] = None,
+                     instancia: Optional[str] = None,
+                     fields: Optional[str] = None,
+                     limit: Optional[int] = Query(None, ge=1, le=LIMITE_PAGINA_MAX),
+                     cursor: Optional[int] = None,
+                     prioridad: Optional[int] = None,
+                     usuario: Optional[str] = None,
+                     estado: Optional[str] = None):
     """
-    Endpoint para obtener la lista de procesos en formato XML.
+    Endpoint para obtener la lista de procesos.
+    
+    La representación se elige con la cabecera Accept: XML (por defecto),
+    JSON (application/json) o binario (application/x-procesos, ver
+    models.formato_procesos). Cada representación se serializa una vez por
+    versión de los procesos. La respuesta lleva un ETag; si la petición
+    trae If-None-Match con ese ETag se responde 304 Not Modified sin cuerpo.
+    
+    El XML de los catálogos con UMBRAL_STREAMING_XML procesos o más (o
+    cualquiera con ?stream=true) no se guarda en caché: se genera proceso a
+    proceso en una respuesta fragmentada.
     
+    Con ?since=N la respuesta es siempre JSON y contiene solo los cambios
+    posteriores a la versión N (ver _cambios_desde), o el catálogo completo
+    con "completo": true si N ya no está en el registro de cambios.
+    
+    Con fields=, limit, cursor, prioridad, usuario o estado la respuesta es
+    JSON con una página de procesos en orden de PID (ver _consultar): solo
+    los campos pedidos, que cumplan los filtros y con PID mayor que cursor.
+    El campo "siguiente" de la respuesta es el cursor de la página siguiente.
+    fields= también se aplica a los cambios de ?since=N.
+    
+    Args:
+        if_none_match (Optional[str]): Cabecera If-None-Match
+        accept (Optional[str]): Cabecera Accept
+        stream (bool): Forzar el XML en streaming
+        since (Optional[int]): Versión que ya tiene el cliente
+        instancia (Optional[str]): Instancia del servidor de esa versión
+        fields (Optional[str]): Campos a devolver, separados por comas
+        limit (Optional[int]): Procesos por página (máximo LIMITE_PAGINA_MAX)
+        cursor (Optional[int]): Último PID de la página anterior
+        prioridad (Optional[int]): Filtrar por prioridad
+        usuario (Optional[str]): Filtrar por usuario
+        estado (Optional[str]): Filtrar por estado
+        
     Returns:
-        Response: Respuesta HTTP con el XML de procesos
+        Response: Respuesta HTTP con los procesos (o 304)
+        
+    Raises:
+        HTTPException: 400 si fields= contiene campos desconocidos
         
     El XML generado tiene la siguiente estructura:
     <procesos>
@@ -120,31 +611,99 @@ def obtener_procesos():
         </proceso>
     </procesos>
     """
-    root = ET.Element("procesos")
-    
-    for proc in procesos_actuales.get('procesos', []):
-        proceso = ET.SubElement(root, "proceso")
-        ET.SubElement(proceso, "pid").text = str(proc['pid'])
-        ET.SubElement(proceso, "nombre").text = proc['nombre']
-        ET.SubElement(proceso, "usuario").text = proc['usuario']
-        ET.SubElement(proceso, "descripcion").text = proc['descripcion']
-        ET.SubElement(proceso, "prioridad").text = str(proc['prioridad'])
-        ET.SubElement(proceso, "estado").text = proc['estado']
-        ET.SubElement(proceso, "t_llegada").text = str(proc['t_llegada'])
-        ET.SubElement(proceso, "t_final").text = str(proc['t_final'])
-        ET.SubElement(proceso, "rafaga_total").text = str(proc['rafaga_total'])
-        ET.SubElement(proceso, "rafaga_restante").text = str(proc['rafaga_restante'])
-        ET.SubElement(proceso, "num_ejecuciones").text = str(proc['num_ejecuciones'])
-        ET.SubElement(proceso, "turnaround").text = str(proc['turnaround'])
-        
-        historial = ET.SubElement(proceso, "historial")
-        for estado, duracion in proc['historial']:
-            evento = ET.SubElement(historial, "evento")
-            ET.SubElement(evento, "estado").text = estado
-            ET.SubElement(evento, "duracion").text = str(duracion)
-    
-    xml_str = ET.tostring(root, encoding='unicode')
-    return Response(content=xml_str, media_type="application/xml")
+    campos = _campos_solicitados(fields)
+    if since is not None:
+        return Response(content=json.dumps(_cambios_desde(since, instancia, campos), ensure_ascii=False),
+                        media_type="application/json", headers={'Cache-Control': 'no-cache'})
+        
+    filtros = {campo: valor for campo, valor in
+               (('prioridad', prioridad), ('usuario', usuario), ('estado', estado))
+               if valor is not None}
+    if campos is not None or filtros or limit is not None or cursor is not None:
+        version, pagina = _consultar(campos, filtros, cursor, limit)
+        # El ETag identifica la versión y la consulta: un If-None-Match de
+        # otra página u otros filtros no debe responderse con 304
+        etag = _etag(version, TIPO_JSON, _normalizar_consulta(campos, filtros, cursor, limit))
+        cabeceras = {'ETag': etag, 'Cache-Control': 'no-cache'}
+        if _coincide_etag(if_none_match, cabeceras['ETag']):
+            return Response(status_code=304, headers=cabeceras)
+        return Response(content=json.dumps(pagina, ensure_ascii=False),
+                        media_type=TIPO_JSON, headers=cabeceras)
+        
+    tipo = elegir_tipo(accept or '')
+    if tipo == TIPO_XML:
+        with _lock_procesos:
+            _aplicar_pendientes()
+            version = _version
+            # La lista se reemplaza en cada versión, nunca se modifica
+            procesos = procesos_actuales.get('procesos', [])
+        if stream or len(procesos) >= UMBRAL_STREAMING_XML:
+            cabeceras = {'ETag': _etag(version, tipo), 'Cache-Control': 'no-cache', 'Vary': 'Accept'}
+            if _coincide_etag(if_none_match, cabeceras['ETag']):
+                return Response(status_code=304, headers=cabeceras)
+            return StreamingResponse(_fragmentos_xml(procesos), media_type=tipo, headers=cabeceras)
+            
+    etag, cuerpo = _respuesta_actual(tipo)
+    cabeceras = {'ETag': etag, 'Cache-Control': 'no-cache', 'Vary': 'Accept'}
+    if _coincide_etag(if_none_match, etag):
+        return Response(status_code=304, headers=cabeceras)
+    return Response(content=cuerpo, media_type=tipo, headers=cabeceras)
+
+def _evento_sse(tipo: str, version: int, datos: Dict[str, Any]) -> str:
+    """Da formato Server-Sent Events a un evento."""
+    return f"event: {tipo}\nid: {version}\ndata: {json.dumps(datos, ensure_ascii=False)}\n\n"
+
+@app.get("/procesos/stream")
+async def stream_procesos(request: Request):
+    """
+    Canal de cambios de los procesos en formato Server-Sent Events.
+    
+    El primer evento (y cualquier resincronización) es "catalogo", con el
+    catálogo completo; después llegan "agregado" (proceso completo),
+    "actualizado" (solo los campos cambiados) y "eliminado". El id de cada
+    evento es la versión del catálogo tras el cambio. Los cambios de un
+    mismo PID que el cliente aún no recibió se funden en uno.
+    
+    Args:
+        request (Request): Petición (para detectar la desconexión)
+        
+    Returns:
+        StreamingResponse: Flujo text/event-stream
+    """
+    suscriptor = _canal.suscribir(asyncio.get_running_loop())
+    
+    async def eventos() -> AsyncIterator[str]:
+        try:
+            while not await request.is_disconnected():
+                if not await suscriptor.esperar(INTERVALO_KEEPALIVE):
+                    yield ": keepalive\n\n"
+                    continue
+                resincronizar, cambios = suscriptor.tomar()
+                partes = []
+                if resincronizar:
+                    with _lock_procesos:
+                        _aplicar_pendientes()
+                        datos = {
+                            'catalogo_id': procesos_actuales.get('catalogo_id'),
+                            'catalogo_nombre': procesos_actuales.get('catalogo_nombre'),
+                            'procesos': procesos_actuales.get('procesos', []),
+                        }
+                        version = _version
+                    partes.append(_evento_sse(EVENTO_CATALOGO, version, datos))
+                for tipo, version, pid, datos in cambios:
+                    if tipo == EVENTO_AGREGADO:
+                        datos = {'pid': pid, 'proceso': datos}
+                    elif tipo == EVENTO_ACTUALIZADO:
+                        datos = {'pid': pid, 'campos': datos}
+                    else:
+                        datos = {'pid': pid}
+                    partes.append(_evento_sse(tipo, version, datos))
+                yield ''.join(partes)
+        finally:
+            _canal.desuscribir(suscriptor)
+            
+    return StreamingResponse(eventos(), media_type="text/event-stream",
+                             headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
 
 def iniciar_servidor():
     """
@@ -9,50 +9,151 @@ Características:
 - Soporte para pausar/reanudar/detener
 - Logging detallado de eventos
 - Manejo de colas de procesos
+- Política de planificación intercambiable (models.politicas)
+- Varios núcleos con colas de listos propias y robo de trabajo opcional
+- Instantáneas binarias del estado y puntos de control periódicos
+- Copia de la descripción de cada proceso a su archivo (o al contenedor),
+  porción a porción, con el escritor de su modo (Proceso.crear_escritor)
 - Cálculo de métricas de rendimiento
 """
 
 from collections import deque
+from dataclasses import dataclass, field
+from operator import attrgetter
+import os
 import threading
 import time
-from typing import List, Callable, Optional
+from typing import List, Callable, Optional, Deque
 from datetime import datetime
+from models.instantanea import EscritorInstantanea, LectorInstantanea, elemento
+from models.politicas import PoliticaPlanificacion, crear_politica
+from .file_writer import GestorEscritores
 from .proceso import Proceso
 
+_TIPO_INSTANTANEA = b"DSK2"
+_ESTADOS = ("Listo", "Ejecución", "Terminado")
+
+@dataclass
+class Nucleo:
+    """
+    Núcleo de CPU simulado con su propia cola de listos.
+    
+    Attributes:
+        id (int): Número de núcleo
+        cola_listos (PoliticaPlanificacion): Cola de listos del núcleo
+        cola_ejecucion (Deque[Proceso]): Proceso en ejecución en el núcleo
+        tiempo_ocupado (int): Tiempo total ejecutando procesos
+        robos (int): Procesos robados a otros núcleos
+        porcion (Optional[int]): Duración de la porción en curso (None si
+            el núcleo no tiene ninguna)
+        fin_porcion (int): Tiempo global en que termina la porción en curso
+    """
+    id: int
+    cola_listos: PoliticaPlanificacion
+    cola_ejecucion: Deque[Proceso] = field(default_factory=deque)
+    tiempo_ocupado: int = 0
+    robos: int = 0
+    porcion: Optional[int] = None
+    fin_porcion: int = 0
+    
+    def to_dict(self, tiempo_global: int) -> dict:
+        """
+        Convierte el estado del núcleo a un diccionario.
+        
+        Args:
+            tiempo_global (int): Tiempo actual de la simulación
+            
+        Returns:
+            dict: Proceso en ejecución, tamaño de la cola y utilización
+        """
+        return {
+            'id': self.id,
+            'en_ejecucion': self.cola_ejecucion[0].pid if self.cola_ejecucion else None,
+            'procesos_en_cola': len(self.cola_listos),
+            'tiempo_ocupado': self.tiempo_ocupado,
+            'utilizacion': self.tiempo_ocupado / tiempo_global if tiempo_global else 0.0,
+            'robos': self.robos
+        }
+
 class Simulador:
     """
     Simulador de procesos usando el algoritmo Round Robin.
     
+    Con varios núcleos, cada uno tiene su propia cola de listos y los
+    procesos se reparten entre ellos al iniciar. Cada núcleo avanza por su
+    cuenta: el reloj global salta al final de la porción que termine antes
+    y solo los núcleos cuya porción acaba en ese instante toman el
+    siguiente proceso (o lo roban, si su cola está vacía). Así ningún
+    núcleo espera a que termine la porción más larga de los demás.
+    
     Attributes:
         th (int): Tiempo de espera entre ejecuciones (en milisegundos)
         quantum (int): Tiempo de quantum para cada proceso
-        cola_listos (deque): Cola de procesos listos para ejecutar
-        cola_ejecucion (deque): Cola de procesos en ejecución
+        politica (str): Nombre de la política de planificación
+        n_cpus (int): Número de núcleos simulados
+        robo_trabajo (bool): Si un núcleo ocioso puede tomar procesos de otro
+        nucleos (List[Nucleo]): Núcleos con sus colas de listos y de ejecución
         cola_terminados (list): Lista de procesos terminados
         tiempo_global (int): Tiempo actual de la simulación
         pausa_event (Event): Evento para controlar pausas
         simulacion_activa (bool): Estado de la simulación
         callback (Optional[Callable]): Función para logging
+        ruta_punto_control (Optional[str]): Archivo donde se guardan los puntos de control
+        intervalo_punto_control (float): Segundos mínimos entre puntos de control
     """
     
-    def __init__(self, th: int, quantum: int):
+    def __init__(self, th: int, quantum: int, politica: str = 'round_robin',
+                 n_cpus: int = 1, robo_trabajo: bool = False,
+                 ruta_punto_control: Optional[str] = None,
+                 intervalo_punto_control: float = 5.0):
         """
         Inicializa el simulador.
         
         Args:
             th (int): Tiempo de espera entre ejecuciones (ms)
             quantum (int): Tiempo de quantum para cada proceso
+            politica (str): Política de planificación (ver models.politicas.POLITICAS)
+            n_cpus (int): Número de núcleos simulados
+            robo_trabajo (bool): Permitir que un núcleo ocioso robe procesos
+            ruta_punto_control (Optional[str]): Si se indica, se guarda ahí una
+                instantánea como mucho cada `intervalo_punto_control` segundos
+            intervalo_punto_control (float): Segundos mínimos entre puntos de control
+            
+        Raises:
+            ValueError: Si la política no existe, el quantum no es positivo
+                o n_cpus es menor que 1
         """
+        if n_cpus < 1:
+            raise ValueError("El número de CPUs debe ser al menos 1")
         self.th = th
         self.quantum = quantum
-        self.cola_listos = deque()
-        self.cola_ejecucion = deque()
+        self.politica = politica
+        self.n_cpus = n_cpus
+        self.robo_trabajo = robo_trabajo
+        self.nucleos = [
+            Nucleo(i, crear_politica(
+                politica,
+                clave_restante=attrgetter('rafaga_restante'),
+                clave_prioridad=attrgetter('prioridad'),
+                clave_id=attrgetter('pid'),
+                quantum=quantum
+            ))
+            for i in range(n_cpus)
+        ]
         self.cola_terminados = []
         self.tiempo_global = 0
         self.pausa_event = threading.Event()
         self.pausa_event.set()
         self.simulacion_activa = False
         self.callback: Optional[Callable] = None
+        self.ruta_punto_control = ruta_punto_control
+        self.intervalo_punto_control = intervalo_punto_control
+        self._ultimo_punto_control = 0.0
+        # Protege las colas mientras se aplica un evento (ver snapshot)
+        self._lock_estado = threading.Lock()
+        # Escritores de los archivos de proceso; solo los usa el hilo de simulación
+        self._escritores = GestorEscritores()
+        self._con_escritor = set()
         
     def log(self, mensaje: str):
         """
@@ -64,108 +165,237 @@ class Simulador:
         if self.callback:
             timestamp = datetime.now().strftime('%H:%M:%S.%f')[:-3]
             self.callback(f"[{timestamp}] {mensaje}")
+            
+    def _log_nucleo(self, nucleo: Nucleo, mensaje: str):
+        """Registra un mensaje indicando el núcleo si hay más de uno."""
+        self.log(f"[CPU {nucleo.id}] {mensaje}" if self.n_cpus > 1 else mensaje)
         
     def iniciar(self, procesos: List[Proceso], callback: Optional[Callable] = None):
         """
         Inicia la simulación con la lista de procesos.
         
+        Los procesos se reparten entre los núcleos en orden circular.
+        
         Args:
             procesos (List[Proceso]): Lista de procesos a simular
             callback (Optional[Callable]): Función para logging
         """
         self.callback = callback
-        self.cola_listos = deque(procesos)
-        self.cola_ejecucion.clear()
+        for nucleo in self.nucleos:
+            nucleo.cola_listos.reiniciar()
+            nucleo.cola_ejecucion.clear()
+            nucleo.tiempo_ocupado = 0
+            nucleo.robos = 0
+            nucleo.porcion = None
         self.cola_terminados.clear()
         self.tiempo_global = 0
         self.simulacion_activa = True
         
-        # Configurar callback para cada proceso
-        for proc in self.cola_listos:
+        # Configurar callback, tiempos de llegada y núcleo de cada proceso
+        for i, proc in enumerate(procesos):
             proc.callback = callback
-            
-        # Configurar tiempos de llegada
-        for i, proc in enumerate(self.cola_listos):
             proc.t_llegada = i
+            self.nucleos[i % self.n_cpus].cola_listos.agregar(proc)
             
         self.log(f"Simulación iniciada con {len(procesos)} procesos")
-        self.log(f"TH={self.th}ms, Quantum={self.quantum}ms")
+        self.log(f"TH={self.th}ms, Quantum={self.quantum}ms, Política={self.politica}")
+        if self.n_cpus > 1:
+            self.log(f"CPUs={self.n_cpus}, Robo de trabajo={'sí' if self.robo_trabajo else 'no'}")
         
         # Iniciar hilo de simulación
+        self._ultimo_punto_control = time.monotonic()
+        threading.Thread(target=self._ejecutar_simulacion, daemon=True).start()
+        
+    def continuar(self, callback: Optional[Callable] = None):
+        """
+        Continúa una simulación reconstruida con `restaurar`.
+        
+        Args:
+            callback (Optional[Callable]): Función para logging
+        """
+        self.callback = callback
+        for proc in self._procesos():
+            proc.callback = callback
+        self.simulacion_activa = True
+        self.log(f"Simulación restaurada en t={self.tiempo_global}ms")
+        self._ultimo_punto_control = time.monotonic()
         threading.Thread(target=self._ejecutar_simulacion, daemon=True).start()
         
+    def _robar_proceso(self, nucleo: Nucleo) -> Optional[Proceso]:
+        """
+        Toma un proceso de la cola más larga de otro núcleo.
+        
+        Args:
+            nucleo (Nucleo): Núcleo ocioso
+            
+        Returns:
+            Optional[Proceso]: Proceso robado, o None si no hay ninguno
+        """
+        victima = max(self.nucleos, key=lambda n: len(n.cola_listos))
+        if victima is nucleo or not victima.cola_listos:
+            return None
+        proceso = victima.cola_listos.siguiente()
+        victima.cola_listos.olvidar(proceso)
+        nucleo.robos += 1
+        self._log_nucleo(nucleo, f"Roba {proceso.nombre} (PID: {proceso.pid}) de CPU {victima.id}")
+        return proceso
+        
+    def _asignar_cpu(self, nucleo: Nucleo):
+        """
+        Mueve un proceso de listos a ejecución en el núcleo si está libre.
+        
+        Args:
+            nucleo (Nucleo): Núcleo a ocupar
+        """
+        if nucleo.cola_ejecucion:
+            return
+        if nucleo.cola_listos:
+            proceso = nucleo.cola_listos.siguiente()
+        elif self.robo_trabajo:
+            proceso = self._robar_proceso(nucleo)
+            if proceso is None:
+                return
+        else:
+            return
+        proceso.cambiar_estado("Ejecución")
+        proceso.num_ejecuciones += 1
+        nucleo.cola_ejecucion.append(proceso)
+        
+        self._log_nucleo(nucleo, f"CPU asignada a {proceso.nombre} (PID: {proceso.pid})")
+        self._log_nucleo(nucleo, f"  - Ráfaga restante: {proceso.rafaga_restante * self.th}ms")
+        
+    def _iniciar_porcion(self, nucleo: Nucleo):
+        """
+        Empieza una porción en el núcleo si no tiene ninguna en curso.
+        
+        Un núcleo libre toma el siguiente proceso de su cola (o roba uno);
+        un proceso no expulsivo que sigue en ejecución recibe otra porción.
+        
+        Args:
+            nucleo (Nucleo): Núcleo a ocupar
+        """
+        if nucleo.porcion is not None:
+            return
+        self._asignar_cpu(nucleo)
+        if nucleo.cola_ejecucion:
+            proceso = nucleo.cola_ejecucion[0]
+            nucleo.porcion = min(nucleo.cola_listos.porcion(proceso, self.quantum), proceso.rafaga_restante)
+            nucleo.fin_porcion = self.tiempo_global + nucleo.porcion
+            
     def _ejecutar_simulacion(self):
         """
         Ejecuta la simulación en un hilo separado.
         
-        En cada iteración:
+        En cada iteración (evento):
         1. Verifica si la simulación está pausada
-        2. Mueve procesos de listos a ejecución si hay espacio
-        3. Ejecuta el quantum del proceso actual
-        4. Maneja la terminación o interrupción del proceso
-        5. Actualiza el tiempo global
-        6. Verifica si la simulación ha terminado
+        2. Empieza una porción en cada núcleo que no tenga una en curso
+           (los núcleos ociosos roban trabajo en este momento)
+        3. Espera hasta la porción que termine antes
+        4. Avanza el reloj global hasta ese instante y completa las porciones
+           que terminan en él (copiando sus caracteres al archivo); las demás
+           siguen en curso
+        5. Verifica si la simulación ha terminado
+        6. Guarda un punto de control si pasó el intervalo configurado
+        
+        Al salir (fin o detención) se cierran los archivos de proceso.
         """
         while self.simulacion_activa:
-            self.pausa_event.wait()  # Esperar si está pausado
-            
-            # Mover proceso de listos a ejecución si hay espacio
-            if self.cola_listos and not self.cola_ejecucion:
-                proceso = self.cola_listos.popleft()
-                proceso.cambiar_estado("Ejecución")
-                proceso.num_ejecuciones += 1
-                self.cola_ejecucion.append(proceso)
-                
-                self.log(f"CPU asignada a {proceso.nombre} (PID: {proceso.pid})")
-                self.log(f"  - Ráfaga restante: {proceso.rafaga_restante * self.th}ms")
-                
-            # Ejecutar quantum
-            if self.cola_ejecucion:
-                proceso = self.cola_ejecucion[0]
-                tiempo_ejecutado = min(self.quantum, proceso.rafaga_restante)
-                
-                # Simular ejecución
-                time.sleep(tiempo_ejecutado * self.th / 1000)
-                proceso.rafaga_restante -= tiempo_ejecutado
-                proceso.historial.append(("Ejecución", tiempo_ejecutado))
-                
-                self.log(f"Quantum completado para {proceso.nombre} (PID: {proceso.pid})")
-                self.log(f"  - Tiempo ejecutado: {tiempo_ejecutado * self.th}ms")
-                self.log(f"  - Ráfaga restante: {proceso.rafaga_restante * self.th}ms")
-                
-                # Verificar si terminó
-                if proceso.rafaga_restante <= 0:
-                    proceso.cambiar_estado("Terminado")
-                    proceso.t_final = self.tiempo_global + tiempo_ejecutado
-                    proceso.turnaround = proceso.t_final - proceso.t_llegada
-                    self.cola_terminados.append(proceso)
-                    self.cola_ejecucion.popleft()
-                    
-                    self.log(f"Proceso {proceso.nombre} (PID: {proceso.pid}) ha terminado")
-                    self.log(f"  - Tiempo final: {proceso.t_final}ms")
-                    self.log(f"  - Turnaround: {proceso.turnaround}ms")
-                else:
-                    # Reinsertar según prioridad
-                    self.cola_ejecucion.popleft()
-                    if proceso.prioridad == 0:  # Expulsivo
-                        proceso.cambiar_estado("Listo")
-                        self.cola_listos.append(proceso)
-                        self.log(f"Proceso {proceso.nombre} (PID: {proceso.pid}) vuelve a cola de listos (Expulsivo)")
-                    else:  # No expulsivo
-                        self.cola_ejecucion.append(proceso)
-                        self.log(f"Proceso {proceso.nombre} (PID: {proceso.pid}) continúa en ejecución (No Expulsivo)")
-                    
-            self.tiempo_global += tiempo_ejecutado
+            if not self.pausa_event.is_set():
+                # Dejar lo copiado en los archivos mientras dure la pausa
+                self._escritores.vaciar_todos()
+                self.pausa_event.wait()
+            
+            with self._lock_estado:
+                for nucleo in self.nucleos:
+                    self._iniciar_porcion(nucleo)
+                ocupados = [n for n in self.nucleos if n.porcion is not None]
+                siguiente_evento = min((n.fin_porcion for n in ocupados), default=self.tiempo_global)
+                espera = siguiente_evento - self.tiempo_global
             
+            # Simular ejecución (los núcleos trabajan en paralelo)
+            time.sleep(espera * self.th / 1000)
+            
+            with self._lock_estado:
+                self.tiempo_global = siguiente_evento
+                for nucleo in ocupados:
+                    if nucleo.fin_porcion == siguiente_evento:
+                        self._completar_porcion(nucleo)
+                
             self.log(f"Tiempo global: {self.tiempo_global}ms")
             
             # Verificar si terminó la simulación
-            if not self.cola_listos and not self.cola_ejecucion:
+            if not any(n.cola_listos or n.cola_ejecucion for n in self.nucleos):
                 self.simulacion_activa = False
                 self.log("Simulación completada")
                 self.log(f"Procesos terminados: {len(self.cola_terminados)}")
                 self.log(f"Tiempo total: {self.tiempo_global}ms")
+                if self.ruta_punto_control and os.path.exists(self.ruta_punto_control):
+                    os.remove(self.ruta_punto_control)
+            elif (self.ruta_punto_control and
+                  time.monotonic() - self._ultimo_punto_control >= self.intervalo_punto_control):
+                self.guardar_punto_control()
+        self._escritores.cerrar_todos()
+        self._con_escritor.clear()
                     
+    def _copiar(self, proceso: Proceso, tiempo_ejecutado: int):
+        """
+        Copia al archivo del proceso los caracteres de la porción ejecutada.
+        
+        El archivo se crea en la primera porción del proceso (preparar_archivo).
+        Si la simulación se restauró de un punto de control, antes se
+        escribe lo que ya se había copiado.
+        
+        Args:
+            proceso (Proceso): Proceso que ejecutó la porción
+            tiempo_ejecutado (int): Caracteres copiados en la porción
+        """
+        inicio = proceso.rafaga_total - proceso.rafaga_restante
+        if proceso.pid not in self._con_escritor:
+            self._escritores.registrar(proceso.pid, proceso.crear_escritor())
+            self._con_escritor.add(proceso.pid)
+            if inicio:
+                self._escritores.escribir(proceso.pid, proceso.descripcion[:inicio])
+        self._escritores.escribir(proceso.pid, proceso.descripcion[inicio:inicio + tiempo_ejecutado])
+                    
+    def _completar_porcion(self, nucleo: Nucleo):
+        """
+        Aplica la porción que el núcleo acaba de terminar (en tiempo_global).
+        
+        Args:
+            nucleo (Nucleo): Núcleo cuya porción termina
+        """
+        proceso, tiempo_ejecutado = nucleo.cola_ejecucion[0], nucleo.porcion
+        nucleo.porcion = None
+        self._copiar(proceso, tiempo_ejecutado)
+        proceso.rafaga_restante -= tiempo_ejecutado
+        proceso.historial.append(("Ejecución", tiempo_ejecutado))
+        nucleo.tiempo_ocupado += tiempo_ejecutado
+        
+        self._log_nucleo(nucleo, f"Quantum completado para {proceso.nombre} (PID: {proceso.pid})")
+        self._log_nucleo(nucleo, f"  - Tiempo ejecutado: {tiempo_ejecutado * self.th}ms")
+        self._log_nucleo(nucleo, f"  - Ráfaga restante: {proceso.rafaga_restante * self.th}ms")
+        
+        # Verificar si terminó
+        if proceso.rafaga_restante <= 0:
+            proceso.cambiar_estado("Terminado")
+            proceso.t_final = self.tiempo_global
+            proceso.turnaround = proceso.t_final - proceso.t_llegada
+            self.cola_terminados.append(proceso)
+            nucleo.cola_listos.olvidar(proceso)
+            nucleo.cola_ejecucion.popleft()
+            self._escritores.cerrar(proceso.pid)
+            
+            self._log_nucleo(nucleo, f"Proceso {proceso.nombre} (PID: {proceso.pid}) ha terminado")
+            self._log_nucleo(nucleo, f"  - Tiempo final: {proceso.t_final}ms")
+            self._log_nucleo(nucleo, f"  - Turnaround: {proceso.turnaround}ms")
+        elif proceso.prioridad == 0:  # Expulsivo: reinsertar según la política
+            nucleo.cola_ejecucion.popleft()
+            proceso.cambiar_estado("Listo")
+            nucleo.cola_listos.reencolar(proceso, tiempo_ejecutado)
+            self._log_nucleo(nucleo, f"Proceso {proceso.nombre} (PID: {proceso.pid}) vuelve a cola de listos (Expulsivo)")
+        else:  # No expulsivo: conserva el núcleo
+            self._log_nucleo(nucleo, f"Proceso {proceso.nombre} (PID: {proceso.pid}) continúa en ejecución (No Expulsivo)")
+        
     def pausar(self):
         """Pausa la simulación actual."""
         self.pausa_event.clear()
@@ -186,12 +416,144 @@ class Simulador:
         """
         Retorna el estado actual de la simulación.
         
+        Se puede llamar desde otro hilo (la interfaz) con la simulación en
+        marcha: como snapshot, espera a que se termine de aplicar el evento
+        en curso para no recorrer colas que se están modificando.
+        
         Returns:
-            dict: Diccionario con el estado actual de las colas y tiempo global
+            dict: Diccionario con el estado actual de las colas (de todos los
+                  núcleos), el tiempo global y la utilización de cada núcleo
         """
-        return {
-            'cola_listos': [p.to_dict() for p in self.cola_listos],
-            'cola_ejecucion': [p.to_dict() for p in self.cola_ejecucion],
-            'cola_terminados': [p.to_dict() for p in self.cola_terminados],
-            'tiempo_global': self.tiempo_global
-        } 
\ No newline at end of file
+        with self._lock_estado:
+            return {
+                'cola_listos': [p.to_dict() for n in self.nucleos for p in n.cola_listos],
+                'cola_ejecucion': [p.to_dict() for n in self.nucleos for p in n.cola_ejecucion],
+                'cola_terminados': [p.to_dict() for p in self.cola_terminados],
+                'tiempo_global': self.tiempo_global,
+                'nucleos': [n.to_dict(self.tiempo_global) for n in self.nucleos]
+            }
+        
+    def _procesos(self) -> List[Proceso]:
+        """Todos los procesos de la simulación: en cola, en ejecución y terminados."""
+        procesos = [p for n in self.nucleos for p in n.cola_listos]
+        procesos += [p for n in self.nucleos for p in n.cola_ejecucion]
+        return procesos + self.cola_terminados
+        
+    def snapshot(self) -> bytes:
+        """
+        Guarda el estado de la simulación en formato binario (models.instantanea).
+        
+        Incluye la configuración, el reloj global, cada proceso con su ráfaga
+        restante, historial y modo de escritura, y las colas y la porción en curso de cada
+        núcleo. Se puede llamar desde otro hilo con la simulación en marcha:
+        espera a que se termine de aplicar el evento en curso.
+        
+        Returns:
+            bytes: Instantánea del estado
+        """
+        with self._lock_estado:
+            procesos = self._procesos()
+            indice = {id(p): i for i, p in enumerate(procesos)}
+            escritor = EscritorInstantanea(_TIPO_INSTANTANEA)
+            escritor.cadena(self.politica)
+            escritor.enteros((self.th, self.quantum, self.n_cpus, int(self.robo_trabajo),
+                              self.tiempo_global, len(procesos)))
+            
+            for p in procesos:
+                escritor.cadena(p.nombre)
+                escritor.cadena(p.usuario)
+                escritor.cadena(p.descripcion)
+                escritor.cadena(p.modo_escritura)
+                escritor.enteros((p.pid, p.prioridad, _ESTADOS.index(p.estado), p.t_llegada,
+                                  p.t_final, p.rafaga_restante, p.num_ejecuciones, p.turnaround,
+                                  p.catalogo_id))
+                escritor.enteros(_ESTADOS.index(estado) for estado, _ in p.historial)
+                escritor.enteros(valor for _, valor in p.historial)
+                
+            for nucleo in self.nucleos:
+                entradas = nucleo.cola_listos.volcar()
+                porcion = -1 if nucleo.porcion is None else nucleo.porcion
+                escritor.enteros((nucleo.tiempo_ocupado, nucleo.robos, porcion, nucleo.fin_porcion))
+                escritor.enteros(indice[id(p)] for p, _ in entradas)
+                escritor.enteros(dato for _, dato in entradas)
+                escritor.enteros(indice[id(p)] for p in nucleo.cola_ejecucion)
+                escritor.enteros(nucleo.cola_listos.dato(p) for p in nucleo.cola_ejecucion)
+            escritor.enteros(indice[id(p)] for p in self.cola_terminados)
+            return escritor.obtener()
+            
+    @classmethod
+    def restaurar(cls, datos: bytes, ruta_punto_control: Optional[str] = None,
+                  intervalo_punto_control: float = 5.0) -> 'Simulador':
+        """
+        Reconstruye un simulador a partir de una instantánea.
+        
+        El simulador queda detenido; se continúa con `continuar`.
+        
+        Args:
+            datos (bytes): Instantánea generada por `snapshot`
+            ruta_punto_control (Optional[str]): Archivo para nuevos puntos de control
+            intervalo_punto_control (float): Segundos mínimos entre puntos de control
+            
+        Returns:
+            Simulador: Simulador con el estado restaurado
+            
+        Raises:
+            ValueError: Si los datos no son una instantánea válida
+        """
+        lector = LectorInstantanea(datos, _TIPO_INSTANTANEA)
+        politica = lector.cadena()
+        th, quantum, n_cpus, robo_trabajo, tiempo_global, n = lector.enteros()
+        # Cada núcleo ocupa al menos 36 bytes (sus cuatro enteros): un número
+        # corrupto no debe crear millones de núcleos antes de fallar
+        if n_cpus > lector.restantes() // 36:
+            raise ValueError(f"Número de núcleos no válido en la instantánea: {n_cpus}")
+        simulador = cls(th, quantum, politica, n_cpus, bool(robo_trabajo),
+                        ruta_punto_control, intervalo_punto_control)
+        simulador.tiempo_global = tiempo_global
+        
+        procesos = []
+        for _ in range(n):
+            nombre, usuario, descripcion = lector.cadena(), lector.cadena(), lector.cadena()
+            modo_escritura = lector.cadena()
+            (pid, prioridad, estado, t_llegada, t_final,
+             rafaga_restante, num_ejecuciones, turnaround, catalogo_id) = lector.enteros()
+            proceso = Proceso(pid=pid, nombre=nombre, usuario=usuario,
+                              descripcion=descripcion, prioridad=prioridad,
+                              modo_escritura=modo_escritura, catalogo_id=catalogo_id)
+            proceso.estado = elemento(_ESTADOS, estado, 'estado')
+            proceso.t_llegada = t_llegada
+            proceso.t_final = t_final
+            proceso.rafaga_restante = rafaga_restante
+            proceso.num_ejecuciones = num_ejecuciones
+            proceso.turnaround = turnaround
+            proceso.historial = [(_ESTADOS[e], v) for e, v in lector.pares(len(_ESTADOS), 'estado')]
+            procesos.append(proceso)
+            
+        for nucleo in simulador.nucleos:
+            nucleo.tiempo_ocupado, nucleo.robos, porcion, nucleo.fin_porcion = lector.enteros()
+            nucleo.porcion = None if porcion < 0 else porcion
+            nucleo.cola_listos.cargar([(procesos[i], d) for i, d in lector.pares(n, 'proceso')])
+            for i, dato in lector.pares(n, 'proceso'):
+                nucleo.cola_ejecucion.append(procesos[i])
+                nucleo.cola_listos.recordar(procesos[i], dato)
+        simulador.cola_terminados = [procesos[i] for i in lector.indices(n, 'proceso')]
+        if not lector.terminado():
+            raise ValueError("La instantánea tiene datos sobrantes")
+        return simulador
+        
+    def guardar_punto_control(self):
+        """
+        Escribe una instantánea en `ruta_punto_control`.
+        
+        Se escribe primero en un archivo temporal y luego se reemplaza el
+        anterior, de modo que un corte a mitad de escritura no deja un punto
+        de control corrupto.
+        """
+        datos = self.snapshot()
+        temporal = f"{self.ruta_punto_control}.tmp"
+        with open(temporal, "wb") as f:
+            f.write(datos)
+        os.replace(temporal, self.ruta_punto_control)
+        self._ultimo_punto_control = time.monotonic()
+        self.log(f"Punto de control guardado ({len(datos)} bytes)")
+
@@ -9,9 +9,13 @@ Clases exportadas:
 - Simulador: Implementa la lógica de simulación Round Robin
 - ResultadoSimulacion: Contiene los resultados de una simulación
 - TipoFiltro: Tipos de filtro para selección de procesos
+- PoliticaPlanificacion: Interfaz de las políticas de planificación
+- crear_politica / POLITICAS: Políticas disponibles por nombre
 """
 
 from .proceso import Proceso, EstadoProceso
 from .simulacion import Simulador, ResultadoSimulacion, TipoFiltro
+from .politicas import PoliticaPlanificacion, POLITICAS, crear_politica
 
-__all__ = ['Proceso', 'EstadoProceso', 'Simulador', 'ResultadoSimulacion', 'TipoFiltro'] 
\ No newline at end of file
+__all__ = ['Proceso', 'EstadoProceso', 'Simulador', 'ResultadoSimulacion', 'TipoFiltro',
+           'PoliticaPlanificacion', 'POLITICAS', 'crear_politica'] 
\ No newline at end of file
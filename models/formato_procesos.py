@@ -0,0 +1,247 @@
+"""
+Representaciones de la lista de procesos para la API de escritorio.
+Este módulo define los formatos alternativos al XML con los que
+/procesos puede responder según la cabecera Accept, y el orden en que el
+cliente web los prefiere.
+
+Formatos:
+- JSON (application/json): lista de diccionarios con los campos del proceso
+- Binario (application/x-procesos):
+    cabecera: firma b"PRC2", número de procesos y de eventos (uint32)
+    enteros: bloque int64 con 10 valores por proceso (pid, prioridad,
+        t_llegada, t_final, rafaga_total, rafaga_restante, num_ejecuciones,
+        turnaround, número de eventos del historial y máscara de cadenas
+        nulas: bit i = i-ésimo campo de cadena es None)
+    duraciones: bloque int64 con la duración de cada evento
+    cadenas: longitud (uint32) y un bloque UTF-8 con todas las cadenas
+        (nombre, usuario, descripción y estado de cada proceso, y después
+        el estado de cada evento) separadas por "\\0"
+
+Características:
+- El binario se decodifica con tres operaciones en bloque (dos arreglos y
+  un split) en lugar de un análisis campo a campo
+- Los valores None (t_final/turnaround sin calcular) se guardan como -1
+- Las cadenas None (usuario sin acceso) se guardan vacías y se marcan en
+  la máscara de nulos del proceso
+"""
+
+import json
+import struct
+import sys
+from array import array
+from typing import Any, Dict, List
+
+TIPO_XML = "application/xml"
+TIPO_JSON = "application/json"
+TIPO_BINARIO = "application/x-procesos"
+
+# Del más barato al más caro de decodificar (ver benchmarks/bench_formato_procesos.py)
+PREFERENCIA = (TIPO_BINARIO, TIPO_JSON, TIPO_XML)
+
+FIRMA = b"PRC2"
+_CABECERA = struct.Struct("<4sII")
+_LONGITUD = struct.Struct("<I")
+_CAMPOS_ENTEROS = ("pid", "prioridad", "t_llegada", "t_final", "rafaga_total",
+                   "rafaga_restante", "num_ejecuciones", "turnaround")
+_ENTEROS_POR_PROCESO = len(_CAMPOS_ENTEROS) + 2
+_CAMPOS_CADENA = ("nombre", "usuario", "descripcion", "estado")
+_SEPARADOR = "\0"
+_NULO = -1
+
+
+def codificar_json(procesos: List[Dict[str, Any]]) -> bytes:
+    """
+    Codifica la lista de procesos como JSON.
+
+    Args:
+        procesos (List[Dict[str, Any]]): Procesos (como Proceso.to_dict())
+
+    Returns:
+        bytes: JSON en UTF-8
+    """
+    return json.dumps(procesos, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def decodificar_json(datos: bytes) -> List[Dict[str, Any]]:
+    """
+    Decodifica una lista de procesos en JSON.
+
+    Raises:
+        ValueError: Si los datos no son JSON válido
+    """
+    return json.loads(datos)
+
+
+def codificar_binario(procesos: List[Dict[str, Any]]) -> bytes:
+    """
+    Codifica la lista de procesos en el formato binario.
+
+    Args:
+        procesos (List[Dict[str, Any]]): Procesos (como Proceso.to_dict())
+
+    Returns:
+        bytes: Representación binaria
+
+    Raises:
+        ValueError: Si alguna cadena contiene el carácter nulo
+    """
+    enteros = array("q")
+    duraciones = array("q")
+    cadenas = []
+    estados_eventos = []
+    for proc in procesos:
+        for campo in _CAMPOS_ENTEROS:
+            valor = proc[campo]
+            enteros.append(_NULO if valor is None else valor)
+        enteros.append(len(proc["historial"]))
+        nulos = 0
+        for bit, campo in enumerate(_CAMPOS_CADENA):
+            valor = proc[campo]
+            if valor is None:
+                nulos |= 1 << bit
+                valor = ""
+            cadenas.append(valor)
+        enteros.append(nulos)
+        for estado, duracion in proc["historial"]:
+            estados_eventos.append(estado)
+            duraciones.append(duracion)
+    cadenas.extend(estados_eventos)
+    texto = _SEPARADOR.join(cadenas)
+    if texto.count(_SEPARADOR) != max(len(cadenas) - 1, 0):
+        raise ValueError("Las cadenas de los procesos no pueden contener el carácter nulo")
+    bloque = texto.encode("utf-8")
+    if sys.byteorder == "big":
+        enteros.byteswap()
+        duraciones.byteswap()
+    return b"".join((
+        _CABECERA.pack(FIRMA, len(procesos), len(duraciones)),
+        enteros.tobytes(),
+        duraciones.tobytes(),
+        _LONGITUD.pack(len(bloque)),
+        bloque,
+    ))
+
+
+def decodificar_binario(datos: bytes) -> List[Dict[str, Any]]:
+    """
+    Decodifica una lista de procesos en el formato binario.
+
+    Args:
+        datos (bytes): Representación binaria
+
+    Returns:
+        List[Dict[str, Any]]: Procesos con los mismos campos que Proceso.to_dict()
+            (el historial como lista de tuplas)
+
+    Raises:
+        ValueError: Si los datos no tienen el formato esperado
+    """
+    if len(datos) < _CABECERA.size:
+        raise ValueError("Datos binarios truncados")
+    firma, num_procesos, num_eventos = _CABECERA.unpack_from(datos, 0)
+    if firma != FIRMA:
+        raise ValueError("Los datos no son una lista de procesos binaria")
+    vista = memoryview(datos)
+    posicion = _CABECERA.size
+    enteros = array("q")
+    duraciones = array("q")
+    fin_enteros = posicion + num_procesos * _ENTEROS_POR_PROCESO * enteros.itemsize
+    fin_duraciones = fin_enteros + num_eventos * duraciones.itemsize
+    if fin_duraciones + _LONGITUD.size > len(datos):
+        raise ValueError("Datos binarios truncados")
+    enteros.frombytes(vista[posicion:fin_enteros])
+    duraciones.frombytes(vista[fin_enteros:fin_duraciones])
+    if sys.byteorder == "big":
+        enteros.byteswap()
+        duraciones.byteswap()
+    (longitud,) = _LONGITUD.unpack_from(datos, fin_duraciones)
+    inicio_bloque = fin_duraciones + _LONGITUD.size
+    if inicio_bloque + longitud != len(datos):
+        raise ValueError("Datos binarios truncados")
+    cadenas = str(vista[inicio_bloque:], "utf-8").split(_SEPARADOR)
+    if len(cadenas) != max(num_procesos * len(_CAMPOS_CADENA) + num_eventos, 1):
+        raise ValueError("Número de cadenas incorrecto")
+
+    procesos = []
+    evento = 0
+    for i in range(num_procesos):
+        base = i * _ENTEROS_POR_PROCESO
+        pid, prioridad, t_llegada, t_final, rafaga_total, rafaga_restante, \
+            num_ejecuciones, turnaround, eventos, nulos = enteros[base:base + _ENTEROS_POR_PROCESO]
+        textos = cadenas[4 * i:4 * i + 4]
+        if nulos:
+            textos = [None if nulos >> bit & 1 else texto for bit, texto in enumerate(textos)]
+        nombre, usuario, descripcion, estado = textos
+        estados = cadenas[4 * num_procesos + evento:4 * num_procesos + evento + eventos]
+        procesos.append({
+            "pid": pid,
+            "nombre": nombre,
+            "usuario": usuario,
+            "descripcion": descripcion,
+            "prioridad": prioridad,
+            "estado": estado,
+            "t_llegada": t_llegada,
+            "t_final": None if t_final == _NULO else t_final,
+            "rafaga_total": rafaga_total,
+            "rafaga_restante": rafaga_restante,
+            "num_ejecuciones": num_ejecuciones,
+            "turnaround": None if turnaround == _NULO else turnaround,
+            "historial": list(zip(estados, duraciones[evento:evento + eventos])),
+        })
+        evento += eventos
+    return procesos
+
+
+CODIFICADORES = {
+    TIPO_JSON: codificar_json,
+    TIPO_BINARIO: codificar_binario,
+}
+
+DECODIFICADORES = {
+    TIPO_JSON: decodificar_json,
+    TIPO_BINARIO: decodificar_binario,
+}
+
+
+def elegir_tipo(accept: str, disponibles=PREFERENCIA, por_defecto: str = TIPO_XML) -> str:
+    """
+    Elige la representación de la respuesta según la cabecera Accept.
+
+    Se toma el tipo disponible con mayor q; a igualdad de q gana el tipo
+    por defecto y después el primero de `disponibles`. Los comodines (*/*
+    y application/*) solo cuentan para el tipo por defecto, de modo que los
+    clientes existentes siguen recibiendo XML.
+
+    Args:
+        accept (str): Valor de la cabecera Accept (vacío = cualquiera)
+        disponibles (Sequence[str]): Tipos que ofrece el servidor
+        por_defecto (str): Tipo si Accept no indica preferencia
+
+    Returns:
+        str: Tipo elegido (por_defecto si ninguno es aceptable)
+    """
+    if not accept:
+        return por_defecto
+    calidad: Dict[str, float] = {}
+    comodin = 0.0
+    for parte in accept.split(","):
+        tipo, *parametros = [p.strip() for p in parte.split(";")]
+        q = 1.0
+        for parametro in parametros:
+            clave, _, valor = parametro.partition("=")
+            if clave.strip() == "q":
+                try:
+                    q = float(valor)
+                except ValueError:
+                    q = 0.0
+        tipo = tipo.lower()
+        if tipo in ("*/*", "application/*"):
+            comodin = max(comodin, q)
+        else:
+            calidad[tipo] = max(calidad.get(tipo, 0.0), q)
+    mejor, mejor_q = por_defecto, calidad.get(por_defecto, comodin)
+    for tipo in disponibles:
+        q = calidad.get(tipo, 0.0)
+        if q > mejor_q:
+            mejor, mejor_q = tipo, q
+    return mejor
@@ -0,0 +1,211 @@
+"""
+Formato binario compacto para instantáneas de simulación.
+Este módulo define el contenedor que usan los simuladores para guardar y
+restaurar su estado (colas, ráfagas restantes, historial y reloj global)
+sin pasar por JSON.
+
+Formato:
+- Cabecera: firma b"SIMI", versión (uint16) y tipo de instantánea (4 bytes)
+- Enteros: int64 little-endian
+- Cadenas: longitud (uint32) seguida de los bytes UTF-8
+- Arreglos de enteros: longitud (uint32) seguida de los valores int64,
+  copiados en bloque con array('q') en lugar de empaquetarlos uno a uno
+
+Cada simulador decide qué campos escribe y en qué orden; el lector debe
+leerlos en el mismo orden. Los índices (a la lista de procesos, a tablas
+de estados) se comprueban al leerlos: una instantánea corrupta produce
+ValueError, nunca IndexError.
+"""
+
+import struct
+import sys
+from array import array
+from typing import Iterable, List, Sequence, Tuple, TypeVar
+
+T = TypeVar("T")
+
+FIRMA = b"SIMI"
+VERSION = 1
+
+_CABECERA = struct.Struct("<4sH4s")
+_ENTERO = struct.Struct("<q")
+_LONGITUD = struct.Struct("<I")
+
+
+def elemento(secuencia: Sequence[T], indice: int, descripcion: str) -> T:
+    """
+    Devuelve secuencia[indice] comprobando que el índice leído esté en rango.
+
+    Args:
+        secuencia (Sequence): Lista o tupla indexada
+        indice (int): Índice leído de la instantánea
+        descripcion (str): Qué indexa, para el mensaje de error
+
+    Returns:
+        El elemento indicado
+
+    Raises:
+        ValueError: Si el índice es negativo o no es menor que len(secuencia)
+    """
+    if not 0 <= indice < len(secuencia):
+        raise ValueError(f"Índice de {descripcion} fuera de rango en la instantánea: {indice}")
+    return secuencia[indice]
+
+
+class EscritorInstantanea:
+    """
+    Construye una instantánea binaria campo a campo.
+
+    Attributes:
+        tipo (bytes): Identificador de 4 bytes del simulador que la escribe
+    """
+
+    def __init__(self, tipo: bytes):
+        """
+        Inicializa el escritor y añade la cabecera.
+
+        Args:
+            tipo (bytes): Identificador de 4 bytes del simulador
+
+        Raises:
+            ValueError: Si el tipo no tiene 4 bytes
+        """
+        if len(tipo) != 4:
+            raise ValueError("El tipo de instantánea debe tener 4 bytes")
+        self.tipo = tipo
+        self._partes: List[bytes] = [_CABECERA.pack(FIRMA, VERSION, tipo)]
+
+    def entero(self, valor: int):
+        """Añade un entero de 64 bits."""
+        self._partes.append(_ENTERO.pack(valor))
+
+    def cadena(self, valor: str):
+        """Añade una cadena UTF-8 precedida de su longitud."""
+        datos = valor.encode("utf-8")
+        self._partes.append(_LONGITUD.pack(len(datos)))
+        self._partes.append(datos)
+
+    def enteros(self, valores: Iterable[int]):
+        """Añade un arreglo de enteros de 64 bits precedido de su longitud."""
+        arreglo = array("q", valores)
+        if sys.byteorder == "big":
+            arreglo.byteswap()
+        self._partes.append(_LONGITUD.pack(len(arreglo)))
+        self._partes.append(arreglo.tobytes())
+
+    def obtener(self) -> bytes:
+        """
+        Devuelve la instantánea completa.
+
+        Returns:
+            bytes: Cabecera y campos escritos hasta ahora
+        """
+        return b"".join(self._partes)
+
+
+class LectorInstantanea:
+    """
+    Lee los campos de una instantánea en el orden en que se escribieron.
+
+    Attributes:
+        tipo (bytes): Identificador del simulador que la escribió
+    """
+
+    def __init__(self, datos: bytes, tipo: bytes):
+        """
+        Valida la cabecera de la instantánea.
+
+        Args:
+            datos (bytes): Instantánea completa
+            tipo (bytes): Tipo esperado
+
+        Raises:
+            ValueError: Si la firma, la versión o el tipo no coinciden
+        """
+        if len(datos) < _CABECERA.size:
+            raise ValueError("Instantánea truncada")
+        firma, version, tipo_leido = _CABECERA.unpack_from(datos, 0)
+        if firma != FIRMA:
+            raise ValueError("Los datos no son una instantánea de simulación")
+        if version != VERSION:
+            raise ValueError(f"Versión de instantánea no soportada: {version}")
+        if tipo_leido != tipo:
+            raise ValueError(f"Instantánea de tipo {tipo_leido!r}, se esperaba {tipo!r}")
+        self.tipo = tipo
+        self._datos = memoryview(datos)
+        self._posicion = _CABECERA.size
+
+    def _tomar(self, n: int) -> memoryview:
+        """Avanza n bytes y devuelve la porción leída."""
+        fin = self._posicion + n
+        if fin > len(self._datos):
+            raise ValueError("Instantánea truncada")
+        porcion = self._datos[self._posicion:fin]
+        self._posicion = fin
+        return porcion
+
+    def entero(self) -> int:
+        """Lee un entero de 64 bits."""
+        return _ENTERO.unpack(self._tomar(_ENTERO.size))[0]
+
+    def cadena(self) -> str:
+        """Lee una cadena UTF-8."""
+        longitud = _LONGITUD.unpack(self._tomar(_LONGITUD.size))[0]
+        return bytes(self._tomar(longitud)).decode("utf-8")
+
+    def enteros(self) -> List[int]:
+        """Lee un arreglo de enteros de 64 bits."""
+        longitud = _LONGITUD.unpack(self._tomar(_LONGITUD.size))[0]
+        arreglo = array("q")
+        arreglo.frombytes(self._tomar(longitud * arreglo.itemsize))
+        if sys.byteorder == "big":
+            arreglo.byteswap()
+        return arreglo.tolist()
+
+    def indices(self, limite: int, descripcion: str) -> List[int]:
+        """
+        Lee un arreglo de índices y comprueba que estén en [0, limite).
+
+        Args:
+            limite (int): Longitud de la secuencia indexada
+            descripcion (str): Qué indexan, para el mensaje de error
+
+        Returns:
+            List[int]: Índices leídos
+
+        Raises:
+            ValueError: Si algún índice está fuera de rango
+        """
+        indices = self.enteros()
+        fuera = [i for i in indices if not 0 <= i < limite]
+        if fuera:
+            raise ValueError(f"Índice de {descripcion} fuera de rango en la instantánea: {fuera[0]}")
+        return indices
+
+    def pares(self, limite: int, descripcion: str) -> List[Tuple[int, int]]:
+        """
+        Lee dos arreglos paralelos: índices (ver `indices`) y un dato por índice.
+
+        Args:
+            limite (int): Longitud de la secuencia indexada
+            descripcion (str): Qué indexan, para el mensaje de error
+
+        Returns:
+            List[Tuple[int, int]]: Pares (índice, dato)
+
+        Raises:
+            ValueError: Si algún índice está fuera de rango o los arreglos
+                tienen distinta longitud
+        """
+        indices, datos = self.indices(limite, descripcion), self.enteros()
+        if len(indices) != len(datos):
+            raise ValueError(f"Arreglos de {descripcion} de distinta longitud en la instantánea")
+        return list(zip(indices, datos))
+
+    def restantes(self) -> int:
+        """Devuelve los bytes que quedan por leer."""
+        return len(self._datos) - self._posicion
+
+    def terminado(self) -> bool:
+        """Indica si se leyeron todos los campos."""
+        return self._posicion == len(self._datos)
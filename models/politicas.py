@@ -0,0 +1,412 @@
+"""
+Políticas de planificación para la cola de listos.
+Este módulo define las políticas que deciden qué proceso recibe la CPU y
+durante cuánto tiempo. Cada política es una cola de listos con una
+estructura adecuada a su criterio, de modo que encolar y extraer cuesta
+O(1) u O(log n) en lugar de recorrer la lista completa.
+
+Políticas disponibles:
+- round_robin: FIFO (deque) con quantum fijo
+- fcfs: FIFO (deque), cada proceso ejecuta toda su ráfaga
+- sjf: heap por ráfaga restante, sin expulsión
+- srtf: heap por ráfaga restante, con expulsión cuando llega un proceso
+- prioridad: heap por prioridad (menor valor = mayor prioridad)
+- mlfq: colas multinivel con retroalimentación (deque por nivel)
+
+Las políticas no dependen de una clase concreta de proceso: reciben
+funciones para leer la ráfaga restante, la prioridad y el identificador,
+por lo que sirven tanto para `models.Proceso` como para los procesos de
+la app de escritorio y los diccionarios de la app web.
+
+Nota sobre "prioridad": los procesos del catálogo no tienen una prioridad
+numérica propia; su campo `prioridad` es el tipo de proceso
+(TipoProceso: 0 = expulsivo, 1 = no expulsivo). Con esos procesos la
+política atiende primero a todos los expulsivos y después a los no
+expulsivos, en orden de llegada dentro de cada grupo. Con procesos que
+sí tengan una prioridad numérica (models.Proceso acepta cualquier int),
+ordena por ese valor.
+"""
+
+import heapq
+from abc import ABC, abstractmethod
+from collections import deque
+from enum import Enum
+from operator import attrgetter
+from typing import Any, Callable, Deque, Dict, Iterator, List, Tuple
+
+
+def valor_prioridad(proceso: Any) -> int:
+    """
+    Obtiene la prioridad numérica de un proceso.
+
+    Args:
+        proceso (Any): Proceso con atributo `prioridad` (int o Enum)
+
+    Returns:
+        int: Valor de prioridad (menor valor = mayor prioridad)
+    """
+    prioridad = proceso.prioridad
+    return prioridad.value if isinstance(prioridad, Enum) else int(prioridad)
+
+
+class PoliticaPlanificacion(ABC):
+    """
+    Cola de listos base: define la interfaz común de las políticas.
+
+    Las subclases deben implementar reiniciar, agregar, siguiente,
+    __len__ y __iter__; el resto tiene una implementación por defecto.
+
+    Attributes:
+        nombre (str): Identificador de la política
+        expulsa_en_llegada (bool): Si True, el simulador corta la ejecución
+            del proceso actual cuando llega un proceso nuevo
+        clave_restante (Callable): Devuelve la ráfaga restante de un proceso
+        clave_prioridad (Callable): Devuelve la prioridad de un proceso
+        clave_id (Callable): Devuelve el identificador único de un proceso
+            (la política lo usa para guardar datos por proceso)
+        quantum (int): Quantum base del simulador, para las políticas que lo
+            necesitan fuera de `porcion` (las colas multinivel, al reencolar)
+    """
+    nombre = ""
+    expulsa_en_llegada = False
+
+    def __init__(self, clave_restante: Callable[[Any], int] = attrgetter('tiempo_restante'),
+                 clave_prioridad: Callable[[Any], int] = valor_prioridad,
+                 clave_id: Callable[[Any], Any] = attrgetter('id'),
+                 quantum: int = 1):
+        """
+        Inicializa la política.
+
+        Args:
+            clave_restante (Callable): Lectura de la ráfaga restante
+            clave_prioridad (Callable): Lectura de la prioridad
+            clave_id (Callable): Lectura del identificador único (id o PID)
+            quantum (int): Quantum base; debe ser el mismo que el simulador
+                pasa a `porcion`
+
+        Raises:
+            ValueError: Si el quantum no es positivo
+        """
+        if quantum <= 0:
+            raise ValueError("El quantum debe ser mayor que cero")
+        self.clave_restante = clave_restante
+        self.clave_prioridad = clave_prioridad
+        self.clave_id = clave_id
+        self.quantum = quantum
+        self.reiniciar()
+
+    @abstractmethod
+    def reiniciar(self):
+        """Vacía la cola de listos."""
+
+    @abstractmethod
+    def agregar(self, proceso: Any):
+        """
+        Encola un proceso que acaba de llegar.
+
+        Args:
+            proceso (Any): Proceso a encolar
+        """
+
+    def reencolar(self, proceso: Any, tiempo_ejecutado: int):
+        """
+        Encola un proceso interrumpido antes de terminar.
+
+        Args:
+            proceso (Any): Proceso interrumpido
+            tiempo_ejecutado (int): Tiempo que ejecutó en su última porción
+        """
+        self.agregar(proceso)
+
+    def olvidar(self, proceso: Any):
+        """
+        Descarta los datos que la política guarda de un proceso que terminó
+        o que pasó a la cola de listos de otro núcleo.
+
+        Args:
+            proceso (Any): Proceso que ya no está en esta cola
+        """
+
+    @abstractmethod
+    def siguiente(self) -> Any:
+        """
+        Extrae el siguiente proceso a ejecutar.
+
+        Returns:
+            Any: Proceso elegido por la política
+        """
+
+    def porcion(self, proceso: Any, quantum: int) -> int:
+        """
+        Tiempo máximo que el proceso puede ejecutar antes de ser reevaluado.
+
+        Args:
+            proceso (Any): Proceso que recibe la CPU
+            quantum (int): Quantum configurado en el simulador
+
+        Returns:
+            int: Duración máxima de la porción
+        """
+        return self.clave_restante(proceso)
+
+    def dato(self, proceso: Any) -> int:
+        """
+        Dato que la política guarda de un proceso (nivel en colas multinivel).
+
+        Args:
+            proceso (Any): Proceso en cola o en ejecución
+
+        Returns:
+            int: Dato de la política, 0 si no guarda ninguno
+        """
+        return 0
+
+    def recordar(self, proceso: Any, dato: int):
+        """
+        Restaura el dato de un proceso que no está en cola (p. ej. en ejecución).
+
+        Args:
+            proceso (Any): Proceso
+            dato (int): Valor devuelto antes por `dato`
+
+        Raises:
+            ValueError: Si el dato no es válido para la política
+        """
+
+    def volcar(self) -> List[Tuple[Any, int]]:
+        """
+        Exporta el contenido de la cola para guardarlo en una instantánea.
+
+        Returns:
+            List[Tuple[Any, int]]: Pares (proceso, dato de la política) en
+                orden de extracción; el dato es 0 salvo en colas multinivel
+        """
+        return [(proceso, self.dato(proceso)) for proceso in self]
+
+    def cargar(self, entradas: List[Tuple[Any, int]]):
+        """
+        Reconstruye la cola a partir de lo exportado por `volcar`.
+
+        Args:
+            entradas (List[Tuple[Any, int]]): Pares (proceso, dato) en orden
+
+        Raises:
+            ValueError: Si algún dato no es válido para la política
+        """
+        self.reiniciar()
+        for proceso, _ in entradas:
+            self.agregar(proceso)
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """Número de procesos en cola."""
+
+    @abstractmethod
+    def __iter__(self) -> Iterator[Any]:
+        """Itera los procesos en cola (el orden solo es exacto en colas FIFO)."""
+
+
+class _PoliticaFIFO(PoliticaPlanificacion):
+    """Cola de listos FIFO respaldada por un deque."""
+
+    def reiniciar(self):
+        self._cola: Deque[Any] = deque()
+
+    def agregar(self, proceso: Any):
+        self._cola.append(proceso)
+
+    def siguiente(self) -> Any:
+        return self._cola.popleft()
+
+    def __len__(self) -> int:
+        return len(self._cola)
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._cola)
+
+
+class RoundRobin(_PoliticaFIFO):
+    """Round Robin: FIFO con quantum fijo."""
+    nombre = "round_robin"
+
+    def porcion(self, proceso: Any, quantum: int) -> int:
+        return quantum
+
+
+class FCFS(_PoliticaFIFO):
+    """First Come, First Served: FIFO sin expulsión."""
+    nombre = "fcfs"
+
+
+class _PoliticaHeap(PoliticaPlanificacion):
+    """
+    Cola de listos respaldada por un heap (clave, secuencia, proceso).
+    La secuencia desempata en orden de llegada y evita comparar procesos.
+    """
+
+    def reiniciar(self):
+        self._heap: List[Tuple[int, int, Any]] = []
+        self._secuencia = 0
+
+    @abstractmethod
+    def clave(self, proceso: Any) -> int:
+        """Clave de ordenamiento del heap (menor = antes)."""
+
+    def agregar(self, proceso: Any):
+        heapq.heappush(self._heap, (self.clave(proceso), self._secuencia, proceso))
+        self._secuencia += 1
+
+    def siguiente(self) -> Any:
+        return heapq.heappop(self._heap)[2]
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def __iter__(self) -> Iterator[Any]:
+        return (entrada[2] for entrada in self._heap)
+
+    def volcar(self) -> List[Tuple[Any, int]]:
+        # Las claves no cambian mientras el proceso espera: ordenar por
+        # (clave, secuencia) da el orden exacto de extracción
+        return [(entrada[2], 0) for entrada in sorted(self._heap, key=lambda e: e[:2])]
+
+
+class SJF(_PoliticaHeap):
+    """Shortest Job First: menor ráfaga restante primero, sin expulsión."""
+    nombre = "sjf"
+
+    def clave(self, proceso: Any) -> int:
+        return self.clave_restante(proceso)
+
+
+class SRTF(SJF):
+    """Shortest Remaining Time First: SJF con expulsión en cada llegada."""
+    nombre = "srtf"
+    expulsa_en_llegada = True
+
+
+class Prioridad(_PoliticaHeap):
+    """
+    Planificación por prioridad (menor valor = mayor prioridad).
+    Por defecto no expulsiva; con expulsiva=True se reevalúa en cada llegada.
+
+    Con los procesos del catálogo la prioridad es el tipo de proceso, de
+    modo que los expulsivos (0) se atienden antes que los no expulsivos (1).
+    """
+    nombre = "prioridad"
+
+    def __init__(self, expulsiva: bool = False, **kwargs):
+        self.expulsa_en_llegada = expulsiva
+        super().__init__(**kwargs)
+
+    def clave(self, proceso: Any) -> int:
+        return self.clave_prioridad(proceso)
+
+
+class ColasMultinivel(PoliticaPlanificacion):
+    """
+    Colas multinivel con retroalimentación (MLFQ).
+
+    Cada nivel es un deque; el nivel k usa un quantum de quantum × 2^k.
+    Un proceso que agota su porción baja un nivel; uno que cede la CPU
+    antes conserva el suyo (el quantum base se fija al crear la política,
+    así que reencolar no depende de haber llamado antes a `porcion`).
+    Con un número fijo de niveles, encolar y
+    extraer cuestan O(1). El nivel de cada proceso se guarda por su
+    identificador (clave_id) y se descarta con `olvidar` cuando termina.
+    """
+    nombre = "mlfq"
+
+    def __init__(self, niveles: int = 3, **kwargs):
+        self.niveles = niveles
+        super().__init__(**kwargs)
+
+    def reiniciar(self):
+        self._colas: List[Deque[Any]] = [deque() for _ in range(self.niveles)]
+        self._nivel: Dict[Any, int] = {}
+        self._total = 0
+
+    def agregar(self, proceso: Any):
+        self._nivel[self.clave_id(proceso)] = 0
+        self._colas[0].append(proceso)
+        self._total += 1
+
+    def reencolar(self, proceso: Any, tiempo_ejecutado: int):
+        clave = self.clave_id(proceso)
+        nivel = self._nivel.get(clave, 0)
+        if tiempo_ejecutado >= self.quantum * 2 ** nivel:
+            nivel = min(nivel + 1, self.niveles - 1)
+        self._nivel[clave] = nivel
+        self._colas[nivel].append(proceso)
+        self._total += 1
+
+    def olvidar(self, proceso: Any):
+        self._nivel.pop(self.clave_id(proceso), None)
+
+    def siguiente(self) -> Any:
+        for cola in self._colas:
+            if cola:
+                self._total -= 1
+                return cola.popleft()
+        raise IndexError("La cola de listos está vacía")
+
+    def porcion(self, proceso: Any, quantum: int) -> int:
+        return quantum * 2 ** self._nivel.get(self.clave_id(proceso), 0)
+
+    def dato(self, proceso: Any) -> int:
+        return self._nivel.get(self.clave_id(proceso), 0)
+
+    def _validar_nivel(self, nivel: int) -> int:
+        """Comprueba un nivel restaurado de una instantánea."""
+        if not 0 <= nivel < self.niveles:
+            raise ValueError(f"Nivel de MLFQ fuera de rango: {nivel}")
+        return nivel
+
+    def recordar(self, proceso: Any, dato: int):
+        self._nivel[self.clave_id(proceso)] = self._validar_nivel(dato)
+
+    def cargar(self, entradas: List[Tuple[Any, int]]):
+        self.reiniciar()
+        for proceso, nivel in entradas:
+            self._nivel[self.clave_id(proceso)] = self._validar_nivel(nivel)
+            self._colas[nivel].append(proceso)
+            self._total += 1
+
+    def __len__(self) -> int:
+        return self._total
+
+    def __iter__(self) -> Iterator[Any]:
+        for cola in self._colas:
+            yield from cola
+
+
+POLITICAS = {
+    RoundRobin.nombre: RoundRobin,
+    FCFS.nombre: FCFS,
+    SJF.nombre: SJF,
+    SRTF.nombre: SRTF,
+    Prioridad.nombre: Prioridad,
+    ColasMultinivel.nombre: ColasMultinivel,
+}
+
+
+def crear_politica(nombre: str, **kwargs) -> PoliticaPlanificacion:
+    """
+    Crea una política de planificación por nombre.
+
+    Args:
+        nombre (str): Nombre de la política (ver POLITICAS)
+        **kwargs: Argumentos para la política (clave_restante, clave_prioridad,
+            clave_id, quantum, ...)
+
+    Returns:
+        PoliticaPlanificacion: Cola de listos vacía de la política indicada
+
+    Raises:
+        ValueError: Si la política no existe o el quantum no es positivo
+    """
+    try:
+        clase = POLITICAS[nombre]
+    except KeyError:
+        raise ValueError(f"Política de planificación desconocida: {nombre}")
+    return clase(**kwargs)
@@ -45,12 +45,14 @@ class Proceso:
     
     Attributes:
         id (int): Número consecutivo del catálogo
-        pid (int): PID del proceso del sistema
         nombre (str): Nombre del ejecutable
+        prioridad (TipoProceso): Tipo de proceso (expulsivo/no expulsivo)
+        pid (int): PID del proceso del sistema
         nombre_catalogo (str): Nombre en el catálogo (PID_nombre)
         usuario (str): Usuario que ejecuta el proceso
         descripcion (str): Descripción del proceso
-        prioridad (TipoProceso): Tipo de proceso (expulsivo/no expulsivo)
+        tiempo_llegada (int): Momento en que el proceso llega a la cola de listos
+        tiempo_servicio (Optional[int]): Ráfaga total (por defecto, longitud de la descripción)
         estado (EstadoProceso): Estado actual del proceso
         tiempo_restante (Optional[int]): Tiempo restante de ejecución
         tiempo_inicio (Optional[int]): Momento en que inició la ejecución
@@ -60,12 +62,14 @@ class Proceso:
         tiempo_retorno (int): Tiempo total de ejecución
     """
     id: int  # Número consecutivo del catálogo
-    pid: int  # PID del proceso del sistema
     nombre: str  # Nombre del ejecutable
-    nombre_catalogo: str  # Nombre en el catálogo (PID_nombre)
-    usuario: str  # Usuario que ejecuta el proceso
-    descripcion: str  # Descripción del proceso
     prioridad: TipoProceso  # 0 = expulsivo, 1 = no expulsivo
+    pid: int = 0  # PID del proceso del sistema
+    nombre_catalogo: str = ""  # Nombre en el catálogo (PID_nombre)
+    usuario: str = ""  # Usuario que ejecuta el proceso
+    descripcion: str = ""  # Descripción del proceso
+    tiempo_llegada: int = 0
+    tiempo_servicio: Optional[int] = None
     estado: EstadoProceso = EstadoProceso.LISTO
     tiempo_restante: Optional[int] = None
     tiempo_inicio: Optional[int] = None
@@ -77,11 +81,14 @@ class Proceso:
     def __post_init__(self):
         """
         Inicializa valores por defecto después de la creación del objeto.
-        El tiempo restante se calcula como la longitud de la descripción,
-        donde cada carácter representa un quantum de ejecución.
+        Si no se indica el tiempo de servicio, se calcula como la longitud
+        de la descripción, donde cada carácter representa un quantum de
+        ejecución. El tiempo restante parte del tiempo de servicio.
         """
+        if self.tiempo_servicio is None:
+            self.tiempo_servicio = len(self.descripcion)  # Cada carácter es un quantum
         if self.tiempo_restante is None:
-            self.tiempo_restante = len(self.descripcion)  # Cada carácter es un quantum
+            self.tiempo_restante = self.tiempo_servicio
             
     def actualizar_estado(self, nuevo_estado: EstadoProceso, tiempo_actual: int):
         """
@@ -93,16 +100,17 @@ class Proceso:
             
         Note:
             - Al iniciar ejecución se registra el tiempo de inicio
-            - Al terminar se calculan tiempos de retorno, respuesta y espera
+            - Al terminar se calculan tiempos de retorno, respuesta y espera,
+              todos medidos desde el tiempo de llegada
         """
         self.estado = nuevo_estado
         if nuevo_estado == EstadoProceso.EJECUCION and self.tiempo_inicio is None:
             self.tiempo_inicio = tiempo_actual
         elif nuevo_estado == EstadoProceso.TERMINADO:
             self.tiempo_fin = tiempo_actual
-            self.tiempo_retorno = self.tiempo_fin - self.tiempo_inicio
-            self.tiempo_respuesta = self.tiempo_inicio
-            self.tiempo_espera = self.tiempo_retorno - len(self.descripcion)
+            self.tiempo_retorno = self.tiempo_fin - self.tiempo_llegada
+            self.tiempo_respuesta = self.tiempo_inicio - self.tiempo_llegada
+            self.tiempo_espera = self.tiempo_retorno - self.tiempo_servicio
             
     def ejecutar(self, quantum: int) -> int:
         """
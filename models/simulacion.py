@@ -1,19 +1,24 @@
 """
-Modelo de simulación de procesos usando el algoritmo Round Robin.
+Modelo de simulación de procesos usando el algoritmo Round Robin
+u otra política de planificación intercambiable.
 Este módulo implementa la lógica de simulación de procesos del sistema
 operativo utilizando el algoritmo Round Robin con soporte para procesos
 expulsivos y no expulsivos.
 
 Características:
-- Simulación paso a paso o continua
+- Simulación paso a paso o continua (run_to_completion)
+- Núcleo dirigido por eventos: heap de llegadas y cola de listos según la política
 - Soporte para pausar/reanudar
-- Generación de diagrama de Gantt
+- Generación de diagrama de Gantt en columnas, con porciones contiguas fusionadas
 - Cálculo de métricas de rendimiento
 - Identificación de procesos no expulsivos
 """
 
-from typing import List, Dict, Optional
+import heapq
+from typing import List, Optional, Tuple
 from .proceso import Proceso, EstadoProceso
+from .politicas import PoliticaPlanificacion, RoundRobin
+from .gantt import DiagramaGantt
 from dataclasses import dataclass
 from enum import Enum
 
@@ -39,7 +44,8 @@ class ResultadoSimulacion:
         tiempo_medio_espera (float): Tiempo promedio de espera
         tiempo_medio_respuesta (float): Tiempo promedio de respuesta
         tiempo_medio_retorno (float): Tiempo promedio de retorno
-        diagrama_gantt (List[Dict[str, int]]): Diagrama de Gantt de la simulación
+        diagrama_gantt (DiagramaGantt): Diagrama de Gantt de la simulación
+            (secuencia de {"proceso_id", "inicio", "fin"})
         procesos_no_expulsivos (List[Proceso]): Procesos que no fueron interrumpidos
     """
     procesos: List[Proceso]
@@ -47,39 +53,54 @@ class ResultadoSimulacion:
     tiempo_medio_espera: float
     tiempo_medio_respuesta: float
     tiempo_medio_retorno: float
-    diagrama_gantt: List[Dict[str, int]]
+    diagrama_gantt: DiagramaGantt
     procesos_no_expulsivos: List[Proceso]
 
 class Simulador:
     """
-    Simulador de procesos usando el algoritmo Round Robin.
+    Simulador de procesos (Round Robin por defecto).
+    
+    La política de planificación es intercambiable (ver models.politicas):
+    la cola de listos es la propia política, que decide el orden y la
+    duración de cada porción de ejecución.
+    
+    La simulación está dirigida por eventos: las llegadas se guardan en un
+    heap ordenado por tiempo de llegada y, cuando la CPU queda ociosa, el
+    reloj salta directamente a la siguiente llegada en lugar de avanzar
+    de uno en uno.
     
     Attributes:
         quantum (int): Tiempo de quantum para cada proceso
         tiempo_actual (int): Tiempo actual de la simulación
         procesos (List[Proceso]): Lista de todos los procesos
-        cola_listos (List[Proceso]): Cola de procesos listos para ejecutar
+        cola_listos (PoliticaPlanificacion): Cola de listos de la política
         proceso_actual (Optional[Proceso]): Proceso en ejecución
         procesos_terminados (List[Proceso]): Procesos que han terminado
-        diagrama_gantt (List[Dict[str, int]]): Registro de ejecución
+        diagrama_gantt (DiagramaGantt): Registro de ejecución
         pausado (bool): Estado de pausa de la simulación
     """
     
-    def __init__(self, quantum: int = 1):
+    def __init__(self, quantum: int = 1, politica: Optional[PoliticaPlanificacion] = None):
         """
         Inicializa el simulador.
         
         Args:
             quantum (int): Tiempo de quantum para cada proceso
+            politica (Optional[PoliticaPlanificacion]): Política de
+                planificación, creada con el mismo quantum (Round Robin si
+                no se indica)
         """
         self.quantum = quantum
         self.tiempo_actual = 0
         self.procesos: List[Proceso] = []
-        self.cola_listos: List[Proceso] = []
+        self.cola_listos: PoliticaPlanificacion = politica if politica is not None else RoundRobin(quantum=quantum)
         self.proceso_actual: Optional[Proceso] = None
         self.procesos_terminados: List[Proceso] = []
-        self.diagrama_gantt: List[Dict[str, int]] = []
+        self.diagrama_gantt = DiagramaGantt()
         self.pausado = False
+        # Heap de llegadas pendientes: (tiempo_llegada, secuencia, proceso)
+        self._llegadas: List[Tuple[int, int, Proceso]] = []
+        self._secuencia = 0
         
     def agregar_proceso(self, proceso: Proceso):
         """
@@ -89,22 +110,27 @@ class Simulador:
             proceso (Proceso): Proceso a agregar
         """
         self.procesos.append(proceso)
+        heapq.heappush(self._llegadas, (proceso.tiempo_llegada, self._secuencia, proceso))
+        self._secuencia += 1
         
     def iniciar_simulacion(self):
         """
         Inicializa o reinicia la simulación.
-        Reinicia todos los contadores y colas, y ordena los procesos
-        por tiempo de llegada.
+        Reinicia todos los contadores y colas, ordena los procesos
+        por tiempo de llegada y reconstruye el heap de llegadas.
         """
         self.tiempo_actual = 0
-        self.cola_listos = []
+        self.cola_listos.reiniciar()
         self.proceso_actual = None
         self.procesos_terminados = []
-        self.diagrama_gantt = []
+        self.diagrama_gantt = DiagramaGantt()
         self.pausado = False
         
-        # Ordenar procesos por tiempo de llegada
+        # Ordenar procesos por tiempo de llegada (estable: respeta el orden de alta)
         self.procesos.sort(key=lambda p: p.tiempo_llegada)
+        self._llegadas = [(p.tiempo_llegada, i, p) for i, p in enumerate(self.procesos)]
+        heapq.heapify(self._llegadas)
+        self._secuencia = len(self.procesos)
         
     def pausar_simulacion(self):
         """Pausa la simulación."""
@@ -114,6 +140,11 @@ class Simulador:
         """Reanuda la simulación pausada."""
         self.pausado = False
         
+    def _admitir_llegadas(self):
+        """Mueve a la cola de listos los procesos cuya llegada ya ocurrió."""
+        while self._llegadas and self._llegadas[0][0] <= self.tiempo_actual:
+            self.cola_listos.agregar(heapq.heappop(self._llegadas)[2])
+            
     def siguiente_paso(self) -> bool:
         """
         Ejecuta un paso de la simulación.
@@ -125,50 +156,84 @@ class Simulador:
         4. Se actualiza el diagrama de Gantt
         5. Se maneja la terminación o interrupción del proceso
         
+        Si la CPU está ociosa, el reloj avanza hasta la siguiente llegada.
+        
         Returns:
-            bool: True si la simulación continúa, False si ha terminado
+            bool: True si el paso hizo avanzar la simulación, False si está
+                  pausada o ya no quedan procesos por ejecutar ni por llegar
         """
         if self.pausado:
             return False
-            
-        # Agregar procesos que han llegado
-        for proceso in self.procesos:
-            if proceso.tiempo_llegada == self.tiempo_actual and proceso not in self.cola_listos:
-                self.cola_listos.append(proceso)
-                
+        return self._ejecutar_paso()
+        
+    def _ejecutar_paso(self) -> bool:
+        """
+        Ejecuta un paso de la simulación sin comprobar la pausa.
+        
+        Returns:
+            bool: True si se ejecutó un quantum o se avanzó el reloj
+        """
+        self._admitir_llegadas()
+        if self.proceso_actual is None and not self.cola_listos and not self._llegadas:
+            return False
+        
         # Si no hay proceso actual y hay procesos en cola
         if self.proceso_actual is None and self.cola_listos:
-            self.proceso_actual = self.cola_listos.pop(0)
+            self.proceso_actual = self.cola_listos.siguiente()
             self.proceso_actual.actualizar_estado(EstadoProceso.EJECUCION, self.tiempo_actual)
             
         # Ejecutar proceso actual
         if self.proceso_actual:
-            tiempo_ejecutado = self.proceso_actual.ejecutar(self.quantum)
-            self.diagrama_gantt.append({
-                "proceso_id": self.proceso_actual.id,
-                "inicio": self.tiempo_actual,
-                "fin": self.tiempo_actual + tiempo_ejecutado
-            })
+            porcion = self.cola_listos.porcion(self.proceso_actual, self.quantum)
+            if self.cola_listos.expulsa_en_llegada and self._llegadas:
+                # Cortar la porción en la próxima llegada para reevaluar
+                porcion = min(porcion, self._llegadas[0][0] - self.tiempo_actual)
+            tiempo_ejecutado = self.proceso_actual.ejecutar(porcion)
+            self.diagrama_gantt.agregar(
+                self.proceso_actual.id,
+                self.tiempo_actual,
+                self.tiempo_actual + tiempo_ejecutado
+            )
             
             self.tiempo_actual += tiempo_ejecutado
             
+            # Los procesos que llegaron durante el quantum entran antes
+            # que el proceso interrumpido
+            self._admitir_llegadas()
+            
             # Verificar si el proceso ha terminado
             if self.proceso_actual.tiempo_restante == 0:
                 self.proceso_actual.actualizar_estado(EstadoProceso.TERMINADO, self.tiempo_actual)
                 self.procesos_terminados.append(self.proceso_actual)
+                self.cola_listos.olvidar(self.proceso_actual)
                 self.proceso_actual = None
             else:
                 # El proceso no ha terminado, volver a la cola
                 self.proceso_actual.actualizar_estado(EstadoProceso.LISTO, self.tiempo_actual)
-                self.cola_listos.append(self.proceso_actual)
+                self.cola_listos.reencolar(self.proceso_actual, tiempo_ejecutado)
                 self.proceso_actual = None
         else:
-            self.tiempo_actual += 1
+            # CPU ociosa: saltar a la siguiente llegada
+            self.tiempo_actual = self._llegadas[0][0]
             
-        # Verificar si la simulación ha terminado
-        return len(self.procesos_terminados) < len(self.procesos)
+        return True
+        
+    def run_to_completion(self) -> Optional[ResultadoSimulacion]:
+        """
+        Ejecuta la simulación hasta que todos los procesos terminen.
+        
+        Continúa desde el estado actual (llamar antes a iniciar_simulacion
+        para empezar desde cero) e ignora la pausa. El coste es
+        O(n log n + número de quantums ejecutados).
+        
+        Returns:
+            Optional[ResultadoSimulacion]: Resultados de la simulación
+        """
+        while self._ejecutar_paso():
+            pass
+        return self.obtener_resultados()
         
-    def obtener_resultados(self) -> ResultadoSimulacion:
+    def obtener_resultados(self) -> Optional[ResultadoSimulacion]:
         """
         Obtiene los resultados de la simulación.
         
@@ -191,7 +256,7 @@ class Simulador:
         # Identificar procesos no expulsivos (aquellos que no fueron interrumpidos)
         procesos_no_expulsivos = [
             p for p in self.procesos_terminados
-            if p.tiempo_servicio == p.tiempo_retorno - p.tiempo_llegada
+            if p.tiempo_servicio == p.tiempo_fin - p.tiempo_inicio
         ]
         
         return ResultadoSimulacion(
@@ -0,0 +1,74 @@
+import asyncio
+
+from desktop_app.canal_cambios import (CanalCambios, EVENTO_ACTUALIZADO, EVENTO_AGREGADO,
+                                       EVENTO_ELIMINADO)
+
+def _en_bucle(prueba):
+    async def ejecutar():
+        return prueba(asyncio.get_running_loop())
+    return asyncio.run(ejecutar())
+
+def test_primer_envio_es_el_catalogo():
+    def prueba(loop):
+        suscriptor = CanalCambios().suscribir(loop)
+        # Los cambios anteriores al primer envío ya están en el catálogo completo
+        suscriptor.agregar(EVENTO_ACTUALIZADO, 1, 1, {'estado': 'Listo'})
+        assert suscriptor.tomar() == (True, [])
+        assert suscriptor.tomar() == (False, [])
+    _en_bucle(prueba)
+
+def test_coalescencia_por_pid():
+    def prueba(loop):
+        canal = CanalCambios()
+        suscriptor = canal.suscribir(loop)
+        suscriptor.tomar()
+        canal.publicar(EVENTO_ACTUALIZADO, 2, 1, {'estado': 'Ejecución'})
+        canal.publicar(EVENTO_ACTUALIZADO, 3, 1, {'rafaga_restante': 4})
+        canal.publicar(EVENTO_ACTUALIZADO, 4, 1, {'estado': 'Listo'})
+        canal.publicar(EVENTO_AGREGADO, 5, 2, {'pid': 2, 'estado': 'Listo'})
+        canal.publicar(EVENTO_ACTUALIZADO, 6, 2, {'estado': 'Ejecución'})
+        canal.publicar(EVENTO_ACTUALIZADO, 7, 3, {'estado': 'Ejecución'})
+        canal.publicar(EVENTO_ELIMINADO, 8, 3, {})
+        resincronizar, cambios = suscriptor.tomar()
+        assert not resincronizar
+        assert sorted(cambios, key=lambda cambio: cambio[2]) == [
+            (EVENTO_ACTUALIZADO, 4, 1, {'estado': 'Listo', 'rafaga_restante': 4}),
+            # Agregado y después actualizado: un agregado con los valores finales
+            (EVENTO_AGREGADO, 6, 2, {'pid': 2, 'estado': 'Ejecución'}),
+            (EVENTO_ELIMINADO, 8, 3, {}),
+        ]
+    _en_bucle(prueba)
+
+def test_resincronizar_al_superar_el_maximo():
+    def prueba(loop):
+        canal = CanalCambios(max_pendientes=3)
+        lento, rapido = canal.suscribir(loop), canal.suscribir(loop)
+        lento.tomar()
+        rapido.tomar()
+        for pid in range(1, 4):
+            canal.publicar(EVENTO_ACTUALIZADO, pid, pid, {'estado': 'Listo'})
+        assert len(rapido.tomar()[1]) == 3
+        # Repetir PIDs no cuenta: la cola crece con los procesos, no con los cambios
+        for version in range(4, 20):
+            canal.publicar(EVENTO_ACTUALIZADO, version, version % 3 + 1, {'rafaga_restante': version})
+        assert not lento.resincronizar
+        assert len(rapido.tomar()[1]) == 3
+        canal.publicar(EVENTO_ACTUALIZADO, 20, 4, {'estado': 'Listo'})
+        assert lento.resincronizar
+        assert lento.tomar() == (True, [])
+        # El cliente que vació su cola no se ve afectado
+        assert rapido.tomar() == (False, [(EVENTO_ACTUALIZADO, 20, 4, {'estado': 'Listo'})])
+    _en_bucle(prueba)
+
+def test_esperar_y_desuscribir():
+    async def prueba():
+        canal = CanalCambios()
+        suscriptor = canal.suscribir(asyncio.get_running_loop())
+        assert await suscriptor.esperar(0.01)
+        suscriptor.tomar()
+        assert not await suscriptor.esperar(0.01)
+        canal.publicar(EVENTO_ACTUALIZADO, 1, 1, {})
+        assert await suscriptor.esperar(0.01)
+        canal.desuscribir(suscriptor)
+        assert len(canal) == 0
+    asyncio.run(prueba())
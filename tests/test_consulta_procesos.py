@@ -0,0 +1,93 @@
+import contextlib
+import itertools
+
+import psutil
+import pytest
+
+from desktop_app.consulta_procesos import (Estado, Filtro, IndiceProcesos, NombreCoincide,
+                                           PrefijoNombre, Usuario, filtrar)
+
+class _Proceso:
+    def __init__(self, pid, nombre, usuario, estado):
+        self.pid = pid
+        self._datos = (nombre, usuario, estado)
+
+    def oneshot(self):
+        return contextlib.nullcontext()
+
+    def name(self):
+        return self._datos[0]
+
+    def username(self):
+        if self._datos[1] is None:
+            raise psutil.AccessDenied(self.pid)
+        return self._datos[1]
+
+    def status(self):
+        if self._datos[2] is None:
+            raise psutil.NoSuchProcess(self.pid)
+        return self._datos[2]
+
+_PROCESOS = [
+    (1, "systemd", "root", "sleeping"),
+    (2, "python3", "ana", "running"),
+    (3, "Python", "root", "sleeping"),
+    (4, "python3.11", "ana", "zombie"),
+    (5, "pyworker1", "luis", "running"),
+    (6, "bash", "luis", "sleeping"),
+    (7, "svchost.exe", None, "running"),
+    (8, "perdido", "root", None),
+]
+
+def _muestras():
+    return {pid: (float(pid), 0.0, pid, _Proceso(pid, *datos)) for pid, *datos in _PROCESOS}
+
+def _pids(muestras, filtro):
+    return sorted(muestra[2] for muestra in filtrar(muestras, IndiceProcesos(muestras), filtro))
+
+def test_indices():
+    indice = IndiceProcesos(_muestras())
+    # El proceso que termina durante la lectura no se indexa
+    assert indice.todos == {1, 2, 3, 4, 5, 6, 7}
+    assert indice.por_usuario["ana"] == {2, 4}
+    assert indice.por_usuario[None] == {7}
+    assert indice.por_estado["running"] == {2, 5, 7}
+    assert indice.por_prefijo("PYTHON") == {2, 3, 4}
+    assert indice.por_prefijo("python3.") == {4}
+    assert indice.por_prefijo("z") == set()
+
+def test_filtros_simples():
+    muestras = _muestras()
+    assert _pids(muestras, Usuario("root")) == [1, 3]
+    assert _pids(muestras, Estado("zombie")) == [4]
+    assert _pids(muestras, PrefijoNombre("py")) == [2, 3, 4, 5]
+    assert _pids(muestras, NombreCoincide("python?")) == [2]
+    assert _pids(muestras, NombreCoincide("*worker?")) == [5]
+    assert _pids(muestras, NombreCoincide("[bs]*")) == [1, 6, 7]
+
+def test_filtros_compuestos():
+    muestras = _muestras()
+    assert _pids(muestras, Usuario("ana") & NombreCoincide("python*") & ~Estado("zombie")) == [2]
+    assert _pids(muestras, Usuario("luis") | Estado("zombie")) == [4, 5, 6]
+    assert _pids(muestras, ~NombreCoincide("py*")) == [1, 6, 7]
+    assert _pids(muestras, ~(Usuario("root") | NombreCoincide("*e*"))) == [2, 4, 6]
+
+def test_filtro_sin_cumple_no_se_instancia():
+    class SoloIndice(Filtro):
+        def candidatos(self, indice):
+            return set()
+
+    with pytest.raises(TypeError):
+        SoloIndice()
+
+def test_indices_coinciden_con_el_recorrido_completo():
+    muestras = _muestras()
+    indice = IndiceProcesos(muestras)
+    basicos = [Usuario("root"), Usuario("ana"), Estado("running"), PrefijoNombre("py"),
+               NombreCoincide("*o*"), NombreCoincide("py*3")]
+    compuestos = list(basicos)
+    for a, b in itertools.combinations(basicos, 2):
+        compuestos += [a & b, a | b, ~a & b, ~(a | b)]
+    for filtro in compuestos:
+        esperado = sorted(pid for pid, datos in indice.atributos.items() if filtro.cumple(*datos))
+        assert _pids(muestras, filtro) == esperado
@@ -0,0 +1,100 @@
+import os
+import threading
+
+from desktop_app.contenedor import ContenedorSalidas, EscritorContenedor, main, obtener_contenedor
+from desktop_app.file_writer import MODO_CONTENEDOR
+from desktop_app.planificador_temporizado import PlanificadorTemporizado
+from desktop_app.proceso import Proceso
+
+def _leer(ruta):
+    with open(ruta, encoding="utf-8") as f:
+        return f.read()
+
+def test_anexar_leer_y_exportar(tmp_path):
+    ruta = str(tmp_path / "salidas")
+    with ContenedorSalidas(ruta) as contenedor:
+        assert contenedor.anexar(1, 10, "python", "hola") == 1
+        assert contenedor.anexar(1, 20, "añoé", "ñandú€") == 1
+        assert contenedor.anexar(1, 10, "python", "adiós") == 2
+        assert contenedor.leer(1, 10) == "adiós"
+        assert contenedor.leer(1, 10, 1) == "hola"
+        assert contenedor.leer(1, 20) == "ñandú€"
+        assert contenedor.claves() == [(1, 10, 1), (1, 20, 1), (1, 10, 2)]
+        rutas = sorted(contenedor.exportar(str(tmp_path / "txt"), pid=10))
+    assert [os.path.basename(r) for r in rutas] == ["proceso_10_python.txt", "proceso_10_python_2.txt"]
+    assert [_leer(r) for r in rutas] == ["hola", "adiós"]
+
+def test_reabrir_conserva_el_indice(tmp_path):
+    ruta = str(tmp_path / "salidas")
+    with ContenedorSalidas(ruta) as contenedor:
+        contenedor.anexar(2, 5, "a", "x" * 1000)
+    with ContenedorSalidas(ruta) as contenedor:
+        assert len(contenedor) == 1
+        assert contenedor.leer(2, 5) == "x" * 1000
+        assert contenedor.anexar(2, 5, "a", "y") == 2
+
+def test_registro_incompleto_se_descarta(tmp_path):
+    ruta = str(tmp_path / "salidas")
+    with ContenedorSalidas(ruta) as contenedor:
+        contenedor.anexar(1, 1, "a", "uno")
+        contenedor.anexar(1, 2, "b", "dos")
+    # Corte a mitad del último registro del índice
+    with open(ruta + ".idx", "r+b") as f:
+        f.truncate(os.path.getsize(ruta + ".idx") - 3)
+    with ContenedorSalidas(ruta) as contenedor:
+        assert contenedor.claves() == [(1, 1, 1)]
+        contenedor.anexar(1, 3, "c", "tres")
+        assert contenedor.leer(1, 3) == "tres"
+    assert os.path.getsize(ruta + ".idx") % 40 == 0
+
+def test_lecturas_concurrentes_con_escrituras(tmp_path):
+    with ContenedorSalidas(str(tmp_path / "salidas")) as contenedor:
+        contenedor.anexar(0, 0, "base", "base")
+        errores = []
+
+        def leer():
+            for _ in range(200):
+                if contenedor.leer(0, 0, 1) != "base":
+                    errores.append("lectura incorrecta")
+
+        lector = threading.Thread(target=leer)
+        lector.start()
+        for pid in range(1, 200):
+            contenedor.anexar(0, pid, "p", str(pid))
+        lector.join()
+        assert not errores
+        assert all(contenedor.leer(0, pid) == str(pid) for pid in range(1, 200))
+
+def test_escritor_anexa_al_cerrar(tmp_path):
+    with ContenedorSalidas(str(tmp_path / "salidas")) as contenedor:
+        with EscritorContenedor(contenedor, 3, 7, "p") as escritor:
+            for caracter in "abc":
+                escritor.escribir(caracter)
+            assert len(contenedor) == 0
+        assert escritor.ejecucion == 1
+        assert contenedor.leer(3, 7) == "abc"
+
+def test_modo_contenedor_desde_el_planificador(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    procesos = [Proceso(pid=pid, nombre=f"P{pid}", usuario="u", descripcion=f"Proceso P{pid}",
+                        prioridad=0, modo_escritura=MODO_CONTENEDOR, catalogo_id=4)
+                for pid in (1, 2)]
+    terminados = threading.Event()
+    PlanificadorTemporizado(0, al_terminar=lambda proc: proc.pid == 2 and terminados.set()).iniciar(procesos)
+    assert terminados.wait(5)
+    contenedor = obtener_contenedor()
+    assert contenedor.leer(4, 1) == "Proceso P1"
+    assert contenedor.leer(4, 2) == "Proceso P2"
+    # Sin archivos por proceso
+    assert all(proc.archivo is None for proc in procesos)
+    contenedor.cerrar()
+
+def test_linea_de_comandos(tmp_path, capsys):
+    ruta = str(tmp_path / "salidas")
+    with ContenedorSalidas(ruta) as contenedor:
+        contenedor.anexar(1, 10, "a", "uno")
+        contenedor.anexar(2, 20, "b", "dos")
+    main(["listar", ruta])
+    assert "catálogo=2 pid=20 ejecución=1" in capsys.readouterr().out
+    main(["exportar", ruta, str(tmp_path / "txt"), "--catalogo", "2"])
+    assert os.listdir(tmp_path / "txt") == ["proceso_20_b.txt"]
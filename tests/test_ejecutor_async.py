@@ -0,0 +1,83 @@
+import logging
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "web_app"))
+
+from ejecutor_async import EjecutorAsincrono
+from simulacion_virtual import EstadoPlanificacion
+
+def _procesos():
+    return [
+        {'pid': 1, 'nombre': 'a', 'usuario': 'u', 'descripcion': 'abcd', 'prioridad': 0,
+         't_llegada': 0, 'rafaga_total': 4, 'rafaga_restante': 4, 't_final': None,
+         'turnaround': None, 'estado': 'Listo', 'historial': []},
+        {'pid': 2, 'nombre': 'b', 'usuario': 'u', 'descripcion': 'abc', 'prioridad': 0,
+         't_llegada': 0, 'rafaga_total': 3, 'rafaga_restante': 3, 't_final': None,
+         'turnaround': None, 'estado': 'Listo', 'historial': []},
+    ]
+
+class _EstadoRoto:
+    cola_terminados = []
+
+    def porciones(self):
+        raise RuntimeError("fallo de prueba")
+        yield
+
+def test_limite_no_positivo():
+    with pytest.raises(ValueError):
+        EjecutorAsincrono(0)
+
+def test_simulaciones_con_limite_de_concurrencia():
+    ejecutor = EjecutorAsincrono(1)
+    resultados = {}
+    futuros = []
+    for clave in ('a', 'b'):
+        futuros.append(ejecutor.lanzar(clave, EstadoPlanificacion(_procesos(), 2), 0,
+                                       ejecutor.crear_evento_pausa(),
+                                       lambda terminados, clave=clave: resultados.update({clave: terminados})))
+    for futuro in futuros:
+        futuro.result(timeout=5)
+    assert sorted(resultados) == ['a', 'b']
+    assert [p['pid'] for p in resultados['a']] == [1, 2]
+
+def test_pausa_desde_otro_hilo():
+    ejecutor = EjecutorAsincrono(2)
+    pausa_event = ejecutor.crear_evento_pausa()
+    assert pausa_event.is_set()
+    pausa_event.clear()
+    terminado = threading.Event()
+    futuro = ejecutor.lanzar('a', EstadoPlanificacion(_procesos(), 2), 0, pausa_event,
+                             lambda terminados: terminado.set())
+    assert not terminado.wait(0.2)
+    pausa_event.set()
+    futuro.result(timeout=5)
+    assert terminado.is_set()
+
+def test_error_de_simulacion_en_el_log(caplog):
+    ejecutor = EjecutorAsincrono(1)
+    with caplog.at_level(logging.ERROR, logger="ejecutor_async"):
+        futuro = ejecutor.lanzar('rota', _EstadoRoto(), 0, ejecutor.crear_evento_pausa(),
+                                 lambda terminados: None)
+        with pytest.raises(RuntimeError):
+            futuro.result(timeout=5)
+        # El callback de error puede ejecutarse justo después de despertar a result()
+        for _ in range(100):
+            if caplog.records:
+                break
+            time.sleep(0.01)
+    assert any("La simulación rota" in r.getMessage() and r.exc_info for r in caplog.records)
+
+def test_error_de_simulacion_avisa_al_fallar():
+    ejecutor = EjecutorAsincrono(1)
+    terminadas, errores = [], []
+    futuro = ejecutor.lanzar('rota', _EstadoRoto(), 0, ejecutor.crear_evento_pausa(),
+                             terminadas.append, al_fallar=errores.append)
+    with pytest.raises(RuntimeError):
+        futuro.result(timeout=5)
+    assert terminadas == []
+    assert len(errores) == 1 and isinstance(errores[0], RuntimeError)
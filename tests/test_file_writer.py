@@ -0,0 +1,118 @@
+import threading
+
+import pytest
+
+from desktop_app.catalog import Catalogo
+from desktop_app.file_writer import EscritorMapeado, EscritorProceso, GestorEscritores, MODO_BUFFER, MODO_MMAP
+from desktop_app.planificador_temporizado import PlanificadorTemporizado
+from desktop_app.proceso import Proceso
+
+def _leer(ruta):
+    with open(ruta, encoding="utf-8") as f:
+        return f.read()
+
+def test_escritor_acumula_hasta_el_tamano_de_bufer(tmp_path):
+    ruta = str(tmp_path / "p.txt")
+    with EscritorProceso(ruta, tam_buffer=4, intervalo_vaciado=60) as escritor:
+        for caracter in "abc":
+            escritor.escribir(caracter)
+        assert not escritor.abierto
+        escritor.escribir("d")
+        assert _leer(ruta) == "abcd"
+        escritor.escribir("é")
+        assert escritor.escrituras == 1
+    assert _leer(ruta) == "abcdé"
+    assert escritor.aperturas == 1
+
+def test_vaciar_al_pausar(tmp_path):
+    ruta = str(tmp_path / "p.txt")
+    gestor = GestorEscritores(tam_buffer=4096, intervalo_vaciado=60)
+    gestor.escribir(ruta, "ab")
+    assert not (tmp_path / "p.txt").exists()
+    gestor.vaciar(ruta)
+    assert _leer(ruta) == "ab"
+    gestor.escribir(ruta, "c")
+    gestor.cerrar(ruta)
+    assert _leer(ruta) == "abc"
+
+def test_limite_de_archivos_abiertos(tmp_path):
+    rutas = [str(tmp_path / f"p{i}.txt") for i in range(5)]
+    gestor = GestorEscritores(max_abiertos=2, tam_buffer=1)
+    for vuelta in range(3):
+        for ruta in rutas:
+            gestor.escribir(ruta, str(vuelta))
+            assert gestor.abiertos <= 2
+    # vaciar_todos no abre más archivos de los permitidos
+    gestor.vaciar_todos()
+    assert gestor.abiertos <= 2
+    gestor.cerrar_todos()
+    assert gestor.abiertos == 0
+    assert [_leer(ruta) for ruta in rutas] == ["012"] * 5
+
+def test_gestor_compartido_entre_hilos(tmp_path):
+    rutas = [str(tmp_path / f"p{i}.txt") for i in range(8)]
+    gestor = GestorEscritores(max_abiertos=3, tam_buffer=2)
+
+    def copiar(ruta):
+        for caracter in "abcdefghij" * 20:
+            gestor.escribir(ruta, caracter)
+        gestor.cerrar(ruta)
+
+    hilos = [threading.Thread(target=copiar, args=(ruta,)) for ruta in rutas]
+    for hilo in hilos:
+        hilo.start()
+    for hilo in hilos:
+        hilo.join()
+    assert [_leer(ruta) for ruta in rutas] == ["abcdefghij" * 20] * 8
+
+def _copiar_con_planificador(procesos):
+    terminados = threading.Event()
+    pendientes = [len(procesos)]
+
+    def al_terminar(proc):
+        pendientes[0] -= 1
+        if not pendientes[0]:
+            terminados.set()
+
+    PlanificadorTemporizado(0, al_terminar=al_terminar).iniciar(procesos)
+    assert terminados.wait(5)
+
+@pytest.mark.parametrize("descripcion", ["Proceso python", "Proceso añoé€", ""])
+def test_modos_buffer_y_mmap_dejan_el_mismo_archivo(tmp_path, monkeypatch, descripcion):
+    monkeypatch.chdir(tmp_path)
+    procesos = [Proceso(pid=pid, nombre="p", usuario="u", descripcion=descripcion, prioridad=0,
+                        modo_escritura=modo)
+                for pid, modo in ((1, MODO_BUFFER), (2, MODO_MMAP))]
+    _copiar_con_planificador(procesos)
+    contenidos = []
+    for proc in procesos:
+        with open(proc.archivo, "rb") as f:
+            contenidos.append(f.read())
+    assert contenidos == [descripcion.encode("utf-8")] * 2
+
+def test_mmap_con_limite_de_abiertos(tmp_path):
+    descripciones = ["abcdef", "ñandú€"]
+    rutas = []
+    gestor = GestorEscritores(max_abiertos=1)
+    for i, descripcion in enumerate(descripciones):
+        ruta = str(tmp_path / f"p{i}.txt")
+        with open(ruta, "wb") as f:
+            f.truncate(len(descripcion.encode("utf-8")))
+        gestor.registrar(i, EscritorMapeado(ruta, descripcion))
+        rutas.append(ruta)
+    for j in range(6):
+        for i, descripcion in enumerate(descripciones):
+            gestor.escribir(i, descripcion[j])
+            assert gestor.abiertos <= 1
+    gestor.cerrar_todos()
+    assert [_leer(ruta) for ruta in rutas] == descripciones
+
+def test_archivo_al_ejecutar_y_no_al_listar(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    procesos = Catalogo(1, "prueba").seleccionar_procesos(3, "CPU")
+    assert procesos
+    assert all(proc.archivo is None for proc in procesos)
+    assert list(tmp_path.iterdir()) == []
+    _copiar_con_planificador(procesos)
+    for proc in procesos:
+        assert _leer(proc.archivo) == proc.descripcion
@@ -0,0 +1,60 @@
+import pytest
+from models.formato_procesos import (TIPO_BINARIO, TIPO_JSON, TIPO_XML, codificar_binario,
+                                     codificar_json, decodificar_binario, decodificar_json,
+                                     elegir_tipo)
+
+def crear_proceso(pid, historial):
+    return {
+        'pid': pid, 'nombre': f'proc_{pid}', 'usuario': 'usuario ñ', 'descripcion': 'Descripción',
+        'prioridad': pid % 2, 'estado': 'Listo', 't_llegada': pid, 't_final': None,
+        'rafaga_total': 11, 'rafaga_restante': 4, 'num_ejecuciones': 2, 'turnaround': None,
+        'historial': historial,
+    }
+
+def test_binario_ida_y_vuelta():
+    procesos = [crear_proceso(1, [('Listo', 0), ('Ejecución', 3)]),
+                crear_proceso(2, []),
+                crear_proceso(3, [('', 5)])]
+    assert decodificar_binario(codificar_binario(procesos)) == procesos
+
+def test_binario_lista_vacia():
+    assert decodificar_binario(codificar_binario([])) == []
+
+def test_binario_cadenas_vacias():
+    proceso = crear_proceso(1, [])
+    proceso.update(nombre='', usuario='', descripcion='', estado='')
+    assert decodificar_binario(codificar_binario([proceso])) == [proceso]
+
+def test_binario_rechaza_caracter_nulo():
+    proceso = crear_proceso(1, [])
+    proceso['nombre'] = 'a\0b'
+    with pytest.raises(ValueError):
+        codificar_binario([proceso])
+
+def test_binario_datos_no_validos():
+    datos = codificar_binario([crear_proceso(1, [('Listo', 0)])])
+    with pytest.raises(ValueError):
+        decodificar_binario(datos[:-3])
+    with pytest.raises(ValueError):
+        decodificar_binario(b'XXXX' + datos[4:])
+
+def test_json_ida_y_vuelta():
+    procesos = [crear_proceso(1, [])]
+    assert decodificar_json(codificar_json(procesos)) == procesos
+
+def test_elegir_tipo():
+    assert elegir_tipo('') == TIPO_XML
+    assert elegir_tipo('*/*') == TIPO_XML
+    assert elegir_tipo('text/html') == TIPO_XML
+    assert elegir_tipo('application/json') == TIPO_JSON
+    assert elegir_tipo('application/json, application/x-procesos') == TIPO_BINARIO
+    assert elegir_tipo('application/x-procesos;q=0.5, application/json') == TIPO_JSON
+    assert elegir_tipo('application/xml, application/json') == TIPO_XML
+    assert elegir_tipo('application/xml;q=0.2, */*;q=0.1, application/json;q=0.9') == TIPO_JSON
+
+def test_binario_cadenas_nulas():
+    # Usuario sin acceso (ver process_manager._crear_meta)
+    procesos = [crear_proceso(1, [('Listo', 0)]), crear_proceso(2, []), crear_proceso(3, [])]
+    procesos[0]['usuario'] = None
+    procesos[2].update(nombre=None, descripcion='', estado=None)
+    assert decodificar_binario(codificar_binario(procesos)) == procesos
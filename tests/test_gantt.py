@@ -0,0 +1,39 @@
+from models.gantt import DiagramaGantt
+from models.proceso import Proceso
+from models.simulacion import Simulador
+
+def test_fusiona_porciones_contiguas():
+    gantt = DiagramaGantt()
+    gantt.agregar(1, 0, 2)
+    gantt.agregar(1, 2, 4)
+    gantt.agregar(2, 4, 5)
+    gantt.agregar(1, 6, 7)
+    assert len(gantt) == 3
+    assert gantt == [
+        {"proceso_id": 1, "inicio": 0, "fin": 4},
+        {"proceso_id": 2, "inicio": 4, "fin": 5},
+        {"proceso_id": 1, "inicio": 6, "fin": 7},
+    ]
+    assert gantt[-1] == {"proceso_id": 1, "inicio": 6, "fin": 7}
+    assert gantt[1:] == list(gantt)[1:]
+    assert list(gantt.fin) == [4, 5, 7]
+
+def test_proceso_solo_ocupa_un_tramo():
+    simulador = Simulador(quantum=1)
+    simulador.agregar_proceso(Proceso(id=1, nombre="P1", tiempo_servicio=100000, prioridad=1))
+    simulador.iniciar_simulacion()
+    resultados = simulador.run_to_completion()
+    assert resultados.diagrama_gantt == [{"proceso_id": 1, "inicio": 0, "fin": 100000}]
+
+def test_gantt_cubre_la_simulacion():
+    simulador = Simulador(quantum=2)
+    for i in range(50):
+        simulador.agregar_proceso(Proceso(id=i, nombre=f"P{i}", tiempo_llegada=i * 3, tiempo_servicio=1 + i % 5, prioridad=1))
+    simulador.iniciar_simulacion()
+    resultados = simulador.run_to_completion()
+    gantt = resultados.diagrama_gantt
+    # Tramos ordenados, sin solapes y sin dos tramos contiguos del mismo proceso
+    for anterior, siguiente in zip(gantt, gantt[1:]):
+        assert anterior["fin"] <= siguiente["inicio"]
+        assert not (anterior["fin"] == siguiente["inicio"] and anterior["proceso_id"] == siguiente["proceso_id"])
+    assert sum(t["fin"] - t["inicio"] for t in gantt) == sum(1 + i % 5 for i in range(50))
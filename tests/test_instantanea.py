@@ -0,0 +1,57 @@
+import pytest
+from models.instantanea import EscritorInstantanea, LectorInstantanea
+from models.politicas import crear_politica, POLITICAS
+from models.proceso import Proceso
+
+def test_ida_y_vuelta():
+    escritor = EscritorInstantanea(b"TEST")
+    escritor.cadena("Política ñ")
+    escritor.entero(-7)
+    escritor.enteros([1, 2, 2 ** 40, -1])
+    escritor.enteros([])
+    lector = LectorInstantanea(escritor.obtener(), b"TEST")
+    assert lector.cadena() == "Política ñ"
+    assert lector.entero() == -7
+    assert lector.enteros() == [1, 2, 2 ** 40, -1]
+    assert lector.enteros() == []
+    assert lector.terminado()
+
+def test_arreglos_compactos():
+    escritor = EscritorInstantanea(b"TEST")
+    escritor.enteros(range(1000))
+    # Cabecera (10) + longitud (4) + 8 bytes por entero
+    assert len(escritor.obtener()) == 10 + 4 + 8 * 1000
+
+def test_tipo_incorrecto():
+    datos = EscritorInstantanea(b"TEST").obtener()
+    with pytest.raises(ValueError):
+        LectorInstantanea(datos, b"OTRO")
+
+def test_datos_no_validos():
+    with pytest.raises(ValueError):
+        LectorInstantanea(b"JSON{}xxxxxx", b"TEST")
+
+def test_truncada():
+    escritor = EscritorInstantanea(b"TEST")
+    escritor.enteros([1, 2, 3])
+    lector = LectorInstantanea(escritor.obtener()[:-1], b"TEST")
+    with pytest.raises(ValueError):
+        lector.enteros()
+
+@pytest.mark.parametrize("nombre", sorted(POLITICAS))
+def test_volcar_y_cargar_conserva_el_orden(nombre):
+    politica = crear_politica(nombre)
+    procesos = [Proceso(id=i, nombre=f"P{i}", tiempo_servicio=(i * 5) % 7 + 1, prioridad=i % 3)
+                for i in range(10)]
+    for proceso in procesos:
+        politica.agregar(proceso)
+    # Bajar de nivel algunos procesos en las colas multinivel
+    for _ in range(3):
+        proceso = politica.siguiente()
+        politica.reencolar(proceso, 1)
+
+    copia = crear_politica(nombre)
+    copia.cargar(politica.volcar())
+    assert copia.volcar() == politica.volcar()
+    orden = [politica.siguiente().id for _ in range(len(politica))]
+    assert [copia.siguiente().id for _ in range(len(copia))] == orden
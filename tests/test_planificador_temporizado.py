@@ -0,0 +1,91 @@
+import threading
+import time
+
+from desktop_app.planificador_temporizado import PlanificadorTemporizado
+from desktop_app.proceso import Proceso
+
+def _proceso(pid, descripcion):
+    return Proceso(pid=pid, nombre=f"P{pid}", usuario="u", descripcion=descripcion, prioridad=0)
+
+def _leer(proc):
+    with open(proc.archivo, encoding="utf-8") as f:
+        return f.read()
+
+def _planificador(th, n, al_copiar=None):
+    terminados = []
+    listo = threading.Event()
+
+    def al_terminar(proc):
+        terminados.append(proc.pid)
+        if len(terminados) == n:
+            listo.set()
+
+    return PlanificadorTemporizado(th, al_copiar=al_copiar, al_terminar=al_terminar), terminados, listo
+
+def test_copia_todos_los_procesos(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    copiados = []
+    procesos = [_proceso(1, "hola"), _proceso(2, ""), _proceso(3, "añoé")]
+    planificador, terminados, listo = _planificador(
+        1, 3, al_copiar=lambda proc, idx, char: copiados.append((proc.pid, idx, char)))
+    planificador.iniciar(procesos)
+    assert listo.wait(5)
+    assert sorted(terminados) == [1, 2, 3]
+    assert all(proc.estado == "Terminado" and proc.rafaga_restante == 0 for proc in procesos)
+    assert [c for c in copiados if c[0] == 3] == [(3, 1, "a"), (3, 2, "ñ"), (3, 3, "o"), (3, 4, "é")]
+    assert [_leer(proc) for proc in procesos] == ["hola", "", "añoé"]
+
+def test_iniciar_no_crea_archivos(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    procesos = [_proceso(1, "abc"), _proceso(2, "de")]
+    planificador, terminados, listo = _planificador(1, 2)
+    planificador.pausar()
+    planificador.iniciar(procesos)
+    assert list(tmp_path.iterdir()) == []
+    planificador.detener()
+    assert listo.wait(5)
+    # Al detener, los procesos que no llegaron a ejecutar se dan por terminados
+    assert terminados == [1, 2]
+    assert all(proc.estado == "Terminado" for proc in procesos)
+    assert [proc.rafaga_restante for proc in procesos] == [3, 2]
+
+def test_detener_marca_terminados(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    procesos = [_proceso(1, "x" * 50), _proceso(2, "y" * 50)]
+
+    def al_copiar(proc, idx, char):
+        if proc.pid == 2 and idx == 2:
+            planificador.detener()
+
+    planificador, terminados, listo = _planificador(1, 2, al_copiar=al_copiar)
+    planificador.iniciar(procesos)
+    assert listo.wait(5)
+    assert sorted(terminados) == [1, 2]
+    assert all(proc.estado == "Terminado" for proc in procesos)
+    # Lo copiado antes de detener queda en el archivo
+    assert _leer(procesos[1]) == "yy"
+    assert _leer(procesos[0]) == "x" * (50 - procesos[0].rafaga_restante)
+
+def test_pausa_vacia_los_buferes(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    pausado = threading.Event()
+
+    def al_copiar(proc, idx, char):
+        if idx == 3:
+            planificador.pausar()
+            pausado.set()
+
+    planificador, terminados, listo = _planificador(1, 1, al_copiar=al_copiar)
+    proceso = _proceso(1, "abcdef")
+    planificador.iniciar([proceso])
+    assert pausado.wait(5)
+    # El vaciado por tiempo (0.5 s) todavía no llegó: solo la pausa escribe
+    for _ in range(100):
+        if _leer(proceso) == "abc":
+            break
+        time.sleep(0.01)
+    assert _leer(proceso) == "abc"
+    assert not listo.is_set()
+    planificador.reanudar()
+    assert listo.wait(5)
+    assert _leer(proceso) == "abcdef"
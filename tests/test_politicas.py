@@ -0,0 +1,99 @@
+import pytest
+from operator import itemgetter
+from models.proceso import Proceso
+from models.simulacion import Simulador
+from models.politicas import crear_politica, POLITICAS, PoliticaPlanificacion
+
+def _simular(politica, procesos, quantum=2):
+    simulador = Simulador(quantum=quantum, politica=crear_politica(politica, quantum=quantum))
+    for proceso in procesos:
+        simulador.agregar_proceso(proceso)
+    simulador.iniciar_simulacion()
+    return simulador.run_to_completion()
+
+def _procesos():
+    return [
+        Proceso(id=1, nombre="P1", tiempo_llegada=0, tiempo_servicio=8, prioridad=2),
+        Proceso(id=2, nombre="P2", tiempo_llegada=1, tiempo_servicio=4, prioridad=1),
+        Proceso(id=3, nombre="P3", tiempo_llegada=2, tiempo_servicio=2, prioridad=0),
+    ]
+
+def _fines(resultados):
+    return {p.id: p.tiempo_fin for p in resultados.procesos}
+
+def test_fcfs():
+    resultados = _simular("fcfs", _procesos())
+    assert _fines(resultados) == {1: 8, 2: 12, 3: 14}
+
+def test_sjf():
+    resultados = _simular("sjf", _procesos())
+    assert _fines(resultados) == {1: 8, 3: 10, 2: 14}
+
+def test_srtf_expulsa_en_llegada():
+    resultados = _simular("srtf", _procesos())
+    # P1 es expulsado en t=1 por P2; P3 (2) gana a P2 (3 restantes) en t=2
+    assert _fines(resultados) == {3: 4, 2: 7, 1: 14}
+    assert resultados.diagrama_gantt[0] == {"proceso_id": 1, "inicio": 0, "fin": 1}
+
+def test_prioridad():
+    resultados = _simular("prioridad", _procesos())
+    assert _fines(resultados) == {1: 8, 3: 10, 2: 14}
+
+def test_mlfq_baja_de_nivel():
+    resultados = _simular("mlfq", _procesos(), quantum=1)
+    assert resultados.tiempo_total == 14
+    # P1 agota su quantum en el nivel 0 y pasa a porciones de 2
+    porciones_p1 = [g["fin"] - g["inicio"] for g in resultados.diagrama_gantt if g["proceso_id"] == 1]
+    assert porciones_p1[:2] == [1, 2]
+
+def test_politica_desconocida():
+    with pytest.raises(ValueError):
+        crear_politica("lifo")
+
+def test_politica_incompleta_no_se_instancia():
+    class SinSiguiente(PoliticaPlanificacion):
+        def reiniciar(self):
+            self._cola = []
+
+        def agregar(self, proceso):
+            self._cola.append(proceso)
+
+        def __len__(self):
+            return len(self._cola)
+
+        def __iter__(self):
+            return iter(self._cola)
+
+    with pytest.raises(TypeError):
+        PoliticaPlanificacion()
+    with pytest.raises(TypeError):
+        SinSiguiente()
+
+@pytest.mark.parametrize("politica", sorted(POLITICAS))
+def test_politicas_catalogo_grande(politica):
+    procesos = [
+        Proceso(id=i, nombre=f"P{i}", tiempo_llegada=i // 3, tiempo_servicio=1 + i % 7, prioridad=i % 5)
+        for i in range(20000)
+    ]
+    resultados = _simular(politica, procesos, quantum=3)
+    assert len(resultados.procesos) == 20000
+    assert resultados.tiempo_total == sum(1 + i % 7 for i in range(20000))
+
+def test_mlfq_olvida_procesos_terminados():
+    simulador = Simulador(quantum=1, politica=crear_politica("mlfq"))
+    for proceso in _procesos():
+        simulador.agregar_proceso(proceso)
+    simulador.iniciar_simulacion()
+    simulador.run_to_completion()
+    assert simulador.cola_listos._nivel == {}
+
+def test_mlfq_nivel_por_identificador():
+    politica = crear_politica("mlfq", clave_restante=itemgetter('restante'), clave_id=itemgetter('pid'))
+    proceso = {'pid': 7, 'restante': 5}
+    politica.agregar(proceso)
+    politica.siguiente()
+    politica.reencolar(proceso, 1)
+    # Una copia del proceso (p. ej. restaurada de un punto de control) conserva el nivel
+    assert politica.porcion(dict(proceso), 1) == 2
+    politica.olvidar(proceso)
+    assert politica.dato(proceso) == 0
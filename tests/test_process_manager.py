@@ -0,0 +1,147 @@
+import contextlib
+import os
+import subprocess
+import sys
+import time
+
+import psutil
+import pytest
+
+from desktop_app import process_manager
+from desktop_app.process_manager import AlmacenSeries, MuestreadorProcesos, _crear_meta, listar_procesos
+
+class _ProcesoProtegido:
+    """Proceso de psutil de otro usuario: username y create_time deniegan el acceso."""
+    pid = 42
+
+    def oneshot(self):
+        return contextlib.nullcontext()
+
+    def name(self):
+        return "svchost.exe"
+
+    def username(self):
+        raise psutil.AccessDenied(self.pid)
+
+    def status(self):
+        return "running"
+
+    def create_time(self):
+        raise psutil.AccessDenied(self.pid)
+
+class _ProcesoTerminado(_ProcesoProtegido):
+    def name(self):
+        raise psutil.NoSuchProcess(self.pid)
+
+def test_meta_con_acceso_denegado_conserva_el_proceso():
+    meta = _crear_meta(_ProcesoProtegido(), 12.5, 3.0)
+    assert meta is not None
+    assert (meta.pid, meta.nombre, meta.estado, meta.cpu, meta.memoria) == (42, "svchost.exe", "running", 12.5, 3.0)
+    assert meta.usuario is None
+    assert meta.tiempo_creacion is None
+
+def test_meta_de_proceso_terminado():
+    assert _crear_meta(_ProcesoTerminado(), 1.0, 1.0) is None
+
+def _sleep():
+    return subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"])
+
+@pytest.fixture(params=[True, False], ids=["procfs", "psutil"])
+def muestreador(request, monkeypatch):
+    monkeypatch.setattr(process_manager, "USAR_PROCFS", request.param)
+    return MuestreadorProcesos(intervalo=0.05)
+
+def test_muestreador_sigue_altas_y_bajas(muestreador):
+    hijo = _sleep()
+    try:
+        muestreador.actualizar()
+        assert hijo.pid in muestreador._instantanea[1]
+        assert len(muestreador.series.serie(hijo.pid)) == 1
+    finally:
+        hijo.kill()
+        hijo.wait()
+    muestreador.actualizar()
+    assert hijo.pid not in muestreador._instantanea[1]
+    assert muestreador.series.serie(hijo.pid) is None
+
+def test_listar_devuelve_la_antiguedad(muestreador):
+    muestreador.actualizar()
+    time.sleep(0.05)
+    procesos, edad = muestreador.listar(1, "cpu")
+    assert len(procesos) == 1
+    assert 0.05 <= edad <= muestreador.edad()
+
+def test_listar_procesos_usa_el_muestreador_compartido(monkeypatch):
+    muestreador = MuestreadorProcesos(intervalo=60)
+    monkeypatch.setattr(process_manager, "_muestreador", muestreador)
+    # Sin muestreador en marcha se mide en el momento
+    assert listar_procesos(1, "cpu", intervalo=0)[1] == 0.0
+    muestreador.iniciar()
+    try:
+        listar_procesos(1, "cpu")  # Espera al primer tick
+        time.sleep(0.05)
+        procesos, edad = listar_procesos(2, "memoria")
+        assert len(procesos) == 2 and edad >= 0.05
+    finally:
+        muestreador.detener()
+    assert not muestreador.activo
+
+def _muestras(*pids, cpu=1.0, memoria=2.0):
+    return {pid: (cpu, memoria, pid, None) for pid in pids}
+
+def test_series_descartan_procesos_terminados_y_respetan_el_limite():
+    almacen = AlmacenSeries(capacidad=4, max_pids=2)
+    almacen.registrar(time.monotonic(), _muestras(1, 2, 3))
+    assert len(almacen) == 2
+    assert almacen.serie(3) is None
+    # Al terminar el proceso 1 queda sitio para el 3
+    almacen.registrar(time.monotonic(), _muestras(2, 3))
+    assert almacen.serie(1) is None
+    assert (len(almacen.serie(2)), len(almacen.serie(3))) == (2, 1)
+
+def test_series_circulares_y_agregados():
+    almacen = AlmacenSeries(capacidad=3, alfa=0.5)
+    ahora = time.monotonic()
+    for i, cpu in enumerate([10.0, 20.0, 30.0, 40.0, 50.0]):
+        almacen.registrar(ahora - 4 + i, _muestras(7, cpu=cpu))
+    assert len(almacen.serie(7)) == 3
+    assert almacen.agregados("cpu", "pico", ventana=10) == {7: 50.0}
+    assert almacen.agregados("cpu", "media", ventana=10) == {7: 40.0}
+    # Solo la última muestra
+    assert almacen.agregados("cpu", "media", ventana=0.5) == {7: 50.0}
+    assert almacen.agregados("cpu", "ewma") == {7: 40.625}
+
+def test_instantes_sin_perder_precision():
+    almacen = AlmacenSeries(capacidad=10)
+    # 200 días de funcionamiento: float32 ya no distingue ticks de 0.1 s
+    almacen._origen -= 200 * 24 * 3600
+    ahora = time.monotonic()
+    for i in range(5):
+        almacen.registrar(ahora - 0.4 + i * 0.1, _muestras(1, cpu=float(i)))
+    instantes = list(almacen.serie(1).instante)
+    assert instantes == sorted(set(instantes))
+    assert almacen.agregados("cpu", "media", ventana=0.25) == {1: 3.0}
+
+def test_muestreador_sin_series(monkeypatch):
+    monkeypatch.setattr(process_manager, "USAR_PROCFS", False)
+    muestreador = MuestreadorProcesos(intervalo=0.05, guardar_series=False)
+    assert muestreador.series is None
+    muestreador.actualizar()
+    # Los criterios con agregado clasifican por la muestra actual
+    assert [p.pid for p in muestreador.listar(3, "memoria_media")[0]] == \
+           [p.pid for p in muestreador.listar(3, "memoria")[0]]
+
+def test_importa_sin_pwd():
+    # Como en Windows: sin el módulo pwd se usa psutil (que ya lo importó
+    # por su cuenta en Linux)
+    codigo = (
+        "import sys, psutil; sys.modules['pwd'] = None\n"
+        "from desktop_app import procfs, process_manager, consulta_procesos\n"
+        "from desktop_app.catalog import Catalogo\n"
+        "assert not procfs.disponible() and process_manager._crear_lector() is None\n"
+        "assert process_manager.EntradaProc is None and consulta_procesos.EntradaProc is None\n"
+        "filtro = consulta_procesos.NombreCoincide('*')\n"
+        "assert len(Catalogo(1, 'x').seleccionar_procesos(2, 'CPU', filtro)) == 2\n"
+    )
+    raiz = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    subprocess.run([sys.executable, "-c", codigo], cwd=raiz, check=True, timeout=60)
@@ -0,0 +1,284 @@
+import asyncio
+import itertools
+import json
+import time
+import xml.etree.ElementTree as ET
+
+import httpx
+import pytest
+
+from desktop_app import rest_server
+from models.formato_procesos import TIPO_BINARIO, decodificar_binario
+
+_catalogos = itertools.count(1000)
+
+def _proceso(pid, **campos):
+    proceso = {'pid': pid, 'nombre': f'p{pid}', 'usuario': 'ana' if pid % 2 else 'luis',
+               'descripcion': f'Proceso p{pid}', 'prioridad': pid % 3, 'estado': 'Listo',
+               't_llegada': pid, 't_final': None, 'rafaga_total': 10, 'rafaga_restante': 10,
+               'num_ejecuciones': 0, 'turnaround': None, 'historial': [('Listo', 0)]}
+    proceso.update(campos)
+    return proceso
+
+def _publicar(procesos, catalogo_id=None):
+    rest_server.actualizar_procesos(procesos, catalogo_id or next(_catalogos), 'Pruebas')
+
+def _get(url, **cabeceras):
+    async def pedir():
+        transporte = httpx.ASGITransport(app=rest_server.app)
+        async with httpx.AsyncClient(transport=transporte, base_url='http://prueba') as cliente:
+            return await cliente.get(url, headers=cabeceras)
+    return asyncio.run(pedir())
+
+@pytest.fixture(autouse=True)
+def _catalogo():
+    _publicar([_proceso(pid) for pid in range(1, 6)])
+
+@pytest.mark.parametrize('variante', ['{}', 'W/{}', '"otro", {}', '*'])
+def test_etag_304(variante):
+    respuesta = _get('/procesos')
+    assert respuesta.status_code == 200
+    etag = respuesta.headers['etag']
+    respuesta = _get('/procesos', **{'If-None-Match': variante.format(etag)})
+    assert respuesta.status_code == 304
+    assert respuesta.content == b''
+    assert respuesta.headers['etag'] == etag
+
+def test_etag_distinto_o_version_nueva():
+    etag = _get('/procesos').headers['etag']
+    assert _get('/procesos', **{'If-None-Match': '"otro"'}).status_code == 200
+    rest_server.actualizar_proceso(1, estado='Ejecución')
+    # La petición aplica los cambios pendientes antes de responder
+    respuesta = _get('/procesos', **{'If-None-Match': etag})
+    assert respuesta.status_code == 200
+    assert respuesta.headers['etag'] != etag
+    assert b'<estado>Ejecuci\xc3\xb3n</estado>' in respuesta.content
+
+def test_etag_por_representacion():
+    etag_xml = _get('/procesos').headers['etag']
+    etag_json = _get('/procesos', Accept='application/json').headers['etag']
+    assert etag_xml != etag_json
+    assert _get('/procesos', Accept='application/json', **{'If-None-Match': etag_xml}).status_code == 200
+
+def test_actualizaciones_agrupadas_en_una_version():
+    version = rest_server._version
+    procesos = rest_server.procesos_actuales['procesos']
+    for restante in range(9, -1, -1):
+        rest_server.actualizar_proceso(1, rafaga_restante=restante)
+        rest_server.actualizar_proceso(2, rafaga_restante=restante)
+    # Hasta que se apliquen, la lista publicada no se copia
+    assert rest_server.procesos_actuales['procesos'] is procesos
+    datos = _get('/procesos?since=%d' % version).json()
+    assert datos['version'] == version + 1
+    assert datos['actualizados'] == [{'pid': 1, 'campos': {'rafaga_restante': 0}},
+                                     {'pid': 2, 'campos': {'rafaga_restante': 0}}]
+
+def test_temporizador_aplica_los_pendientes():
+    version = rest_server._version
+    rest_server.actualizar_proceso(3, estado='Terminado')
+    for _ in range(100):
+        if rest_server._version > version:
+            break
+        time.sleep(0.01)
+    assert rest_server._version == version + 1
+    assert rest_server._registro_cambios[-1][1:] == ('actualizado', 3, {'estado': 'Terminado'})
+
+def test_sin_cambios_no_hay_version_nueva():
+    version = rest_server._version
+    rest_server.actualizar_proceso(4, estado='Listo')
+    rest_server.actualizar_proceso(999, estado='Ejecución')
+    _get('/procesos')
+    assert rest_server._version == version
+
+def _xml_elementtree(procesos):
+    raiz = ET.Element('procesos')
+    for proc in procesos:
+        elemento = ET.SubElement(raiz, 'proceso')
+        for campo in rest_server._CAMPOS_XML:
+            if proc[campo] is None:
+                ET.SubElement(elemento, campo)
+            else:
+                ET.SubElement(elemento, campo).text = str(proc[campo])
+        historial = ET.SubElement(elemento, 'historial')
+        for estado, duracion in proc['historial']:
+            evento = ET.SubElement(historial, 'evento')
+            ET.SubElement(evento, 'estado').text = estado
+            ET.SubElement(evento, 'duracion').text = str(duracion)
+    return ET.tostring(raiz, encoding='unicode').encode('utf-8')
+
+def test_xml_en_streaming_identico(monkeypatch):
+    # Fragmentos pequeños: el documento se envía en varios trozos
+    monkeypatch.setattr(rest_server, 'TAM_FRAGMENTO_XML', 300)
+    procesos = [_proceso(1, usuario=None, nombre='a<b>&"c"', historial=[('', 0), ('Listo', 2)]),
+                _proceso(2, t_final=12, turnaround=7, descripcion='añoé€', estado=''),
+                _proceso(3, historial=[])] + [_proceso(pid) for pid in range(4, 30)]
+    _publicar(procesos)
+    completo = _get('/procesos')
+    streaming = _get('/procesos?stream=true')
+    assert 'content-length' in completo.headers
+    assert 'content-length' not in streaming.headers
+    assert streaming.content == completo.content == _xml_elementtree(procesos)
+    assert b'<usuario />' in completo.content and b'None' not in completo.content
+    assert completo.headers['etag'] == streaming.headers['etag']
+
+class _Peticion:
+    async def is_disconnected(self):
+        return False
+
+def _eventos_sse(al_recibir, total):
+    async def leer():
+        respuesta = await rest_server.stream_procesos(_Peticion())
+        partes = []
+        async for parte in respuesta.body_iterator:
+            partes.append(parte)
+            if len(partes) == total:
+                break
+            al_recibir(len(partes))
+        await respuesta.body_iterator.aclose()
+        return partes
+    return asyncio.run(asyncio.wait_for(leer(), 5))
+
+def test_stream_keepalive_y_cambios_agrupados(monkeypatch):
+    monkeypatch.setattr(rest_server, 'INTERVALO_KEEPALIVE', 0.05)
+    suscritos = len(rest_server._canal)
+
+    def al_recibir(recibidas):
+        if recibidas == 2:
+            for restante in range(9, 4, -1):
+                rest_server.actualizar_proceso(1, rafaga_restante=restante)
+            rest_server.actualizar_proceso(1, estado='Ejecución')
+
+    catalogo, keepalive, cambio = _eventos_sse(al_recibir, 3)
+    assert catalogo.startswith('event: catalogo\n')
+    assert keepalive == ': keepalive\n\n'
+    # Los seis cambios del proceso llegan como un solo evento
+    cabecera, datos = cambio.rsplit('data: ', 1)
+    assert cabecera.startswith('event: actualizado\n')
+    assert json.loads(datos) == {'pid': 1, 'campos': {'rafaga_restante': 5, 'estado': 'Ejecución'}}
+    assert len(rest_server._canal) == suscritos
+
+def test_stream_resincroniza_con_catalogo_nuevo(monkeypatch):
+    monkeypatch.setattr(rest_server, 'INTERVALO_KEEPALIVE', 5)
+
+    def al_recibir(recibidas):
+        _publicar([_proceso(7)])
+
+    primero, segundo = _eventos_sse(al_recibir, 2)
+    assert primero.startswith('event: catalogo\n') and segundo.startswith('event: catalogo\n')
+    assert [p['pid'] for p in json.loads(segundo.rsplit('data: ', 1)[1])['procesos']] == [7]
+
+def _mismo_catalogo(procesos):
+    _publicar(procesos, rest_server.procesos_actuales['catalogo_id'])
+
+def _desde(version, consulta=''):
+    return _get(f'/procesos?since={version}{consulta}').json()
+
+def test_sincronizacion_incremental():
+    version = rest_server._version
+    assert _desde(version)['completo'] is False
+    _mismo_catalogo([_proceso(1, estado='Ejecución'), _proceso(2), _proceso(3), _proceso(4), _proceso(6)])
+    rest_server.actualizar_proceso(6, rafaga_restante=3)
+    rest_server.actualizar_proceso(2, estado='Bloqueado')
+    datos = _desde(version)
+    assert datos['completo'] is False
+    assert datos['version'] == version + 2
+    # Agregado y luego actualizado: insertado con los valores finales
+    assert datos['insertados'] == [json.loads(json.dumps(_proceso(6, rafaga_restante=3)))]
+    assert datos['actualizados'] == [{'pid': 1, 'campos': {'estado': 'Ejecución'}},
+                                     {'pid': 2, 'campos': {'estado': 'Bloqueado'}}]
+    assert datos['eliminados'] == [5]
+    # Desde la versión intermedia solo queda la segunda tanda
+    datos = _desde(version + 1, '&fields=pid,estado')
+    assert datos['insertados'] == []
+    assert datos['actualizados'] == [{'pid': 2, 'campos': {'estado': 'Bloqueado'}}]
+    assert _desde(version + 1, '&fields=nombre')['actualizados'] == []
+
+def test_sincronizacion_demasiado_antigua(monkeypatch):
+    monkeypatch.setattr(rest_server, 'LIMITE_REGISTRO_CAMBIOS', 6)
+    monkeypatch.setattr(rest_server, 'DESCARTE_REGISTRO_CAMBIOS', 2)
+    version = rest_server._version
+    for restante in range(9, 0, -1):
+        rest_server.actualizar_proceso(restante % 5 + 1, rafaga_restante=restante)
+        _get('/procesos')
+    assert len(rest_server._registro_cambios) <= 6
+    assert len(rest_server._versiones_registro) == len(rest_server._registro_cambios)
+    base = rest_server._version_base_registro
+    assert version < base < rest_server._version
+    # since anterior a los cambios conservados: catálogo completo
+    datos = _desde(base - 1)
+    assert datos['completo'] is True
+    assert [p['pid'] for p in datos['procesos']] == [1, 2, 3, 4, 5]
+    assert _desde(base)['completo'] is False
+    # Versiones de otra instancia o futuras tampoco se pueden reconstruir
+    assert _desde(base, '&instancia=otra')['completo'] is True
+    assert _desde(rest_server._version + 1)['completo'] is True
+
+def test_catalogo_nuevo_invalida_el_registro():
+    version = rest_server._version
+    _publicar([_proceso(1)])
+    assert _desde(version)['completo'] is True
+    assert _desde(rest_server._version)['completo'] is False
+
+def _paginas(consulta):
+    pids, cursor = [], None
+    while True:
+        url = f'/procesos?{consulta}' + (f'&cursor={cursor}' if cursor is not None else '')
+        datos = _get(url).json()
+        pids.append([p['pid'] for p in datos['procesos']])
+        cursor = datos['siguiente']
+        if cursor is None:
+            return pids
+
+def test_paginacion_por_pid():
+    _publicar([_proceso(pid) for pid in (9, 3, 7, 1, 5, 11, 2)])
+    assert _paginas('limit=3') == [[1, 2, 3], [5, 7, 9], [11]]
+    assert _paginas('limit=7') == [[1, 2, 3, 5, 7, 9, 11]]
+    # Un proceso nuevo antes del cursor no desplaza las páginas siguientes
+    primera = _get('/procesos?limit=3').json()
+    _mismo_catalogo([_proceso(pid) for pid in (9, 3, 7, 1, 5, 11, 2, 0)])
+    segunda = _get(f'/procesos?limit=3&cursor={primera["siguiente"]}').json()
+    assert [p['pid'] for p in segunda['procesos']] == [5, 7, 9]
+    assert _get('/procesos?limit=0').status_code == 422
+
+def test_proyeccion_de_campos():
+    datos = _get('/procesos?fields=estado,pid,estado&limit=2').json()
+    assert datos['procesos'] == [{'estado': 'Listo', 'pid': 1}, {'estado': 'Listo', 'pid': 2}]
+    assert list(datos['procesos'][0]) == ['estado', 'pid']
+    respuesta = _get('/procesos?fields=pid,cpu')
+    assert respuesta.status_code == 400
+    assert 'cpu' in respuesta.json()['detail']
+
+def test_filtros_con_cursor():
+    _publicar([_proceso(pid) for pid in range(1, 21)])
+    rest_server.actualizar_proceso(4, estado='Terminado')
+    rest_server.actualizar_proceso(7, estado='Terminado')
+    # usuario 'ana' = PID impar; prioridad = pid % 3
+    assert _paginas('usuario=ana&limit=3') == [[1, 3, 5], [7, 9, 11], [13, 15, 17], [19]]
+    assert _paginas('usuario=ana&prioridad=1&limit=2') == [[1, 7], [13, 19]]
+    assert _paginas('usuario=ana&prioridad=1&estado=Listo&limit=2') == [[1, 13], [19]]
+    assert _paginas('estado=Terminado&fields=pid') == [[4, 7]]
+    assert _paginas('usuario=nadie&limit=2') == [[]]
+
+def test_etag_por_consulta():
+    primera = _get('/procesos?limit=2')
+    segunda = _get(f'/procesos?limit=2&cursor={primera.json()["siguiente"]}')
+    filtrada = _get('/procesos?limit=2&usuario=ana')
+    etags = {r.headers['etag'] for r in (primera, segunda, filtrada)}
+    assert len(etags) == 3
+    # El ETag de una página no vale para otra de la misma versión
+    cabecera = {'If-None-Match': primera.headers['etag']}
+    assert _get('/procesos?limit=2&usuario=ana', **cabecera).status_code == 200
+    assert _get('/procesos?limit=2', **cabecera).status_code == 304
+    # El orden de los filtros en la URL no cambia la consulta
+    assert (_get('/procesos?usuario=ana&prioridad=1').headers['etag'] ==
+            _get('/procesos?prioridad=1&usuario=ana').headers['etag'])
+    # Con una versión nueva el ETag de la misma consulta cambia
+    rest_server.actualizar_proceso(1, estado='Ejecución')
+    assert _get('/procesos?limit=2', **cabecera).status_code == 200
+
+def test_binario_con_usuario_nulo():
+    procesos = [_proceso(1, usuario=None), _proceso(2)]
+    _publicar(procesos)
+    respuesta = _get('/procesos', Accept=TIPO_BINARIO)
+    assert respuesta.status_code == 200
+    assert decodificar_binario(respuesta.content) == procesos
@@ -0,0 +1,63 @@
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from models.proceso import Proceso
+from models.simulacion import Simulador
+from models.simulacion_vectorizada import (
+    simular_round_robin_vectorizado,
+    simular_procesos_vectorizado
+)
+
+def _catalogo(semilla, n, dispersion):
+    rng = random.Random(semilla)
+    return [
+        Proceso(
+            id=i,
+            nombre=f"P{i}",
+            tiempo_llegada=rng.randint(0, dispersion),
+            tiempo_servicio=rng.randint(0, 12),
+            prioridad=0
+        )
+        for i in range(n)
+    ]
+
+@pytest.mark.parametrize("semilla", range(10))
+@pytest.mark.parametrize("quantum", [1, 2, 5])
+@pytest.mark.parametrize("n, dispersion", [(40, 120), (300, 200)])
+def test_coincide_con_simulador(semilla, quantum, n, dispersion):
+    # Carga baja (cola corta) y carga alta (rondas vectorizadas con llegadas)
+    procesos = _catalogo(semilla, n, dispersion)
+    vectorizado = simular_procesos_vectorizado(procesos, quantum)
+    
+    simulador = Simulador(quantum=quantum)
+    for proceso in procesos:
+        simulador.agregar_proceso(proceso)
+    simulador.iniciar_simulacion()
+    resultados = simulador.run_to_completion()
+    
+    assert vectorizado.tiempo_total == resultados.tiempo_total
+    for i, proceso in enumerate(sorted(procesos, key=lambda p: p.id)):
+        assert vectorizado.tiempo_inicio[i] == proceso.tiempo_inicio
+        assert vectorizado.tiempo_fin[i] == proceso.tiempo_fin
+        assert vectorizado.tiempo_retorno[i] == proceso.tiempo_retorno
+        assert vectorizado.tiempo_espera[i] == proceso.tiempo_espera
+        assert vectorizado.tiempo_respuesta[i] == proceso.tiempo_respuesta
+    assert vectorizado.tiempo_medio_retorno == pytest.approx(resultados.tiempo_medio_retorno)
+
+def test_no_expulsivo_ejecuta_rafaga_completa():
+    resultado = simular_round_robin_vectorizado(
+        rafagas=[5, 3, 4],
+        quantum=2,
+        expulsivos=[True, False, True]
+    )
+    # P0: 0-2, P1: 2-5 (completo), P2: 5-7, P0: 7-9, P2: 9-11, P0: 11-12
+    assert resultado.tiempo_fin.tolist() == [12, 5, 11]
+    assert resultado.tiempo_respuesta.tolist() == [0, 2, 5]
+    assert resultado.tiempo_total == 12
+
+def test_quantum_invalido():
+    with pytest.raises(ValueError):
+        simular_round_robin_vectorizado([1, 2], quantum=0)
@@ -89,7 +89,7 @@ def test_simulador():
     # Verificar resultados
     resultados = simulador.obtener_resultados()
     assert resultados is not None
-    assert resultados.tiempo_total == 6
+    assert resultados.tiempo_total == 7  # Ráfagas 4 + 3
     assert len(resultados.procesos_no_expulsivos) == 0  # Ningún proceso es no expulsivo con quantum=2
 
 def test_simulador_pausa():
@@ -108,4 +108,35 @@ def test_simulador_pausa():
     
     # Reanudar simulación
     simulador.reanudar_simulacion()
-    assert simulador.siguiente_paso() 
\ No newline at end of file
+    assert simulador.siguiente_paso() 
+
+def test_simulador_salta_tiempo_ocioso():
+    simulador = Simulador(quantum=2)
+    
+    p1 = Proceso(id=1, nombre="P1", tiempo_llegada=10, tiempo_servicio=3, prioridad=1)
+    simulador.agregar_proceso(p1)
+    simulador.iniciar_simulacion()
+    
+    # CPU ociosa: el reloj salta directamente a la llegada de P1
+    assert simulador.siguiente_paso()
+    assert simulador.tiempo_actual == 10
+    assert p1.tiempo_restante == 3
+    
+    resultados = simulador.run_to_completion()
+    assert resultados.tiempo_total == 13
+    assert p1.tiempo_respuesta == 0
+    assert p1.tiempo_retorno == 3
+    assert p1.tiempo_espera == 0
+
+def test_run_to_completion_muchos_procesos():
+    simulador = Simulador(quantum=3)
+    for i in range(20000):
+        simulador.agregar_proceso(
+            Proceso(id=i, nombre=f"P{i}", tiempo_llegada=i, tiempo_servicio=5, prioridad=0)
+        )
+    simulador.iniciar_simulacion()
+    
+    resultados = simulador.run_to_completion()
+    assert len(resultados.procesos) == 20000
+    assert resultados.tiempo_total == 5 * 20000
+    assert not simulador.siguiente_paso()
@@ -0,0 +1,141 @@
+import struct
+import threading
+import time
+
+import pytest
+
+from desktop_app.file_writer import MODO_MMAP
+from desktop_app.proceso import Proceso
+from desktop_app.simulador import Simulador
+
+@pytest.fixture(autouse=True)
+def _directorio_temporal(tmp_path, monkeypatch):
+    # El simulador crea los archivos de proceso en catalogo/
+    monkeypatch.chdir(tmp_path)
+
+def _proceso(pid, longitud, prioridad=0):
+    return Proceso(pid=pid, nombre=f"P{pid}", usuario="u", descripcion="x" * longitud, prioridad=prioridad)
+
+def _esperar(simulador, limite=5.0):
+    fin = time.monotonic() + limite
+    while simulador.simulacion_activa and time.monotonic() < fin:
+        time.sleep(0.01)
+    assert not simulador.simulacion_activa
+
+def _fines(simulador):
+    return {p.pid: p.t_final for p in simulador.cola_terminados}
+
+def test_nucleos_avanzan_por_separado():
+    simulador = Simulador(th=0, quantum=10, n_cpus=2)
+    # CPU 0: P1 (1) y P3 (1); CPU 1: P2 (10)
+    simulador.iniciar([_proceso(1, 1), _proceso(2, 10), _proceso(3, 1)])
+    _esperar(simulador)
+    # P3 empieza en cuanto termina P1, sin esperar a la porción de P2
+    assert _fines(simulador) == {1: 1, 3: 2, 2: 10}
+    assert simulador.tiempo_global == 10
+    assert [n.tiempo_ocupado for n in simulador.nucleos] == [2, 10]
+
+def test_robo_al_quedar_libre():
+    # CPU 0: P1 (8) y P3 (3); CPU 1: P2 (1) y P4 (1)
+    procesos = [_proceso(1, 8), _proceso(2, 1), _proceso(3, 3), _proceso(4, 1)]
+    simulador = Simulador(th=0, quantum=10, n_cpus=2, robo_trabajo=True)
+    simulador.iniciar(procesos)
+    _esperar(simulador)
+    # La CPU 1 queda libre en t=2 y roba P3 sin esperar a que termine P1
+    assert _fines(simulador) == {2: 1, 4: 2, 3: 5, 1: 8}
+    assert [n.robos for n in simulador.nucleos] == [0, 1]
+
+def test_sin_robo_cola_propia():
+    procesos = [_proceso(1, 8), _proceso(2, 1), _proceso(3, 3), _proceso(4, 1)]
+    simulador = Simulador(th=0, quantum=10, n_cpus=2)
+    simulador.iniciar(procesos)
+    _esperar(simulador)
+    assert _fines(simulador) == {2: 1, 4: 2, 1: 8, 3: 11}
+
+def test_no_expulsivo_conserva_nucleo():
+    simulador = Simulador(th=0, quantum=2, n_cpus=2)
+    simulador.iniciar([_proceso(1, 5, prioridad=1), _proceso(2, 3), _proceso(3, 1)])
+    _esperar(simulador)
+    assert _fines(simulador) == {2: 3, 1: 5, 3: 6}
+    assert not any(n.cola_ejecucion for n in simulador.nucleos)
+
+def test_instantanea_con_porciones_en_curso(tmp_path):
+    def _preparar():
+        simulador = Simulador(th=0, quantum=3, politica="mlfq", n_cpus=2, robo_trabajo=True)
+        procesos = [_proceso(1, 7), _proceso(2, 2), _proceso(3, 5), _proceso(4, 4)]
+        for i, proc in enumerate(procesos):
+            proc.t_llegada = i
+            simulador.nucleos[i % 2].cola_listos.agregar(proc)
+        for nucleo in simulador.nucleos:
+            simulador._iniciar_porcion(nucleo)
+        return simulador
+
+    referencia = _preparar()
+    referencia.continuar()
+    _esperar(referencia)
+
+    ruta = str(tmp_path / "punto_control.bin")
+    original = _preparar()
+    original.ruta_punto_control = ruta
+    original.guardar_punto_control()
+    with open(ruta, "rb") as f:
+        restaurado = Simulador.restaurar(f.read(), ruta_punto_control=ruta)
+    assert [(n.porcion, n.fin_porcion) for n in restaurado.nucleos] == [(3, 3), (2, 2)]
+    assert restaurado.obtener_estado() == original.obtener_estado()
+
+    restaurado.continuar()
+    _esperar(restaurado)
+    assert _fines(restaurado) == _fines(referencia)
+    # Los archivos se reescriben completos aunque parte se copiara antes del punto de control
+    for proc in restaurado.cola_terminados:
+        with open(proc.archivo, encoding="utf-8") as f:
+            assert f.read() == proc.descripcion
+    assert restaurado.tiempo_global == referencia.tiempo_global
+    # El punto de control se borra al terminar
+    assert not (tmp_path / "punto_control.bin").exists()
+
+def test_obtener_estado_espera_al_evento_en_curso():
+    simulador = Simulador(th=0, quantum=10, n_cpus=2)
+    simulador.nucleos[0].cola_listos.agregar(_proceso(1, 4))
+    estados = []
+    with simulador._lock_estado:
+        hilo = threading.Thread(target=lambda: estados.append(simulador.obtener_estado()))
+        hilo.start()
+        hilo.join(0.1)
+        assert not estados
+    hilo.join(5)
+    assert [p['pid'] for p in estados[0]['cola_listos']] == [1]
+
+def test_copia_las_porciones_al_archivo():
+    procesos = [Proceso(pid=pid, nombre=f"P{pid}", usuario="u", descripcion=descripcion,
+                        prioridad=0, modo_escritura=MODO_MMAP)
+                for pid, descripcion in ((1, "Proceso añoé"), (2, "Proceso b"))]
+    simulador = Simulador(th=0, quantum=3, n_cpus=2)
+    simulador.iniciar(procesos)
+    _esperar(simulador)
+    for proc in procesos:
+        with open(proc.archivo, encoding="utf-8") as f:
+            assert f.read() == proc.descripcion
+
+def _instantanea_terminada():
+    simulador = Simulador(th=0, quantum=2, politica="mlfq", n_cpus=2)
+    simulador.iniciar([_proceso(1, 3), _proceso(2, 1)])
+    _esperar(simulador)
+    return simulador.snapshot()
+
+@pytest.mark.parametrize("indice", [2, 99, -1])
+def test_restaurar_indice_corrupto(indice):
+    datos = _instantanea_terminada()
+    # El último arreglo es el de terminados: su último valor es un índice de proceso
+    with pytest.raises(ValueError):
+        Simulador.restaurar(datos[:-8] + struct.pack("<q", indice))
+
+def test_restaurar_instantanea_corrupta_solo_lanza_valueerror():
+    datos = _instantanea_terminada()
+    assert len(Simulador.restaurar(datos).cola_terminados) == 2
+    for posicion in range(len(datos)):
+        for valor in (0x01, 0x7f, 0xff):
+            try:
+                Simulador.restaurar(datos[:posicion] + bytes([valor]) + datos[posicion + 1:])
+            except ValueError:
+                pass
@@ -0,0 +1,188 @@
+import os
+import sqlite3
+import struct
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "web_app"))
+
+import app as aplicacion
+from simulacion_virtual import EstadoPlanificacion, evaluar_celda
+
+def _procesos():
+    return [
+        {'pid': 1, 'nombre': 'a', 'usuario': 'u', 'descripcion': 'abcd', 'prioridad': 0,
+         't_llegada': 0, 'rafaga_total': 4, 'rafaga_restante': 4, 't_final': None,
+         'turnaround': None, 'estado': 'Listo', 'historial': []},
+        {'pid': 2, 'nombre': 'b', 'usuario': 'u', 'descripcion': 'abc', 'prioridad': 1,
+         't_llegada': 0, 'rafaga_total': 3, 'rafaga_restante': 3, 't_final': None,
+         'turnaround': None, 'estado': 'Listo', 'historial': []},
+    ]
+
+def _estado_bd(sim_id):
+    with sqlite3.connect(aplicacion.DB_PATH) as conn:
+        return conn.execute("SELECT estado FROM simulaciones WHERE id=?", (sim_id,)).fetchone()[0]
+
+@pytest.fixture
+def bd(tmp_path, monkeypatch):
+    monkeypatch.setattr(aplicacion, 'DB_PATH', str(tmp_path / "simulaciones.db"))
+    monkeypatch.setattr(aplicacion, 'simulaciones', {})
+    aplicacion.init_db()
+    # Las pruebas preparan la base de datos sin el bucle de eventos
+    monkeypatch.setattr(aplicacion, 'servicios_iniciados', True)
+    return aplicacion.DB_PATH
+
+@pytest.fixture
+def cliente(bd):
+    return aplicacion.app.test_client()
+
+def test_importar_no_inicia_servicios():
+    assert aplicacion.ejecutor_async is None
+
+def test_primera_peticion_inicia_servicios(tmp_path, monkeypatch):
+    # Como con flask run o un servidor WSGI: nadie llama a iniciar_servicios
+    monkeypatch.setattr(aplicacion, 'DB_PATH', str(tmp_path / "nueva.db"))
+    monkeypatch.setattr(aplicacion, 'servicios_iniciados', False)
+    monkeypatch.setattr(aplicacion, 'SIMULACION_EJECUTOR', 'hilos')
+    llamadas = []
+    init_db = aplicacion.init_db
+    monkeypatch.setattr(aplicacion, 'init_db', lambda: llamadas.append(1) or init_db())
+    cliente = aplicacion.app.test_client()
+    assert cliente.get('/api/historicos').status_code == 200
+    assert cliente.get('/api/historicos').status_code == 200
+    assert llamadas == [1]
+    assert aplicacion.servicios_iniciados
+
+def test_reanudar_solo_con_punto_control(bd, monkeypatch):
+    lanzadas = []
+    monkeypatch.setattr(aplicacion, 'lanzar_simulacion_async',
+                        lambda sim_id, estado, th, pausada=False: lanzadas.append((sim_id, pausada)))
+    sin_punto = aplicacion.guardar_simulacion_bd(2, 10, 'ejecutando')
+    con_punto = aplicacion.guardar_simulacion_bd(2, 10, 'ejecutando')
+    invalido = aplicacion.guardar_simulacion_bd(2, 10, 'ejecutando')
+    estado = EstadoPlanificacion(_procesos(), 2)
+    next(estado.porciones())
+    aplicacion.guardar_puntos_control_bd([(con_punto, estado.snapshot(), True),
+                                          (invalido, b"basura", False)])
+
+    aplicacion.reanudar_simulaciones_interrumpidas()
+
+    assert lanzadas == [(con_punto, True)]
+    assert aplicacion.simulaciones[con_punto]['estado'] == 'pausada'
+    assert _estado_bd(sin_punto) == 'ejecutando'
+    assert _estado_bd(invalido) == 'interrumpida'
+
+def test_simulacion_con_hilos_guarda_estado_final(bd):
+    sim_id = aplicacion.guardar_simulacion_bd(2, 0, 'ejecutando')
+    aplicacion.simulaciones[sim_id] = {'estado': 'ejecutando'}
+    aplicacion.simular_round_robin(sim_id, _procesos(), 0, 2)
+    assert _estado_bd(sim_id) == 'finalizada'
+    assert len(aplicacion.cargar_resultados_bd(sim_id)) == 2
+
+def test_simulacion_virtual_guarda_estado_final(bd):
+    sim_id = aplicacion.guardar_simulacion_bd(2, 0, 'ejecutando')
+    aplicacion.simulaciones[sim_id] = {'estado': 'ejecutando'}
+    aplicacion.guardar_puntos_control_bd([(sim_id, b"instantanea", False)])
+    aplicacion.simular_round_robin_virtual(sim_id, _procesos(), 2)
+    assert _estado_bd(sim_id) == 'finalizada'
+    assert len(aplicacion.cargar_resultados_bd(sim_id)) == 2
+    with sqlite3.connect(aplicacion.DB_PATH) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM puntos_control").fetchone()[0] == 0
+
+def test_simulacion_fallida_no_queda_ejecutando(bd, monkeypatch):
+    from ejecutor_async import EjecutorAsincrono
+
+    class _EstadoRoto:
+        cola_terminados = []
+
+        def porciones(self):
+            raise RuntimeError("fallo de prueba")
+            yield
+
+    ejecutor = EjecutorAsincrono(1)
+    futuros = []
+    lanzar = ejecutor.lanzar
+    monkeypatch.setattr(ejecutor, 'lanzar', lambda *args, **kwargs: futuros.append(lanzar(*args, **kwargs)))
+    monkeypatch.setattr(aplicacion, 'ejecutor_async', ejecutor)
+    sim_id = aplicacion.guardar_simulacion_bd(2, 0, 'ejecutando')
+    aplicacion.simulaciones[sim_id] = {'estado': 'ejecutando'}
+    aplicacion.guardar_puntos_control_bd([(sim_id, b"instantanea", False)])
+
+    aplicacion.lanzar_simulacion_async(sim_id, _EstadoRoto(), 0)
+    with pytest.raises(RuntimeError):
+        futuros[0].result(timeout=5)
+
+    assert aplicacion.simulaciones[sim_id]['estado'] == 'error'
+    assert _estado_bd(sim_id) == 'error'
+    with sqlite3.connect(aplicacion.DB_PATH) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM puntos_control").fetchone()[0] == 0
+
+def test_pausar_simulacion_virtual(cliente, monkeypatch):
+    monkeypatch.setattr(aplicacion, 'fetch_procesos_desktop', _procesos)
+    respuesta = cliente.post('/api/simular?mode=virtual&quantum=2', json={})
+    assert respuesta.status_code == 201
+    sim_id = respuesta.get_json()['simulation_id']
+    assert cliente.post(f'/api/simular/{sim_id}/pausar').status_code == 409
+    assert cliente.post(f'/api/simular/{sim_id}/reiniciar').status_code == 409
+    assert cliente.post('/api/simular/999/pausar').status_code == 404
+
+def test_barrido_reutiliza_pool(cliente, monkeypatch):
+    monkeypatch.setattr(aplicacion, 'fetch_procesos_desktop', _procesos)
+    cuerpo = {'quantums': {'desde': 1, 'hasta': 3, 'paso': 1}, 'politicas': ['round_robin', 'fcfs']}
+    try:
+        respuesta = cliente.post('/api/barrido', json=cuerpo)
+        assert respuesta.status_code == 201
+        pool = aplicacion.pool_barrido
+        assert pool is not None
+        assert cliente.post('/api/barrido', json=cuerpo).status_code == 201
+        assert aplicacion.pool_barrido is pool
+    finally:
+        if aplicacion.pool_barrido is not None:
+            aplicacion.pool_barrido.shutdown()
+            aplicacion.pool_barrido = None
+
+    datos = respuesta.get_json()
+    assert datos['quantums'] == [1, 2, 3]
+    for i, politica in enumerate(datos['politicas']):
+        for j, quantum in enumerate(datos['quantums']):
+            esperado = evaluar_celda(_procesos(), (politica, quantum))
+            for metrica in ('tiempo_medio_espera', 'tiempo_medio_respuesta', 'tiempo_medio_retorno'):
+                assert datos[metrica][i][j] == esperado[metrica]
+    assert len(aplicacion.cargar_barrido_bd(datos['barrido_id'])) == 6
+
+def _instantanea_con_terminados():
+    estado = EstadoPlanificacion(_procesos(), 2)
+    porciones = estado.porciones()
+    while not estado.cola_terminados:
+        next(porciones)
+    return estado.snapshot()
+
+@pytest.mark.parametrize('indice', [2, 99, -1])
+def test_restaurar_indice_corrupto(indice):
+    datos = _instantanea_con_terminados()
+    # El último arreglo es el de terminados: su último valor es un índice de proceso
+    corrupta = datos[:-8] + struct.pack('<q', indice)
+    with pytest.raises(ValueError):
+        EstadoPlanificacion.restaurar(corrupta)
+
+def test_restaurar_instantanea_corrupta_solo_lanza_valueerror():
+    datos = _instantanea_con_terminados()
+    assert EstadoPlanificacion.restaurar(datos).cola_terminados
+    for posicion in range(len(datos)):
+        for valor in (0x01, 0x7f, 0xff):
+            corrupta = datos[:posicion] + bytes([valor]) + datos[posicion + 1:]
+            try:
+                EstadoPlanificacion.restaurar(corrupta)
+            except ValueError:
+                pass
+
+def test_reanudar_con_indice_corrupto(bd, monkeypatch):
+    monkeypatch.setattr(aplicacion, 'lanzar_simulacion_async', lambda *args, **kwargs: None)
+    corrupto, valido = (aplicacion.guardar_simulacion_bd(2, 10, 'ejecutando') for _ in range(2))
+    datos = _instantanea_con_terminados()
+    aplicacion.guardar_puntos_control_bd([(corrupto, datos[:-8] + struct.pack('<q', 99), False),
+                                          (valido, datos, False)])
+    aplicacion.reanudar_simulaciones_interrumpidas()
+    assert _estado_bd(corrupto) == 'interrumpida'
+    assert aplicacion.simulaciones[valido]['estado'] == 'ejecutando'
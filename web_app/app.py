@@ -8,22 +8,36 @@ Características principales:
 - Simulación de procesos con quantum y tiempo de espera configurables
 - Almacenamiento persistente de simulaciones en base de datos SQLite
 - API REST para controlar y monitorear simulaciones
+- Simulaciones en tiempo real como corrutinas asyncio (sin un hilo por simulación)
+- Puntos de control binarios para reanudar simulaciones tras un reinicio
 - Interfaz web para visualizar resultados
 """
 
 import sys
 import os
 import json
+import multiprocessing
 import sqlite3
 import threading
 import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime
 from collections import deque
 from typing import List, Dict, Optional
 from flask import Flask, render_template, jsonify, request, abort
 from werkzeug.exceptions import HTTPException
+from werkzeug.serving import is_running_from_reloader
 
-from config import DB_PATH, FLASK_HOST, FLASK_PORT, FLASK_DEBUG
+# Agregar el directorio raíz al path de Python para importar módulos
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import (
+    DB_PATH, FLASK_HOST, FLASK_PORT, FLASK_DEBUG,
+    BARRIDO_MAX_WORKERS, BARRIDO_MAX_CELDAS,
+    SIMULACION_EJECUTOR, SIMULACION_MAX_CONCURRENTES,
+    PUNTO_CONTROL_INTERVALO, PUNTO_CONTROL_MAX_POR_CICLO
+)
 from desktop_client import (
     fetch_procesos_desktop,
     DesktopClientError,
@@ -31,10 +45,14 @@ from desktop_client import (
     DesktopTimeoutError,
     DesktopResponseError
 )
-
-# Agregar el directorio raíz al path de Python para importar módulos
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
+from ejecutor_async import EjecutorAsincrono
+from simulacion_virtual import (
+    EstadoPlanificacion,
+    crear_cola_listos,
+    ejecutar_planificacion_virtual,
+    evaluar_lote,
+    POLITICAS
+)
 from models.simulacion import Simulador, ResultadoSimulacion
 from models.proceso import Proceso, EstadoProceso
 
@@ -46,6 +64,9 @@ def init_db():
     Tablas creadas:
     - simulaciones: Almacena información general de cada simulación
     - resultados: Almacena los resultados detallados de cada proceso en la simulación
+    - barridos: Almacena cada barrido de parámetros (quantum × política)
+    - barrido_celdas: Almacena los tiempos medios de cada celda de un barrido
+    - puntos_control: Última instantánea binaria de cada simulación en curso
     """
     with sqlite3.connect(DB_PATH) as conn:
         c = conn.cursor()
@@ -55,8 +76,13 @@ def init_db():
             fecha TEXT,
             quantum INTEGER,
             th INTEGER,
-            estado TEXT
+            estado TEXT,
+            politica TEXT DEFAULT 'round_robin'
         )''')
+        # Bases de datos anteriores no tienen la columna politica
+        columnas = [fila[1] for fila in c.execute("PRAGMA table_info(simulaciones)")]
+        if 'politica' not in columnas:
+            c.execute("ALTER TABLE simulaciones ADD COLUMN politica TEXT DEFAULT 'round_robin'")
         # Tabla para almacenar resultados detallados de procesos
         c.execute('''CREATE TABLE IF NOT EXISTS resultados (
             sim_id INTEGER,
@@ -72,8 +98,30 @@ def init_db():
             historial TEXT,
             PRIMARY KEY (sim_id, pid)
         )''')
+        # Tabla para almacenar barridos de parámetros
+        c.execute('''CREATE TABLE IF NOT EXISTS barridos (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            fecha TEXT,
+            pids TEXT
+        )''')
+        # Tabla para almacenar cada celda (política, quantum) de un barrido
+        c.execute('''CREATE TABLE IF NOT EXISTS barrido_celdas (
+            barrido_id INTEGER REFERENCES barridos(id),
+            politica TEXT,
+            quantum INTEGER,
+            tiempo_medio_espera REAL,
+            tiempo_medio_respuesta REAL,
+            tiempo_medio_retorno REAL,
+            PRIMARY KEY (barrido_id, politica, quantum)
+        )''')
+        # Tabla para reanudar simulaciones interrumpidas por un reinicio
+        c.execute('''CREATE TABLE IF NOT EXISTS puntos_control (
+            sim_id INTEGER PRIMARY KEY REFERENCES simulaciones(id),
+            fecha TEXT,
+            pausada INTEGER,
+            datos BLOB
+        )''')
         conn.commit()
-init_db()
 
 # Inicialización de la aplicación Flask
 app = Flask(__name__)
@@ -82,9 +130,54 @@ app = Flask(__name__)
 simulaciones = {}  # Diccionario que almacena el estado de cada simulación: {id: {hilo, colas, ...}}
 simulacion_id_counter = 1  # Contador para generar IDs únicos de simulación
 simulaciones_lock = threading.Lock()  # Lock para sincronización de acceso a simulaciones
+# Bucle de eventos compartido por las simulaciones con TH (modo asyncio);
+# lo crea iniciar_servicios
+ejecutor_async: Optional[EjecutorAsincrono] = None
+# iniciar_servicios ya se ejecutó en este proceso
+servicios_iniciados = False
+servicios_lock = threading.Lock()
+
+# Procesos hijos de los barridos; los crea obtener_pool_barrido en el primer barrido
+pool_barrido: Optional[ProcessPoolExecutor] = None
+pool_barrido_lock = threading.Lock()
+# Trabajadores del pool de barridos
+BARRIDO_WORKERS = BARRIDO_MAX_WORKERS or os.cpu_count() or 1
+
+def obtener_pool_barrido():
+    """
+    Devuelve el pool de procesos de los barridos, creándolo la primera vez.
+    
+    Se usa un único pool para todo el servidor. Los hijos se crean con
+    'spawn': hacer fork de un proceso con varios hilos (Flask, bucle
+    asyncio) no es seguro.
+    
+    Returns:
+        ProcessPoolExecutor: Pool compartido
+    """
+    global pool_barrido
+    with pool_barrido_lock:
+        if pool_barrido is None:
+            pool_barrido = ProcessPoolExecutor(
+                max_workers=BARRIDO_WORKERS,
+                mp_context=multiprocessing.get_context('spawn')
+            )
+        return pool_barrido
+
+def descartar_pool_barrido(pool):
+    """
+    Olvida un pool roto (un hijo murió) para que el siguiente barrido cree otro.
+    
+    Args:
+        pool (ProcessPoolExecutor): Pool que falló
+    """
+    global pool_barrido
+    with pool_barrido_lock:
+        if pool_barrido is pool:
+            pool_barrido = None
+    pool.shutdown(wait=False)
 
 # --- Funciones de Utilidad para Base de Datos ---
-def guardar_simulacion_bd(quantum, th, estado):
+def guardar_simulacion_bd(quantum, th, estado, politica='round_robin'):
     """
     Guarda una nueva simulación en la base de datos.
     
@@ -92,18 +185,32 @@ def guardar_simulacion_bd(quantum, th, estado):
         quantum (int): Tiempo de quantum para la simulación
         th (int): Tiempo de espera entre ejecuciones
         estado (str): Estado inicial de la simulación
+        politica (str): Política de planificación de la simulación
     
     Returns:
         int: ID de la simulación creada
     """
     with sqlite3.connect(DB_PATH) as conn:
         c = conn.cursor()
-        c.execute("INSERT INTO simulaciones (fecha, quantum, th, estado) VALUES (?, ?, ?, ?)",
-                  (datetime.now().isoformat(), quantum, th, estado))
+        c.execute("INSERT INTO simulaciones (fecha, quantum, th, estado, politica) VALUES (?, ?, ?, ?, ?)",
+                  (datetime.now().isoformat(), quantum, th, estado, politica))
         sim_id = c.lastrowid
         conn.commit()
         return sim_id
 
+def actualizar_estado_simulacion_bd(sim_id, estado):
+    """
+    Actualiza el estado de una simulación en la base de datos.
+    
+    Args:
+        sim_id (int): ID de la simulación
+        estado (str): Nuevo estado de la simulación
+    """
+    with sqlite3.connect(DB_PATH) as conn:
+        c = conn.cursor()
+        c.execute("UPDATE simulaciones SET estado=? WHERE id=?", (estado, sim_id))
+        conn.commit()
+
 def guardar_resultados_bd(sim_id, procesos):
     """
     Guarda los resultados de los procesos de una simulación en la base de datos.
@@ -157,20 +264,91 @@ def cargar_simulaciones_bd():
     """
     with sqlite3.connect(DB_PATH) as conn:
         c = conn.cursor()
-        c.execute("SELECT id, fecha, quantum, th, estado FROM simulaciones ORDER BY id DESC")
-        return [dict(zip(['id','fecha','quantum','th','estado'], row)) for row in c.fetchall()]
+        c.execute("SELECT id, fecha, quantum, th, estado, politica FROM simulaciones ORDER BY id DESC")
+        return [dict(zip(['id','fecha','quantum','th','estado','politica'], row)) for row in c.fetchall()]
 
-def simular_round_robin(sim_id, procesos, th, quantum):
+def guardar_barrido_bd(pids, celdas):
     """
-    Ejecuta la simulación del algoritmo Round Robin.
+    Guarda un barrido de parámetros y sus celdas en la base de datos.
+    
+    Args:
+        pids (list): PIDs de la carga de trabajo del barrido
+        celdas (list): Diccionarios con politica, quantum y tiempos medios
+    
+    Returns:
+        int: ID del barrido creado
+    """
+    with sqlite3.connect(DB_PATH) as conn:
+        c = conn.cursor()
+        c.execute("INSERT INTO barridos (fecha, pids) VALUES (?, ?)",
+                  (datetime.now().isoformat(), json.dumps(pids)))
+        barrido_id = c.lastrowid
+        c.executemany("""
+            INSERT INTO barrido_celdas (barrido_id, politica, quantum, tiempo_medio_espera, tiempo_medio_respuesta, tiempo_medio_retorno)
+            VALUES (?, ?, ?, ?, ?, ?)
+        """, [
+            (barrido_id, celda['politica'], celda['quantum'], celda['tiempo_medio_espera'],
+             celda['tiempo_medio_respuesta'], celda['tiempo_medio_retorno'])
+            for celda in celdas
+        ])
+        conn.commit()
+        return barrido_id
+
+def cargar_barrido_bd(barrido_id):
+    """
+    Carga las celdas de un barrido desde la base de datos.
+    
+    Args:
+        barrido_id (int): ID del barrido
+    
+    Returns:
+        list: Lista de diccionarios con politica, quantum y tiempos medios
+    """
+    with sqlite3.connect(DB_PATH) as conn:
+        c = conn.cursor()
+        c.execute("""
+            SELECT politica, quantum, tiempo_medio_espera, tiempo_medio_respuesta, tiempo_medio_retorno
+            FROM barrido_celdas WHERE barrido_id=? ORDER BY politica, quantum
+        """, (barrido_id,))
+        columnas = ['politica', 'quantum', 'tiempo_medio_espera', 'tiempo_medio_respuesta', 'tiempo_medio_retorno']
+        return [dict(zip(columnas, row)) for row in c.fetchall()]
+
+def matriz_barrido(celdas):
+    """
+    Organiza las celdas de un barrido como matrices política × quantum.
+    
+    Args:
+        celdas (list): Diccionarios con politica, quantum y tiempos medios
+    
+    Returns:
+        dict: Ejes (politicas, quantums) y una matriz por cada tiempo medio
+    """
+    politicas = sorted({c['politica'] for c in celdas})
+    quantums = sorted({c['quantum'] for c in celdas})
+    fila = {p: i for i, p in enumerate(politicas)}
+    columna = {q: j for j, q in enumerate(quantums)}
+    matriz = {'politicas': politicas, 'quantums': quantums}
+    for metrica in ('tiempo_medio_espera', 'tiempo_medio_respuesta', 'tiempo_medio_retorno'):
+        valores = [[None] * len(quantums) for _ in politicas]
+        for celda in celdas:
+            valores[fila[celda['politica']]][columna[celda['quantum']]] = celda[metrica]
+        matriz[metrica] = valores
+    return matriz
+
+def simular_round_robin(sim_id, procesos, th, quantum, politica='round_robin'):
+    """
+    Ejecuta la simulación del algoritmo Round Robin (u otra política).
     
     Args:
         sim_id (int): ID de la simulación
         procesos (list): Lista de procesos a simular
         th (int): Tiempo de espera entre ejecuciones (en milisegundos)
         quantum (int): Tiempo de quantum para cada proceso
+        politica (str): Política de planificación de la cola de listos
     """
-    cola_listos = deque(procesos)  # Cola de procesos listos para ejecutar
+    cola_listos = crear_cola_listos(politica, quantum)  # Cola de procesos listos para ejecutar
+    for proceso in procesos:
+        cola_listos.agregar(proceso)
     cola_ejecucion = deque()  # Cola de procesos en ejecución
     cola_terminados = []  # Lista de procesos terminados
     tiempo_global = 0  # Contador de tiempo global
@@ -184,13 +362,13 @@ def simular_round_robin(sim_id, procesos, th, quantum):
         
         # Mover proceso de listos a ejecución si no hay ninguno ejecutándose
         if cola_listos and not cola_ejecucion:
-            proceso = cola_listos.popleft()
+            proceso = cola_listos.siguiente()
             proceso['estado'] = "Ejecución"
             cola_ejecucion.append(proceso)
             
         if cola_ejecucion:
             proceso = cola_ejecucion[0]
-            tiempo_ejecutado = min(quantum, proceso['rafaga_restante'])
+            tiempo_ejecutado = min(cola_listos.porcion(proceso, quantum), proceso['rafaga_restante'])
             time.sleep(tiempo_ejecutado * th / 1000)  # Simular tiempo de ejecución
             proceso['rafaga_restante'] -= tiempo_ejecutado
             proceso['historial'].append(("Ejecución", tiempo_ejecutado))
@@ -201,20 +379,180 @@ def simular_round_robin(sim_id, procesos, th, quantum):
                 proceso['t_final'] = tiempo_global + tiempo_ejecutado
                 proceso['turnaround'] = proceso['t_final'] - proceso['t_llegada']
                 cola_terminados.append(proceso)
+                cola_listos.olvidar(proceso)
                 cola_ejecucion.popleft()
             else:
                 # Si no terminó, mover a la cola correspondiente según prioridad
                 cola_ejecucion.popleft()
                 if proceso['prioridad'] == 0:
                     proceso['estado'] = "Listo"
-                    cola_listos.append(proceso)
+                    cola_listos.reencolar(proceso, tiempo_ejecutado)
                 else:
                     cola_ejecucion.append(proceso)
                     
         tiempo_global += tiempo_ejecutado
         
-    simulaciones[sim_id]['estado'] = 'finalizada'
+    finalizar_simulacion(sim_id, cola_terminados)
+
+def simular_round_robin_virtual(sim_id, procesos, quantum, politica='round_robin'):
+    """
+    Ejecuta la simulación en tiempo virtual (sin esperas TH).
+    
+    Args:
+        sim_id (int): ID de la simulación
+        procesos (list): Lista de procesos a simular
+        quantum (int): Tiempo de quantum para cada proceso
+        politica (str): Política de planificación de la cola de listos
+    """
+    finalizar_simulacion(sim_id, ejecutar_planificacion_virtual(procesos, quantum, politica))
+
+def guardar_puntos_control_bd(lote):
+    """
+    Guarda un lote de instantáneas de simulaciones en curso.
+    
+    Una instantánea que llega después de que la simulación terminara se
+    descarta, para no reanudar en el siguiente arranque algo ya finalizado.
+    
+    Args:
+        lote (list): Tuplas (sim_id, instantánea, pausada)
+    """
+    fecha = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    try:
+        with sqlite3.connect(DB_PATH) as conn:
+            conn.executemany("""
+                INSERT OR REPLACE INTO puntos_control (sim_id, fecha, pausada, datos)
+                SELECT ?, ?, ?, ? WHERE EXISTS (
+                    SELECT 1 FROM simulaciones WHERE id=? AND estado='ejecutando'
+                )
+            """, [(sim_id, fecha, int(pausada), datos, sim_id) for sim_id, datos, pausada in lote])
+            conn.commit()
+    except sqlite3.Error as e:
+        app.logger.error(f"Error al guardar puntos de control: {e}")
+
+def finalizar_simulacion(sim_id, cola_terminados):
+    """
+    Marca una simulación como finalizada y guarda sus resultados.
+    
+    Args:
+        sim_id (int): ID de la simulación
+        cola_terminados (list): Procesos terminados en orden de finalización
+    """
+    with simulaciones_lock:
+        simulaciones[sim_id]['estado'] = 'finalizada'
     guardar_resultados_bd(sim_id, cola_terminados)
+    with sqlite3.connect(DB_PATH) as conn:
+        c = conn.cursor()
+        c.execute("UPDATE simulaciones SET estado='finalizada' WHERE id=?", (sim_id,))
+        c.execute("DELETE FROM puntos_control WHERE sim_id=?", (sim_id,))
+        conn.commit()
+
+def marcar_simulacion_fallida(sim_id, error):
+    """
+    Marca como 'error' una simulación cuya ejecución falló.
+    
+    Se descarta su punto de control para no reanudarla en cada arranque;
+    el error queda en el log del ejecutor.
+    
+    Args:
+        sim_id (int): ID de la simulación
+        error (Exception): Excepción de la simulación
+    """
+    with simulaciones_lock:
+        if sim_id in simulaciones:
+            simulaciones[sim_id]['estado'] = 'error'
+    with sqlite3.connect(DB_PATH) as conn:
+        c = conn.cursor()
+        c.execute("UPDATE simulaciones SET estado='error' WHERE id=?", (sim_id,))
+        c.execute("DELETE FROM puntos_control WHERE sim_id=?", (sim_id,))
+        conn.commit()
+
+def lanzar_simulacion_async(sim_id, estado, th, pausada=False):
+    """
+    Programa una simulación con TH en el bucle de eventos compartido.
+    
+    Args:
+        sim_id (int): ID de la simulación
+        estado (EstadoPlanificacion): Estado inicial o restaurado de la simulación
+        th (int): Tiempo de espera entre ejecuciones (en milisegundos)
+        pausada (bool): Si la simulación empieza en pausa
+    """
+    pausa_event = ejecutor_async.crear_evento_pausa()
+    if pausada:
+        pausa_event.clear()
+    with simulaciones_lock:
+        simulaciones[sim_id]['pausa_event'] = pausa_event
+    ejecutor_async.lanzar(
+        sim_id, estado, th, pausa_event,
+        al_terminar=lambda terminados: finalizar_simulacion(sim_id, terminados),
+        al_fallar=lambda error: marcar_simulacion_fallida(sim_id, error)
+    )
+
+def reanudar_simulaciones_interrumpidas():
+    """
+    Reanuda las simulaciones que estaban en curso cuando se detuvo el servidor.
+    
+    Solo se consideran las que tienen punto de control: continúan desde su
+    última instantánea (en pausa si lo estaban), o se marcan como
+    'interrumpida' si la instantánea no es válida. Las filas 'ejecutando'
+    sin punto de control (bases de datos anteriores, modo 'hilos') no se tocan.
+    """
+    with sqlite3.connect(DB_PATH) as conn:
+        c = conn.cursor()
+        c.execute("""
+            SELECT s.id, s.th, p.pausada, p.datos FROM simulaciones s
+            JOIN puntos_control p ON p.sim_id = s.id
+            WHERE s.estado='ejecutando'
+        """)
+        filas = c.fetchall()
+    for sim_id, th, pausada, datos in filas:
+        try:
+            estado = EstadoPlanificacion.restaurar(datos)
+        except ValueError as e:
+            app.logger.error(f"Punto de control inválido en la simulación {sim_id}: {e}")
+            estado = None
+        if estado is None:
+            actualizar_estado_simulacion_bd(sim_id, 'interrumpida')
+            continue
+        with simulaciones_lock:
+            simulaciones[sim_id] = {
+                'estado': 'pausada' if pausada else 'ejecutando',
+                'procesos': estado.procesos
+            }
+        lanzar_simulacion_async(sim_id, estado, th, bool(pausada))
+
+def iniciar_servicios():
+    """
+    Prepara la base de datos y los servicios en segundo plano del servidor.
+    
+    Crea las tablas, arranca el bucle de eventos de las simulaciones con
+    TH y sus puntos de control, y reanuda las simulaciones interrumpidas.
+    Solo tiene efecto la primera vez. Se llama al arrancar con
+    `python web_app/app.py` y, con cualquier otro lanzador (flask run, un
+    servidor WSGI), antes de atender la primera petición (ver
+    iniciar_servicios_al_primer_uso). Importar este módulo no tiene efectos,
+    de modo que los procesos hijos del barrido (que lo reimportan como
+    __mp_main__) no repiten nada de esto.
+    """
+    global ejecutor_async, servicios_iniciados
+    with servicios_lock:
+        if servicios_iniciados:
+            return
+        servicios_iniciados = True
+        init_db()
+        if SIMULACION_EJECUTOR != 'asyncio' or ejecutor_async is not None:
+            return
+        ejecutor_async = EjecutorAsincrono(SIMULACION_MAX_CONCURRENTES)
+        if PUNTO_CONTROL_INTERVALO > 0:
+            ejecutor_async.iniciar_puntos_control(
+                PUNTO_CONTROL_INTERVALO, PUNTO_CONTROL_MAX_POR_CICLO, guardar_puntos_control_bd
+            )
+        reanudar_simulaciones_interrumpidas()
+
+@app.before_request
+def iniciar_servicios_al_primer_uso():
+    """Inicia los servicios antes de la primera petición si aún no se iniciaron."""
+    if not servicios_iniciados:
+        iniciar_servicios()
 
 # --- Rutas de la API ---
 @app.route('/')
@@ -248,6 +586,10 @@ def simular():
     Parámetros de query:
         th (int): Tiempo de espera entre ejecuciones
         quantum (int): Tiempo de quantum para cada proceso
+        mode (str): 'tiempo_real' (por defecto, respeta TH) o 'virtual'
+            (reloj lógico sin esperas, los resultados se guardan al responder)
+        politica (str): Política de planificación (round_robin por defecto;
+            ver models.politicas.POLITICAS)
     
     Body JSON:
         pids (list): Lista de PIDs de procesos a simular (opcional)
@@ -258,6 +600,14 @@ def simular():
     try:
         th = int(request.args.get('th', 100))
         quantum = int(request.args.get('quantum', 1))
+        modo = request.args.get('mode', 'tiempo_real')
+        if modo not in ('tiempo_real', 'virtual'):
+            abort(400, description=f"Modo de simulación desconocido: {modo}")
+        if quantum <= 0:
+            abort(400, description="El quantum debe ser mayor que cero")
+        politica = request.args.get('politica', 'round_robin')
+        if politica not in POLITICAS:
+            abort(400, description=f"Política de planificación desconocida: {politica}")
         
         # Obtener procesos desde la app de escritorio
         procesos = fetch_procesos_desktop()
@@ -270,13 +620,22 @@ def simular():
             abort(400, description="No se seleccionó ningún proceso válido")
             
         # Iniciar simulación
-        sim_id = guardar_simulacion_bd(quantum, th, 'ejecutando')
+        sim_id = guardar_simulacion_bd(quantum, th, 'ejecutando', politica)
         with simulaciones_lock:
             simulaciones[sim_id] = {'estado': 'ejecutando', 'procesos': procesos_seleccionados}
             
+        if modo == 'virtual':
+            simular_round_robin_virtual(sim_id, procesos_seleccionados, quantum, politica)
+            return jsonify({'simulation_id': sim_id, 'estado': 'finalizada'}), 201
+            
+        if ejecutor_async is not None:
+            estado = EstadoPlanificacion(procesos_seleccionados, quantum, politica)
+            lanzar_simulacion_async(sim_id, estado, th)
+            return jsonify({'simulation_id': sim_id}), 202
+            
         hilo = threading.Thread(
             target=simular_round_robin,
-            args=(sim_id, procesos_seleccionados, th, quantum),
+            args=(sim_id, procesos_seleccionados, th, quantum, politica),
             daemon=True
         )
         hilo.start()
@@ -293,6 +652,106 @@ def simular():
     except ValueError as e:
         return jsonify({'error': f"Parámetros inválidos: {str(e)}"}), 400
 
+def _leer_quantums(spec):
+    """
+    Interpreta la especificación de quantums de un barrido.
+    
+    Args:
+        spec (list | dict): Lista de valores o rango {'desde', 'hasta', 'paso'}
+    
+    Returns:
+        list: Valores de quantum positivos, sin repetir y ordenados
+    """
+    if isinstance(spec, dict):
+        paso = int(spec.get('paso', 1))
+        if paso <= 0:
+            raise ValueError("el paso del rango de quantum debe ser positivo")
+        valores = range(int(spec['desde']), int(spec['hasta']) + 1, paso)
+    else:
+        valores = [int(q) for q in spec]
+    quantums = sorted(set(valores))
+    if not quantums or quantums[0] <= 0:
+        raise ValueError("los valores de quantum deben ser positivos")
+    return quantums
+
+@app.route('/api/barrido', methods=['POST'])
+def barrido():
+    """
+    Ejecuta un barrido de parámetros en tiempo virtual.
+    
+    Cada combinación (política, quantum) se simula en paralelo en el pool
+    de procesos compartido (obtener_pool_barrido), en lotes que llevan la
+    carga de trabajo una sola vez, y se guarda como una fila de
+    barrido_celdas asociada a un único barrido.
+    
+    Body JSON:
+        pids (list): PIDs de la carga de trabajo (opcional, todos por defecto)
+        quantums (list | dict): Valores de quantum o rango {'desde', 'hasta', 'paso'}
+        politicas (list): Políticas a comparar (opcional, 'round_robin' por defecto)
+    
+    Returns:
+        JSON: ID del barrido y matrices de tiempos medios política × quantum
+    """
+    try:
+        datos = request.get_json(silent=True) or {}
+        if 'quantums' not in datos:
+            abort(400, description="Debe indicar los valores de quantum del barrido")
+        quantums = _leer_quantums(datos['quantums'])
+        politicas = datos.get('politicas', ['round_robin'])
+        desconocidas = [p for p in politicas if p not in POLITICAS]
+        if desconocidas or not politicas:
+            abort(400, description=f"Políticas desconocidas: {desconocidas}")
+        
+        celdas = [(politica, quantum) for politica in politicas for quantum in quantums]
+        if len(celdas) > BARRIDO_MAX_CELDAS:
+            abort(400, description=f"El barrido excede el máximo de {BARRIDO_MAX_CELDAS} combinaciones")
+        
+        # Obtener procesos desde la app de escritorio
+        procesos = fetch_procesos_desktop()
+        selected_pids = datos.get('pids', [p['pid'] for p in procesos])
+        procesos_seleccionados = [p for p in procesos if p['pid'] in selected_pids]
+        if not procesos_seleccionados:
+            abort(400, description="No se seleccionó ningún proceso válido")
+        
+        # Unos cuatro lotes por trabajador para repartir bien la carga
+        tam_lote = -(-len(celdas) // (4 * BARRIDO_WORKERS))
+        pool = obtener_pool_barrido()
+        try:
+            futuros = [pool.submit(evaluar_lote, procesos_seleccionados, celdas[i:i + tam_lote])
+                       for i in range(0, len(celdas), tam_lote)]
+            resultados = [celda for futuro in futuros for celda in futuro.result()]
+        except BrokenProcessPool:
+            descartar_pool_barrido(pool)
+            raise
+        
+        barrido_id = guardar_barrido_bd([p['pid'] for p in procesos_seleccionados], resultados)
+        return jsonify({'barrido_id': barrido_id, **matriz_barrido(resultados)}), 201
+        
+    except DesktopConnectionError as e:
+        return jsonify({'error': str(e)}), 503
+    except DesktopTimeoutError as e:
+        return jsonify({'error': str(e)}), 504
+    except DesktopResponseError as e:
+        return jsonify({'error': str(e)}), 502
+    except (KeyError, TypeError, ValueError) as e:
+        return jsonify({'error': f"Parámetros inválidos: {str(e)}"}), 400
+
+@app.route('/api/barrido/<int:barrido_id>', methods=['GET'])
+def obtener_barrido(barrido_id):
+    """
+    Obtiene un barrido guardado como matrices de tiempos medios.
+    
+    Args:
+        barrido_id (int): ID del barrido
+    
+    Returns:
+        JSON: Matrices política × quantum o mensaje de error
+    """
+    celdas = cargar_barrido_bd(barrido_id)
+    if not celdas:
+        return jsonify({'error': 'Barrido no encontrado'}), 404
+    return jsonify({'barrido_id': barrido_id, **matriz_barrido(celdas)})
+
 @app.route('/api/simular/<int:sim_id>', methods=['GET'])
 def estado_simulacion(sim_id):
     """
@@ -319,12 +778,16 @@ def pausar_simulacion(sim_id):
         sim_id (int): ID de la simulación
     
     Returns:
-        JSON: Mensaje de confirmación o error
+        JSON: Mensaje de confirmación o error (409 si la simulación no
+            tiene evento de pausa, como las de tiempo virtual)
     """
     with simulaciones_lock:
         sim = simulaciones.get(sim_id)
         if not sim:
             return jsonify({'error': 'Simulación no encontrada'}), 404
+        if 'pausa_event' not in sim:
+            # Las simulaciones en tiempo virtual terminan sin poder pausarse
+            return jsonify({'error': 'La simulación no se puede pausar'}), 409
         sim['pausa_event'].clear()
         sim['estado'] = 'pausada'
     return jsonify({'mensaje': 'Simulación pausada'})
@@ -338,12 +801,15 @@ def reiniciar_simulacion(sim_id):
         sim_id (int): ID de la simulación
     
     Returns:
-        JSON: Mensaje de confirmación o error
+        JSON: Mensaje de confirmación o error (409 si la simulación no
+            tiene evento de pausa)
     """
     with simulaciones_lock:
         sim = simulaciones.get(sim_id)
         if not sim:
             return jsonify({'error': 'Simulación no encontrada'}), 404
+        if 'pausa_event' not in sim:
+            return jsonify({'error': 'La simulación no se puede reanudar'}), 409
         sim['pausa_event'].set()
         sim['estado'] = 'ejecutando'
     return jsonify({'mensaje': 'Simulación reanudada'})
@@ -391,4 +857,7 @@ def handle_http_error(error):
     }), error.code
 
 if __name__ == '__main__':
-    app.run(host=FLASK_HOST, port=FLASK_PORT, debug=FLASK_DEBUG) 
\ No newline at end of file
+    # Con el recargador de Flask, solo el proceso hijo atiende peticiones
+    if not FLASK_DEBUG or is_running_from_reloader():
+        iniciar_servicios()
+    app.run(host=FLASK_HOST, port=FLASK_PORT, debug=FLASK_DEBUG)
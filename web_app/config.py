@@ -22,6 +22,13 @@ Tiempo máximo de espera (en segundos) para las peticiones a la API de escritori
 Por defecto: 2.0 segundos
 """
 
+DESKTOP_API_DELTAS = os.getenv("DESKTOP_API_DELTAS", "True").lower() == "true"
+"""
+Mantener una copia local de los procesos de la aplicación de escritorio y
+pedir solo los cambios (/procesos?since=N) en lugar de la lista completa.
+Por defecto: True
+"""
+
 # Configuración de la base de datos
 DB_PATH = os.getenv("DB_PATH", "simulaciones.db")
 """
@@ -46,4 +53,45 @@ FLASK_DEBUG = os.getenv("FLASK_DEBUG", "True").lower() == "true"
 """
 Modo debug de Flask.
 Por defecto: True
-""" 
\ No newline at end of file
+""" 
+
+# Configuración de barridos de parámetros
+BARRIDO_MAX_WORKERS = int(os.getenv("BARRIDO_MAX_WORKERS", "0")) or None
+"""
+Número máximo de procesos hijos para evaluar un barrido.
+Por defecto: 0 (uno por CPU disponible)
+"""
+
+BARRIDO_MAX_CELDAS = int(os.getenv("BARRIDO_MAX_CELDAS", "1000"))
+"""
+Número máximo de combinaciones (política, quantum) por barrido.
+Por defecto: 1000
+"""
+
+
+# Configuración de simulaciones en tiempo real
+SIMULACION_EJECUTOR = os.getenv("SIMULACION_EJECUTOR", "asyncio")
+"""
+Cómo se ejecutan las simulaciones con TH: 'asyncio' (corrutinas en un único
+bucle de eventos) o 'hilos' (un hilo por simulación).
+Por defecto: asyncio
+"""
+
+SIMULACION_MAX_CONCURRENTES = int(os.getenv("SIMULACION_MAX_CONCURRENTES", "5000"))
+"""
+Número máximo de simulaciones asíncronas avanzando a la vez; el resto espera turno.
+Por defecto: 5000
+"""
+
+PUNTO_CONTROL_INTERVALO = float(os.getenv("PUNTO_CONTROL_INTERVALO", "5"))
+"""
+Segundos entre puntos de control de las simulaciones asíncronas (0 los desactiva).
+Por defecto: 5 segundos
+"""
+
+PUNTO_CONTROL_MAX_POR_CICLO = int(os.getenv("PUNTO_CONTROL_MAX_POR_CICLO", "200"))
+"""
+Número máximo de instantáneas guardadas en cada punto de control; el resto
+se guarda en los ciclos siguientes.
+Por defecto: 200
+"""
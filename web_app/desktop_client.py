@@ -1,20 +1,30 @@
 """
 Cliente para comunicación con la aplicación de escritorio.
 Este módulo proporciona la funcionalidad para obtener la lista de procesos
-desde la aplicación de escritorio mediante una API REST que devuelve XML.
+desde la aplicación de escritorio mediante una API REST que devuelve XML,
+JSON o un formato binario compacto según la cabecera Accept.
 
 Características:
 - Comunicación HTTP con la aplicación de escritorio
-- Parsing de respuestas XML
+- Negociación de contenido: se pide primero el formato más barato de
+  decodificar (binario, luego JSON y por último XML)
+- Parsing de respuestas XML, JSON y binarias
 - Manejo de errores de conexión y timeout
 - Conversión de datos XML a formato de procesos
+- Peticiones condicionales (If-None-Match): si la lista no cambió, la
+  aplicación de escritorio responde 304 y se reutiliza la última lista
+- Sincronización incremental: se mantiene una copia local de los procesos
+  y solo se piden los cambios desde la última versión (?since=N); si el
+  servidor no lo admite se vuelve a la descarga completa
 """
 
+import threading
 import requests
 import xml.etree.ElementTree as ET
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from flask import current_app
-from config import DESKTOP_API_URL, DESKTOP_API_TIMEOUT
+from config import DESKTOP_API_URL, DESKTOP_API_TIMEOUT, DESKTOP_API_DELTAS
+from models.formato_procesos import DECODIFICADORES, PREFERENCIA, TIPO_JSON, TIPO_XML
 
 class DesktopClientError(Exception):
     """
@@ -44,15 +54,192 @@ class DesktopResponseError(DesktopClientError):
     """
     pass
 
+# (ETag, procesos) de la última respuesta completa de la aplicación de escritorio
+_cache_procesos: Optional[Tuple[str, List[Dict]]] = None
+_cache_lock = threading.Lock()
+
+# Campos que usa _parsear_datos: la copia local solo pide estos (?fields=)
+_CAMPOS_SIMULADOR = ('pid', 'nombre', 'usuario', 'descripcion', 'prioridad')
+
+# Cabecera Accept: los formatos en orden de preferencia, con q decreciente
+_ACCEPT = ", ".join(f"{tipo};q={1 - i / 10:.1f}" for i, tipo in enumerate(PREFERENCIA))
+
+def _nuevo_proceso(pid: int, nombre: str, usuario: str, descripcion: str, prioridad: int) -> Dict:
+    """Crea el diccionario de proceso que usa el simulador, listo para ejecutar."""
+    return {
+        'pid': pid,
+        'nombre': nombre,
+        'usuario': usuario,
+        'descripcion': descripcion,
+        'prioridad': prioridad,
+        't_llegada': 0,
+        'rafaga_total': len(descripcion),
+        'rafaga_restante': len(descripcion),
+        't_final': None,
+        'turnaround': None,
+        'estado': 'Listo',
+        'historial': []
+    }
+
+def _parsear_xml(contenido: bytes) -> List[Dict]:
+    """
+    Convierte una respuesta XML en procesos del simulador.
+    
+    Raises:
+        ET.ParseError: Si el XML no es válido
+    """
+    root = ET.fromstring(contenido)
+    procesos = []
+    
+    # Procesar cada elemento proceso en el XML
+    for proc_elem in root.findall('proceso'):
+        try:
+            # Convertir datos XML a diccionario de proceso
+            procesos.append(_nuevo_proceso(
+                int(proc_elem.find('pid').text),
+                proc_elem.find('nombre').text,
+                proc_elem.find('usuario').text,
+                proc_elem.find('descripcion').text,
+                int(proc_elem.find('prioridad').text)
+            ))
+        except (AttributeError, ValueError, TypeError) as e:
+            # Registrar error y continuar con siguiente proceso
+            current_app.logger.error(f"Error al procesar proceso: {e}")
+            continue
+    return procesos
+
+def _parsear_datos(datos: List[Dict]) -> List[Dict]:
+    """Convierte procesos ya decodificados (JSON o binario) en procesos del simulador."""
+    procesos = []
+    for proc in datos:
+        try:
+            procesos.append(_nuevo_proceso(
+                int(proc['pid']),
+                proc['nombre'],
+                proc['usuario'],
+                proc['descripcion'],
+                int(proc['prioridad'])
+            ))
+        except (KeyError, ValueError, TypeError) as e:
+            current_app.logger.error(f"Error al procesar proceso: {e}")
+            continue
+    return procesos
+
+def _copiar_procesos(procesos: List[Dict]) -> List[Dict]:
+    """Copia los procesos en caché para que el llamador pueda modificarlos."""
+    return [dict(p, historial=list(p['historial'])) for p in procesos]
+
+class EspejoProcesos:
+    """
+    Copia local de los procesos publicados por la aplicación de escritorio.
+    
+    Se actualiza con los cambios que devuelve /procesos?since=N: procesos
+    insertados, campos actualizados y PIDs eliminados desde la versión
+    que ya se tiene. Si la versión ya no está en el registro del servidor
+    (o el servidor se reinició) el servidor envía la lista completa.
+    
+    Attributes:
+        instancia (Optional[str]): Ejecución del servidor de la copia
+        version (Optional[int]): Versión del servidor de la copia
+    """
+    
+    def __init__(self):
+        self.instancia: Optional[str] = None
+        self.version: Optional[int] = None
+        self._procesos: Dict[int, Dict] = {}
+        self._lock = threading.Lock()
+        
+    def aplicar(self, respuesta: Dict, desde: Optional[int]) -> bool:
+        """
+        Aplica una respuesta de /procesos?since=N a la copia.
+        
+        Args:
+            respuesta (Dict): Respuesta JSON del servidor
+            desde (Optional[int]): Versión con la que se hizo la petición
+            
+        Returns:
+            bool: False si la respuesta se descartó por estar desfasada
+                (otra petición ya avanzó la copia)
+                
+        Raises:
+            KeyError, TypeError: Si la respuesta no tiene el formato esperado
+        """
+        with self._lock:
+            if respuesta['completo']:
+                misma_instancia = respuesta['instancia'] == self.instancia
+                if misma_instancia and self.version is not None and respuesta['version'] < self.version:
+                    return False
+                self._procesos = {proc['pid']: proc for proc in respuesta['procesos']}
+            else:
+                if self.version != desde or respuesta['instancia'] != self.instancia:
+                    return False
+                for proc in respuesta['insertados']:
+                    self._procesos[proc['pid']] = proc
+                for cambio in respuesta['actualizados']:
+                    proc = self._procesos.get(cambio['pid'])
+                    if proc is not None:
+                        self._procesos[cambio['pid']] = dict(proc, **cambio['campos'])
+                for pid in respuesta['eliminados']:
+                    self._procesos.pop(pid, None)
+            self.instancia = respuesta['instancia']
+            self.version = respuesta['version']
+            return True
+            
+    def procesos(self) -> List[Dict]:
+        """Devuelve los procesos de la copia, en el orden en que se recibieron."""
+        with self._lock:
+            return list(self._procesos.values())
+            
+    def sincronizar(self) -> Optional[List[Dict]]:
+        """
+        Pide al servidor los cambios desde la versión local y los aplica.
+        
+        Returns:
+            Optional[List[Dict]]: Procesos tal como los publica el servidor
+                (solo los campos de _CAMPOS_SIMULADOR), o None si el
+                servidor no admite la sincronización incremental
+                
+        Raises:
+            requests.exceptions.RequestException: Si la petición falla
+        """
+        with self._lock:
+            desde, instancia = self.version, self.instancia
+        parametros = {'since': -1 if desde is None else desde, 'fields': ','.join(_CAMPOS_SIMULADOR)}
+        if instancia is not None:
+            parametros['instancia'] = instancia
+        response = requests.get(
+            DESKTOP_API_URL,
+            params=parametros,
+            headers={'Accept': TIPO_JSON},
+            timeout=DESKTOP_API_TIMEOUT
+        )
+        response.raise_for_status()
+        # Un servidor sin registro de cambios ignora ?since y envía la lista
+        try:
+            respuesta = response.json()
+            self.aplicar(respuesta, desde)
+        except (ValueError, KeyError, TypeError, AttributeError):
+            return None
+        return self.procesos()
+
+_espejo = EspejoProcesos()
+
 def fetch_procesos_desktop() -> List[Dict]:
     """
     Obtiene los procesos desde la aplicación de escritorio.
     
     Esta función realiza una petición HTTP GET a la API de la aplicación
-    de escritorio, parsea la respuesta XML y convierte cada proceso
-    al formato requerido por el simulador.
+    de escritorio, parsea la respuesta (binaria, JSON o XML, según la
+    negociación) y convierte cada proceso al formato requerido por el
+    simulador. La petición envía el ETag de la
+    última respuesta; si la lista no cambió (304) se devuelve una copia de
+    la lista ya parseada.
+    
+    Si DESKTOP_API_DELTAS está activo se usa antes la copia local
+    (EspejoProcesos), que solo descarga los cambios desde la última
+    petición; la petición completa queda para servidores que no la admiten.
     
-    La respuesta XML debe tener el siguiente formato:
+    La respuesta XML (formato por defecto) debe tener el siguiente formato:
     <procesos>
         <proceso>
             <pid>123</pid>
@@ -85,46 +272,49 @@ def fetch_procesos_desktop() -> List[Dict]:
         DesktopTimeoutError: Si la conexión excede el tiempo máximo de espera
         DesktopResponseError: Si la respuesta no es válida o no contiene procesos
     """
+    global _cache_procesos
     try:
-        # Realizar petición HTTP GET a la API
+        if DESKTOP_API_DELTAS:
+            datos = _espejo.sincronizar()
+            if datos is not None:
+                procesos = _parsear_datos(datos)
+                if not procesos:
+                    raise DesktopResponseError("No se encontraron procesos válidos")
+                return procesos
+                
+        # Realizar petición HTTP GET a la API (condicional si hay caché)
+        cache = _cache_procesos
+        cabeceras = {'Accept': _ACCEPT}
+        if cache:
+            cabeceras['If-None-Match'] = cache[0]
         response = requests.get(
             DESKTOP_API_URL,
+            headers=cabeceras,
             timeout=DESKTOP_API_TIMEOUT
         )
+        if response.status_code == 304 and cache:
+            return _copiar_procesos(cache[1])
         response.raise_for_status()
         
-        # Parsear respuesta XML
-        root = ET.fromstring(response.content)
-        procesos = []
-        
-        # Procesar cada elemento proceso en el XML
-        for proc_elem in root.findall('proceso'):
+        # Parsear la respuesta según el formato que eligió el servidor
+        tipo = response.headers.get('Content-Type', TIPO_XML).split(';')[0].strip()
+        decodificar = DECODIFICADORES.get(tipo)
+        if decodificar is None:
+            procesos = _parsear_xml(response.content)
+        else:
             try:
-                # Convertir datos XML a diccionario de proceso
-                proceso = {
-                    'pid': int(proc_elem.find('pid').text),
-                    'nombre': proc_elem.find('nombre').text,
-                    'usuario': proc_elem.find('usuario').text,
-                    'descripcion': proc_elem.find('descripcion').text,
-                    'prioridad': int(proc_elem.find('prioridad').text),
-                    't_llegada': 0,
-                    'rafaga_total': len(proc_elem.find('descripcion').text),
-                    'rafaga_restante': len(proc_elem.find('descripcion').text),
-                    't_final': None,
-                    'turnaround': None,
-                    'estado': 'Listo',
-                    'historial': []
-                }
-                procesos.append(proceso)
-            except (AttributeError, ValueError) as e:
-                # Registrar error y continuar con siguiente proceso
-                current_app.logger.error(f"Error al procesar proceso: {e}")
-                continue
+                procesos = _parsear_datos(decodificar(response.content))
+            except ValueError as e:
+                current_app.logger.error(f"Error al decodificar {tipo}: {e}")
+                raise DesktopResponseError(f"Respuesta {tipo} inválida")
                 
         # Verificar que se encontraron procesos válidos
         if not procesos:
             raise DesktopResponseError("No se encontraron procesos válidos")
             
+        etag = response.headers.get('ETag')
+        with _cache_lock:
+            _cache_procesos = (etag, _copiar_procesos(procesos)) if etag else None
         return procesos
         
     except requests.exceptions.Timeout:
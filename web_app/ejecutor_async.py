@@ -0,0 +1,227 @@
+"""
+Ejecutor asíncrono de simulaciones con ritmo TH.
+Este módulo ejecuta las simulaciones en tiempo real como corrutinas sobre
+un único bucle de eventos asyncio que vive en un hilo dedicado, en lugar de
+crear un hilo del sistema operativo por simulación.
+
+Características:
+- Un solo hilo para todas las simulaciones en curso
+- Mismas reglas de planificación que simular_round_robin (EstadoPlanificacion)
+- Pausa y reanudación mediante asyncio.Event, controlables desde Flask
+- Límite de simulaciones concurrentes con asyncio.Semaphore; las que
+  excedan el límite esperan su turno
+- El guardado de resultados se hace fuera del bucle de eventos
+- Puntos de control periódicos: cada ciclo guarda como mucho un número fijo
+  de instantáneas, empezando por las que llevan más tiempo pendientes
+- Los objetos de asyncio (eventos, semáforo) se crean dentro del bucle,
+  como exige Python 3.8/3.9, y los errores de las corrutinas se registran
+  en el log en lugar de perderse en un futuro que nadie consulta
+- Una simulación que falla avisa con al_fallar, para que no quede como
+  'ejecutando' (ni se reanude en cada arranque)
+"""
+
+import asyncio
+import concurrent.futures
+import logging
+import threading
+from typing import Callable, Dict, Hashable, List, Optional, Tuple
+
+from simulacion_virtual import EstadoPlanificacion
+
+logger = logging.getLogger(__name__)
+
+
+class EventoPausa:
+    """
+    asyncio.Event controlable desde otros hilos.
+
+    Expone set/clear/is_set como threading.Event, de modo que las rutas de
+    pausa y reanudación no distinguen entre simulaciones con hilos y
+    simulaciones asíncronas.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop):
+        """
+        Crea el evento activo (simulación sin pausar).
+
+        Debe llamarse desde el hilo del bucle (ver
+        EjecutorAsincrono.crear_evento_pausa): antes de Python 3.10,
+        asyncio.Event se liga al bucle del hilo que lo crea.
+
+        Args:
+            loop (AbstractEventLoop): Bucle que espera el evento
+        """
+        self._loop = loop
+        self._evento = asyncio.Event()
+        self._evento.set()
+
+    def set(self):
+        """Reanuda la simulación."""
+        self._loop.call_soon_threadsafe(self._evento.set)
+
+    def clear(self):
+        """Pausa la simulación."""
+        self._loop.call_soon_threadsafe(self._evento.clear)
+
+    def is_set(self) -> bool:
+        """Indica si la simulación no está pausada."""
+        return self._evento.is_set()
+
+    async def wait(self):
+        """Espera (sin bloquear el bucle) hasta que no haya pausa."""
+        await self._evento.wait()
+
+
+class EjecutorAsincrono:
+    """
+    Bucle de eventos dedicado que ejecuta simulaciones como corrutinas.
+
+    Attributes:
+        max_concurrentes (int): Simulaciones que pueden avanzar a la vez
+        loop (AbstractEventLoop): Bucle de eventos del hilo dedicado
+    """
+
+    def __init__(self, max_concurrentes: int):
+        """
+        Crea el bucle de eventos y arranca su hilo.
+
+        Args:
+            max_concurrentes (int): Límite de simulaciones concurrentes
+
+        Raises:
+            ValueError: Si el límite no es positivo
+        """
+        if max_concurrentes <= 0:
+            raise ValueError("El límite de simulaciones concurrentes debe ser mayor que cero")
+        self.max_concurrentes = max_concurrentes
+        self.loop = asyncio.new_event_loop()
+        # Simulaciones en curso y las que cambiaron desde su último punto de
+        # control (dict como conjunto ordenado: las más antiguas primero)
+        self._en_curso: Dict[Hashable, Tuple[EstadoPlanificacion, EventoPausa]] = {}
+        self._pendientes: Dict[Hashable, None] = {}
+        threading.Thread(target=self.loop.run_forever, daemon=True).start()
+        self._semaforo = self._en_bucle(asyncio.Semaphore, max_concurrentes)
+
+    def _en_bucle(self, funcion: Callable, *args):
+        """
+        Ejecuta una función en el hilo del bucle y espera su resultado.
+
+        Args:
+            funcion (Callable): Función a ejecutar (p. ej. un constructor de asyncio)
+            *args: Argumentos de la función
+
+        Returns:
+            Any: Resultado de la función
+        """
+        async def _llamar():
+            return funcion(*args)
+        return asyncio.run_coroutine_threadsafe(_llamar(), self.loop).result()
+
+    @staticmethod
+    def _registrar_error(descripcion: str, futuro: concurrent.futures.Future):
+        """
+        Registra en el log la excepción de una corrutina terminada.
+
+        Args:
+            descripcion (str): Qué ejecutaba la corrutina
+            futuro (Future): Futuro de la corrutina
+        """
+        if futuro.cancelled():
+            return
+        error = futuro.exception()
+        if error is not None:
+            logger.error("%s terminó con un error", descripcion, exc_info=error)
+
+    def crear_evento_pausa(self) -> EventoPausa:
+        """
+        Crea un evento de pausa ligado al bucle del ejecutor.
+
+        El evento se construye en el hilo del bucle.
+
+        Returns:
+            EventoPausa: Evento inicialmente activo (simulación sin pausar)
+        """
+        return self._en_bucle(EventoPausa, self.loop)
+
+    def lanzar(self, clave: Hashable, estado: EstadoPlanificacion, th: int,
+               pausa_event: EventoPausa,
+               al_terminar: Callable[[List[Dict]], None],
+               al_fallar: Optional[Callable[[Exception], None]] = None):
+        """
+        Programa una simulación en el bucle de eventos.
+
+        Args:
+            clave (Hashable): Identificador de la simulación (para los puntos de control)
+            estado (EstadoPlanificacion): Estado inicial o restaurado
+            th (int): Tiempo de espera por unidad de ráfaga (ms)
+            pausa_event (EventoPausa): Evento de pausa de la simulación
+            al_terminar (Callable): Se llama con los procesos terminados;
+                se ejecuta en un hilo del ejecutor por defecto del bucle
+            al_fallar (Optional[Callable]): Se llama con la excepción si la
+                simulación falla (en lugar de al_terminar), también en un
+                hilo del ejecutor por defecto
+
+        Returns:
+            concurrent.futures.Future: Futuro de la corrutina; si falla, la
+                excepción se registra en el log
+        """
+        corrutina = self._simular(clave, estado, th, pausa_event, al_terminar, al_fallar)
+        futuro = asyncio.run_coroutine_threadsafe(corrutina, self.loop)
+        futuro.add_done_callback(lambda f: self._registrar_error(f"La simulación {clave}", f))
+        return futuro
+
+    async def _simular(self, clave, estado, th, pausa_event, al_terminar, al_fallar):
+        """Corrutina de una simulación: espera TH por unidad de cada porción."""
+        self._en_curso[clave] = (estado, pausa_event)
+        try:
+            try:
+                async with self._semaforo:
+                    for tiempo_ejecutado in estado.porciones():
+                        if not pausa_event.is_set():
+                            self._pendientes[clave] = None  # Guardar que quedó en pausa
+                            await pausa_event.wait()  # Esperar si la simulación está pausada
+                        await asyncio.sleep(tiempo_ejecutado * th / 1000)  # Simular tiempo de ejecución
+                        self._pendientes[clave] = None
+            finally:
+                # Antes de avisar: ningún punto de control posterior debe guardarla
+                self._en_curso.pop(clave, None)
+                self._pendientes.pop(clave, None)
+        except Exception as error:
+            # La cancelación al cerrar el servidor no cuenta como fallo: se
+            # reanuda desde su punto de control en el siguiente arranque
+            if al_fallar is not None:
+                await self.loop.run_in_executor(None, al_fallar, error)
+            raise
+        await self.loop.run_in_executor(None, al_terminar, estado.cola_terminados)
+
+    def iniciar_puntos_control(self, intervalo: float, max_por_ciclo: int,
+                               guardar: Callable[[List[Tuple[Hashable, bytes, bool]]], None]):
+        """
+        Arranca el guardado periódico de instantáneas.
+
+        Las instantáneas se toman en el hilo del bucle, donde todas las
+        simulaciones están suspendidas entre porciones, y se entregan a
+        `guardar` en un hilo aparte. Cada ciclo toma como mucho
+        `max_por_ciclo` instantáneas, por lo que su coste está acotado.
+
+        Args:
+            intervalo (float): Segundos entre ciclos
+            max_por_ciclo (int): Instantáneas máximas por ciclo
+            guardar (Callable): Recibe una lista de (clave, instantánea, pausada)
+        """
+        futuro = asyncio.run_coroutine_threadsafe(
+            self._puntos_control(intervalo, max_por_ciclo, guardar), self.loop
+        )
+        futuro.add_done_callback(lambda f: self._registrar_error("El guardado de puntos de control", f))
+
+    async def _puntos_control(self, intervalo, max_por_ciclo, guardar):
+        """Corrutina del guardado periódico de instantáneas."""
+        while True:
+            await asyncio.sleep(intervalo)
+            lote = []
+            for clave in list(self._pendientes)[:max_por_ciclo]:
+                del self._pendientes[clave]
+                estado, pausa_event = self._en_curso[clave]
+                lote.append((clave, estado.snapshot(), not pausa_event.is_set()))
+            if lote:
+                await self.loop.run_in_executor(None, guardar, lote)
@@ -0,0 +1,320 @@
+"""
+Simulación de planificación en tiempo virtual.
+Este módulo ejecuta la misma lógica que `simular_round_robin` pero sobre un
+reloj lógico, sin dormir entre quantums. Se usa cuando solo interesan los
+resultados finales (tabla de turnaround, historial) y no el ritmo en tiempo
+real marcado por TH.
+
+Características:
+- Mismas reglas de reencolado expulsivo/no expulsivo que la simulación pausada
+- Política de planificación intercambiable (models.politicas)
+- Sin llamadas a time.sleep: el coste depende solo del número de quantums
+- Funciones puras, sin dependencias de Flask ni de la base de datos
+- Evaluación de celdas (política, quantum) para barridos en procesos hijos
+- Instantáneas binarias del estado para reanudar simulaciones interrumpidas
+"""
+
+from operator import itemgetter
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from models.instantanea import EscritorInstantanea, LectorInstantanea, elemento
+from models.politicas import POLITICAS, PoliticaPlanificacion, crear_politica
+
+_TIPO_INSTANTANEA = b"WEB1"
+_ESTADOS = ("Listo", "Ejecución", "Terminado")
+# Marca de campo vacío (None) en las instantáneas
+_NULO = -1
+
+
+def crear_cola_listos(politica: str, quantum: int) -> PoliticaPlanificacion:
+    """
+    Crea la cola de listos de una política para procesos en forma de diccionario.
+
+    Args:
+        politica (str): Nombre de la política (ver models.politicas.POLITICAS)
+        quantum (int): Quantum base de la simulación
+
+    Returns:
+        PoliticaPlanificacion: Cola de listos vacía
+
+    Raises:
+        ValueError: Si la política no existe
+    """
+    return crear_politica(
+        politica,
+        clave_restante=itemgetter('rafaga_restante'),
+        clave_prioridad=itemgetter('prioridad'),
+        clave_id=itemgetter('pid'),
+        quantum=quantum
+    )
+
+
+class EstadoPlanificacion:
+    """
+    Estado de una simulación que avanza porción a porción.
+
+    Todo el estado (cola de listos, proceso en ejecución, terminados y reloj)
+    vive en atributos, no en variables locales, para poder guardarlo con
+    `snapshot` mientras `porciones` está suspendido y continuar después con
+    `restaurar`.
+
+    Attributes:
+        procesos (list): Procesos de la simulación (diccionarios)
+        quantum (int): Tiempo de quantum
+        politica (str): Nombre de la política de planificación
+        cola_listos (PoliticaPlanificacion): Cola de listos de la política
+        en_ejecucion (Optional[dict]): Proceso que tiene la CPU
+        cola_terminados (list): Procesos terminados en orden de finalización
+        tiempo_global (int): Reloj lógico de la simulación
+    """
+
+    def __init__(self, procesos: List[Dict], quantum: int, politica: str = 'round_robin'):
+        """
+        Prepara una simulación nueva con todos los procesos en la cola de listos.
+
+        Args:
+            procesos (list): Lista de procesos con el formato de fetch_procesos_desktop
+            quantum (int): Tiempo de quantum para cada proceso
+            politica (str): Política de planificación
+
+        Raises:
+            ValueError: Si el quantum no es positivo o la política no existe
+        """
+        if quantum <= 0:
+            raise ValueError("El quantum debe ser mayor que cero")
+        self.procesos = procesos
+        self.quantum = quantum
+        self.politica = politica
+        self.cola_listos = crear_cola_listos(politica, quantum)
+        for proceso in procesos:
+            self.cola_listos.agregar(proceso)
+        self.en_ejecucion: Optional[Dict] = None
+        self.cola_terminados: List[Dict] = []
+        self.tiempo_global = 0
+
+    def porciones(self) -> Iterator[int]:
+        """
+        Avanza la planificación porción a porción hasta terminar.
+
+        Antes de aplicar cada porción se entrega su duración, de modo que quien
+        itera puede esperar ese tiempo (con time.sleep o asyncio.sleep) o
+        ignorarlo para avanzar en tiempo virtual. Los diccionarios de proceso
+        se modifican en sitio (rafaga_restante, estado, historial, t_inicio,
+        t_final y turnaround).
+
+        Yields:
+            int: Duración de la porción que se va a ejecutar
+        """
+        cola_listos = self.cola_listos
+        while cola_listos or self.en_ejecucion:
+            # Asignar la CPU si no hay ningún proceso ejecutándose
+            if self.en_ejecucion is None:
+                self.en_ejecucion = cola_listos.siguiente()
+                self.en_ejecucion['estado'] = "Ejecución"
+                self.en_ejecucion.setdefault('t_inicio', self.tiempo_global)
+
+            proceso = self.en_ejecucion
+            porcion = cola_listos.porcion(proceso, self.quantum)
+            tiempo_ejecutado = min(porcion, proceso['rafaga_restante'])
+            yield tiempo_ejecutado
+            proceso['rafaga_restante'] -= tiempo_ejecutado
+            proceso['historial'].append(("Ejecución", tiempo_ejecutado))
+
+            if proceso['rafaga_restante'] <= 0:
+                proceso['estado'] = "Terminado"
+                proceso['t_final'] = self.tiempo_global + tiempo_ejecutado
+                proceso['turnaround'] = proceso['t_final'] - proceso['t_llegada']
+                self.cola_terminados.append(proceso)
+                cola_listos.olvidar(proceso)
+                self.en_ejecucion = None
+            elif proceso['prioridad'] == 0:
+                # Expulsivo: vuelve a la cola de listos según la política
+                proceso['estado'] = "Listo"
+                cola_listos.reencolar(proceso, tiempo_ejecutado)
+                self.en_ejecucion = None
+            # No expulsivo: conserva la CPU
+
+            self.tiempo_global += tiempo_ejecutado
+
+    def snapshot(self) -> bytes:
+        """
+        Guarda el estado completo en formato binario (models.instantanea).
+
+        Solo debe llamarse entre porciones, con `porciones` suspendido.
+
+        Returns:
+            bytes: Instantánea del estado
+        """
+        indice = {id(p): i for i, p in enumerate(self.procesos)}
+        escritor = EscritorInstantanea(_TIPO_INSTANTANEA)
+        escritor.cadena(self.politica)
+        escritor.enteros((self.quantum, self.tiempo_global, len(self.procesos)))
+
+        for p in self.procesos:
+            escritor.cadena(p['nombre'] or "")
+            escritor.cadena(p['usuario'] or "")
+            escritor.cadena(p.get('descripcion') or "")
+            escritor.enteros((
+                p['pid'], p['prioridad'], p['t_llegada'], p['rafaga_total'], p['rafaga_restante'],
+                _ESTADOS.index(p['estado']), p.get('t_inicio', _NULO),
+                _NULO if p['t_final'] is None else p['t_final'],
+                _NULO if p['turnaround'] is None else p['turnaround']
+            ))
+            escritor.enteros(duracion for _, duracion in p['historial'])
+
+        entradas = self.cola_listos.volcar()
+        escritor.enteros(indice[id(p)] for p, _ in entradas)
+        escritor.enteros(dato for _, dato in entradas)
+        en_ejecucion = self.en_ejecucion
+        escritor.enteros(() if en_ejecucion is None else
+                         (indice[id(en_ejecucion)], self.cola_listos.dato(en_ejecucion)))
+        escritor.enteros(indice[id(p)] for p in self.cola_terminados)
+        return escritor.obtener()
+
+    @classmethod
+    def restaurar(cls, datos: bytes) -> 'EstadoPlanificacion':
+        """
+        Reconstruye un estado guardado con `snapshot`.
+
+        Args:
+            datos (bytes): Instantánea del estado
+
+        Returns:
+            EstadoPlanificacion: Estado listo para continuar con `porciones`
+
+        Raises:
+            ValueError: Si los datos no son una instantánea válida
+        """
+        lector = LectorInstantanea(datos, _TIPO_INSTANTANEA)
+        politica = lector.cadena()
+        quantum, tiempo_global, n = lector.enteros()
+
+        procesos = []
+        for _ in range(n):
+            nombre, usuario, descripcion = lector.cadena(), lector.cadena(), lector.cadena()
+            (pid, prioridad, t_llegada, rafaga_total, rafaga_restante,
+             estado, t_inicio, t_final, turnaround) = lector.enteros()
+            proceso = {
+                'pid': pid, 'nombre': nombre, 'usuario': usuario, 'descripcion': descripcion,
+                'prioridad': prioridad, 't_llegada': t_llegada,
+                'rafaga_total': rafaga_total, 'rafaga_restante': rafaga_restante,
+                't_final': None if t_final == _NULO else t_final,
+                'turnaround': None if turnaround == _NULO else turnaround,
+                'estado': elemento(_ESTADOS, estado, 'estado'),
+                'historial': [("Ejecución", duracion) for duracion in lector.enteros()]
+            }
+            if t_inicio != _NULO:
+                proceso['t_inicio'] = t_inicio
+            procesos.append(proceso)
+
+        estado = cls([], quantum, politica)
+        estado.procesos = procesos
+        estado.tiempo_global = tiempo_global
+        estado.cola_listos.cargar([(procesos[i], d) for i, d in lector.pares(n, 'proceso')])
+        en_ejecucion = lector.enteros()
+        if en_ejecucion:
+            if len(en_ejecucion) != 2:
+                raise ValueError("Proceso en ejecución mal formado en la instantánea")
+            estado.en_ejecucion = elemento(procesos, en_ejecucion[0], 'proceso')
+            estado.cola_listos.recordar(estado.en_ejecucion, en_ejecucion[1])
+        estado.cola_terminados = [procesos[i] for i in lector.indices(n, 'proceso')]
+        if not lector.terminado():
+            raise ValueError("La instantánea tiene datos sobrantes")
+        return estado
+
+
+def ejecutar_planificacion_virtual(procesos: List[Dict], quantum: int,
+                                   politica: str = 'round_robin') -> List[Dict]:
+    """
+    Ejecuta la simulación sobre un reloj lógico hasta terminar todos los procesos.
+
+    Los diccionarios de proceso se modifican en sitio (rafaga_restante, estado,
+    historial, t_final y turnaround), igual que en la simulación con TH.
+    Además se registra t_inicio, el instante de la primera ejecución.
+
+    Args:
+        procesos (list): Lista de procesos con el formato de fetch_procesos_desktop
+        quantum (int): Tiempo de quantum para cada proceso
+        politica (str): Política de planificación (Round Robin por defecto)
+
+    Returns:
+        list: Procesos terminados en orden de finalización
+
+    Raises:
+        ValueError: Si el quantum no es positivo o la política no existe
+    """
+    estado = EstadoPlanificacion(procesos, quantum, politica)
+    for _ in estado.porciones():
+        pass
+    return estado.cola_terminados
+
+
+def copiar_procesos(procesos: List[Dict]) -> List[Dict]:
+    """
+    Crea copias limpias de los procesos para una nueva simulación.
+
+    Args:
+        procesos (list): Procesos con el formato de fetch_procesos_desktop
+
+    Returns:
+        list: Copias con la ráfaga restante, estado e historial reiniciados
+    """
+    copias = []
+    for proc in procesos:
+        copia = dict(proc, rafaga_restante=proc['rafaga_total'], estado='Listo',
+                     t_final=None, turnaround=None, historial=[])
+        copia.pop('t_inicio', None)
+        copias.append(copia)
+    return copias
+
+
+def resumir_metricas(terminados: List[Dict]) -> Dict[str, float]:
+    """
+    Calcula los tiempos medios de espera, respuesta y retorno.
+
+    Args:
+        terminados (list): Procesos terminados por una simulación virtual
+
+    Returns:
+        dict: tiempo_medio_espera, tiempo_medio_respuesta y tiempo_medio_retorno
+    """
+    n = len(terminados)
+    if n == 0:
+        return {'tiempo_medio_espera': 0.0, 'tiempo_medio_respuesta': 0.0, 'tiempo_medio_retorno': 0.0}
+    return {
+        'tiempo_medio_espera': sum(p['turnaround'] - p['rafaga_total'] for p in terminados) / n,
+        'tiempo_medio_respuesta': sum(p['t_inicio'] - p['t_llegada'] for p in terminados) / n,
+        'tiempo_medio_retorno': sum(p['turnaround'] for p in terminados) / n,
+    }
+
+
+def evaluar_celda(procesos: List[Dict], celda: Tuple[str, int]) -> Dict:
+    """
+    Simula en tiempo virtual una celda (política, quantum) del barrido.
+
+    Args:
+        procesos (list): Carga de trabajo del barrido (no se modifica)
+        celda (tuple): Nombre de la política y valor de quantum
+
+    Returns:
+        dict: Política, quantum y tiempos medios de la simulación
+    """
+    politica, quantum = celda
+    terminados = ejecutar_planificacion_virtual(copiar_procesos(procesos), quantum, politica)
+    return {'politica': politica, 'quantum': quantum, **resumir_metricas(terminados)}
+
+
+def evaluar_lote(procesos: List[Dict], celdas: List[Tuple[str, int]]) -> List[Dict]:
+    """
+    Evalúa varias celdas del barrido en un proceso hijo.
+
+    La carga de trabajo viaja una vez por lote y no una vez por celda.
+
+    Args:
+        procesos (list): Carga de trabajo del barrido
+        celdas (list): Celdas (política, quantum) del lote
+
+    Returns:
+        list: Resultado de evaluar_celda para cada celda, en el mismo orden
+    """
+    return [evaluar_celda(procesos, celda) for celda in celdas]